@@ -1,9 +1,11 @@
 """
 gRPC 服务器
 """
+import asyncio
 from concurrent import futures
 
 import grpc
+from google.protobuf.internal import api_implementation
 
 from app.config import get_settings
 from app.grpc_services.data_grpc_service import DataGrpcService
@@ -13,8 +15,8 @@ from app.utils.logger import configure_logging, logger
 from generated import data_pb2_grpc, health_pb2_grpc, trading_pb2_grpc
 
 
-def serve():
-    """启动 gRPC 服务器"""
+async def _serve():
+    """启动 asyncio gRPC 服务器"""
     settings = get_settings()
     
     # 初始化日志系统
@@ -33,9 +35,13 @@ def serve():
     grpc_port = getattr(settings, 'grpc_port', 50051)
     max_workers = getattr(settings, 'grpc_max_workers', 10)
     
-    # 创建服务器
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
+    # 创建服务器：数据、交易服务为 async 处理方法，阻塞的 xtquant 调用在 executor 中执行；
+    # 健康检查及行情订阅等同步处理方法在 migration_thread_pool 中运行。
+    # 订阅流会在整个推送期间占用线程，两者分开建池，避免长连接流耗尽线程后阻塞下单等一元调用
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='grpc-xtquant')
+    migration_pool = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='grpc-sync')
+    server = grpc.aio.server(
+        migration_thread_pool=migration_pool,
         options=[
             ('grpc.max_send_message_length', 50 * 1024 * 1024),  # 50MB
             ('grpc.max_receive_message_length', 50 * 1024 * 1024),  # 50MB
@@ -51,11 +57,11 @@ def serve():
     
     # 注册服务
     data_pb2_grpc.add_DataServiceServicer_to_server(
-        DataGrpcService(data_service), 
+        DataGrpcService(data_service, executor), 
         server
     )
     trading_pb2_grpc.add_TradingServiceServicer_to_server(
-        TradingGrpcService(trading_service), 
+        TradingGrpcService(trading_service, executor), 
         server
     )
     health_pb2_grpc.add_HealthServicer_to_server(
@@ -68,16 +74,26 @@ def serve():
     server.add_insecure_port(server_address)
     
     # 启动服务器
-    server.start()
-    logger.info(f"gRPC 服务已就绪 (工作线程: {max_workers})")
+    await server.start()
+    logger.info(f"gRPC 服务已就绪 (工作线程: {max_workers}, protobuf 后端: {api_implementation.Type()})")
     
     try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
+        await server.wait_for_termination()
+    finally:
         logger.info("gRPC 服务正在关闭...")
-        server.stop(grace=5)
+        await server.stop(grace=5)
+        executor.shutdown(wait=False)
+        migration_pool.shutdown(wait=False)
         logger.info("gRPC 服务已关闭")
 
 
+def serve():
+    """启动 gRPC 服务器"""
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == '__main__':
     serve()
@@ -1,12 +1,25 @@
 """
 gRPC 数据服务实现
 """
-from typing import Any
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, Optional, Tuple
 
 import grpc
 from google.protobuf import empty_pb2
+from google.protobuf.internal import api_implementation
 from pydantic import BaseModel
 
+from app.models.data_models import (
+    DATE_PATTERN,
+    DownloadFinancialDataBatchRequest,
+    DownloadFinancialDataRequest,
+    DownloadHistoryContractsRequest,
+    DownloadIndexWeightRequest,
+    DownloadTaskStatus,
+)
 from app.models.data_models import FinancialDataRequest as RestFinancialDataRequest
 from app.models.data_models import IndexWeightRequest as RestIndexWeightRequest
 from app.models.data_models import MarketDataRequest as RestMarketDataRequest
@@ -15,10 +28,182 @@ from app.models.data_models import PeriodType
 # 导入现有服务
 from app.services.data_service import DataService
 from app.utils.exceptions import DataServiceException
+from app.utils.logger import logger
 
 # 导入生成的 protobuf 代码
 from generated import common_pb2, data_pb2, data_pb2_grpc
 
+# 纯 Python 实现的 protobuf 逐字段赋值比 upb/cpp 后端慢数十倍
+if api_implementation.Type() == 'python':
+    logger.warning(
+        "protobuf 正在使用纯 Python 实现，gRPC 序列化性能会明显下降；"
+        "请安装官方 protobuf 轮子，且不要设置 PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python"
+    )
+
+# 成功状态（赋值给父消息字段时会被拷贝，可安全复用）
+_SUCCESS_STATUS = common_pb2.Status(code=0, message="success")
+
+# protobuf 周期类型 -> 内部周期类型
+_PERIOD_TYPE_MAP = {
+    common_pb2.PERIOD_TYPE_TICK: PeriodType.TICK,
+    common_pb2.PERIOD_TYPE_1M: PeriodType.MINUTE_1,
+    common_pb2.PERIOD_TYPE_5M: PeriodType.MINUTE_5,
+    common_pb2.PERIOD_TYPE_15M: PeriodType.MINUTE_15,
+    common_pb2.PERIOD_TYPE_30M: PeriodType.MINUTE_30,
+    common_pb2.PERIOD_TYPE_1H: PeriodType.HOUR_1,
+    common_pb2.PERIOD_TYPE_1D: PeriodType.DAILY,
+    common_pb2.PERIOD_TYPE_1W: PeriodType.WEEKLY,
+    common_pb2.PERIOD_TYPE_1MON: PeriodType.MONTHLY,
+    common_pb2.PERIOD_TYPE_1Q: PeriodType.QUARTER,
+    common_pb2.PERIOD_TYPE_1HY: PeriodType.YEAR_HALF,
+    common_pb2.PERIOD_TYPE_1Y: PeriodType.YEAR,
+}
+
+# 下载任务状态 -> protobuf 枚举值（服务层同时供 REST 使用，保留字符串枚举，在此一次转换）
+_DOWNLOAD_STATUS_MAP: Dict[DownloadTaskStatus, int] = {
+    DownloadTaskStatus.PENDING: data_pb2.DOWNLOAD_PENDING,
+    DownloadTaskStatus.RUNNING: data_pb2.DOWNLOAD_RUNNING,
+    DownloadTaskStatus.COMPLETED: data_pb2.DOWNLOAD_COMPLETED,
+    DownloadTaskStatus.FAILED: data_pb2.DOWNLOAD_FAILED
+}
+
+# ETF信息占位响应模板（GetETFInfo 复制后填充 etf_code/etf_name）
+_ETF_INFO_TEMPLATE = data_pb2.ETFInfoResponse(
+    underlying_asset="沪深300",
+    creation_unit=1000000,
+    redemption_unit=1000000,
+    status=_SUCCESS_STATUS
+)
+
+# 元数据响应缓存配置（容量按接口分别计算）
+_RESPONSE_CACHE_TTL = 3600  # 秒
+_RESPONSE_CACHE_MAXSIZE = 512
+
+# Level2 快照响应缓存秒数，吸收客户端的重试和多进程重复请求
+_L2_QUOTE_CACHE_TTL = 1
+
+# 错误详情最大长度：grpc-message 走 HTTP/2 头部，过长的异常文本会拖慢甚至撑爆头部
+_ERROR_MESSAGE_MAX_LEN = 256
+
+# SectorStream 操作字段 -> 板块操作实现方法（与一元板块接口共用，不带装饰器）
+_SECTOR_OPERATIONS = {
+    'create_sector_folder': '_create_sector_folder',
+    'create_sector': '_create_sector',
+    'add_sector': '_add_sector',
+    'remove_stock_from_sector': '_remove_stock_from_sector',
+    'remove_sector': '_remove_sector',
+    'reset_sector': '_reset_sector',
+}
+
+# L2 逐笔数据响应的压缩算法（按方法启用，其余接口保持不压缩）
+_L2_COMPRESSION = grpc.Compression.Gzip
+
+# L2 逐笔流式接口单条消息的最大行数
+_L2_STREAM_BATCH_SIZE = 10000
+
+# 相同下载请求完成后的结果复用窗口（秒），吸收客户端的高频重试/轮询
+_DOWNLOAD_RESPONSE_TTL = 0.2
+
+
+def _error_status(error: Exception, grpc_code: grpc.StatusCode) -> Tuple[grpc.StatusCode, str]:
+    """生成异常对应的 gRPC 状态码和错误详情"""
+    # DataServiceException 已携带字符串消息，无需再 str()
+    error_msg = error.message if isinstance(error, DataServiceException) else str(error)
+    # 检查是否为不支持的功能
+    if "function not realize" in error_msg or "未支持此功能" in error_msg:
+        grpc_code = grpc.StatusCode.UNIMPLEMENTED
+    if len(error_msg) > _ERROR_MESSAGE_MAX_LEN:
+        error_msg = error_msg[:_ERROR_MESSAGE_MAX_LEN] + '...'
+    return grpc_code, error_msg
+
+
+def grpc_error_handler(func):
+    """
+    统一处理 gRPC 一元方法的异常
+    
+    DataServiceException 映射为 INVALID_ARGUMENT，其余异常映射为 INTERNAL；
+    xtquant 不支持的功能映射为 UNIMPLEMENTED。状态非 OK 时客户端拿不到响应体，
+    因此直接 context.abort 结束调用，不再构造错误响应。
+    grpc.aio 的 context.abort 是协程，被装饰的处理方法必须为 async def
+    """
+    @functools.wraps(func)
+    async def wrapper(self, request, context):
+        try:
+            return await func(self, request, context)
+        except grpc.aio.AbortError:
+            # 处理方法已自行 abort（如 NOT_FOUND），不能再次 abort
+            raise
+        except DataServiceException as e:
+            await context.abort(*_error_status(e, grpc.StatusCode.INVALID_ARGUMENT))
+        except Exception as e:
+            await context.abort(*_error_status(e, grpc.StatusCode.INTERNAL))
+    return wrapper
+
+
+def cached_response(
+    key: Optional[Callable[[Any], Hashable]] = None,
+    ttl: Optional[float] = _RESPONSE_CACHE_TTL
+):
+    """
+    缓存幂等元数据接口构建好的响应消息（TTL 过期）
+    
+    只缓存正常返回的响应，异常交由外层 grpc_error_handler 处理
+    
+    Args:
+        key: 根据请求生成缓存键的函数，空请求可省略
+        ttl: 过期秒数，None 表示进程生命周期内不过期
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request, context):
+            cache_key = (func.__name__, key(request) if key else None)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = await func(self, request, context)
+            self._cache_put(cache_key, response, ttl)
+            return response
+        return wrapper
+    return decorator
+
+
+def shared_download(ttl: float = _DOWNLOAD_RESPONSE_TTL):
+    """
+    合并参数相同的下载请求
+    
+    同一下载正在执行时，后到的请求等待同一个任务而不再重复进入 data_service；
+    任务完成后 ttl 秒内的相同请求直接返回已构建的响应
+    
+    Args:
+        ttl: 完成结果的复用秒数
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request, context):
+            task_key = (func.__name__, request.SerializeToString(deterministic=True))
+            cached = self._cache_get(task_key)
+            if cached is not None:
+                return cached
+            
+            task = self._download_tasks.get(task_key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, request, context))
+                self._download_tasks[task_key] = task
+                
+                def on_done(finished: asyncio.Future):
+                    self._download_tasks.pop(task_key, None)
+                    # 同时标记异常已被读取，发起方取消后也不会告警
+                    if not finished.cancelled() and finished.exception() is None:
+                        self._cache_put(task_key, finished.result(), ttl)
+                
+                task.add_done_callback(on_done)
+            
+            # 某个调用方被取消时不影响仍在等待的其他调用方
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
+
 
 def pydantic_to_dict(obj: Any) -> Any:
     """将Pydantic对象转换为字典，如果不是Pydantic对象则直接返回"""
@@ -34,1313 +219,1152 @@ def pydantic_to_dict(obj: Any) -> Any:
 class DataGrpcService(data_pb2_grpc.DataServiceServicer):
     """gRPC 数据服务实现"""
     
-    def __init__(self, data_service: DataService):
+    def __init__(self, data_service: DataService, executor: Optional[Executor] = None):
         self.data_service = data_service
+        self._executor = executor
+        # 响应缓存按接口分开: 方法名 -> {请求键: (过期时间, 响应消息)}；
+        # 各接口 TTL 不同（L2 快照 1 秒、下载结果 0.2 秒、元数据 1 小时），
+        # 分开存放避免短 TTL 的大量条目挤掉长期有效的元数据
+        self._response_caches: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+        # 执行中的下载任务: (方法名, 序列化请求) -> 任务
+        self._download_tasks: Dict[Tuple[str, bytes], asyncio.Future] = {}
+    
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """在线程池中执行阻塞的 xtdata 调用，避免阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def _iterate(self, iterator: Iterator) -> AsyncIterator:
+        """
+        在线程池中逐项推进阻塞的同步迭代器
+        
+        客户端断开时 aio 会取消所在协程，迭代随之停止，无需轮询连接状态
+        """
+        sentinel = object()
+        while True:
+            item = await self._run(next, iterator, sentinel)
+            if item is sentinel:
+                return
+            yield item
+    
+    def _cache_get(self, cache_key: Tuple[str, Hashable]) -> Any:
+        """读取未过期的缓存响应，不存在或已过期时返回 None"""
+        method_name, request_key = cache_key
+        cached = self._response_caches.get(method_name, {}).get(request_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
     
-    def GetMarketData(
+    def _cache_put(self, cache_key: Tuple[str, Hashable], response: Any, ttl: Optional[float]):
+        """写入响应缓存，超出容量时先清除过期条目，仍不足再淘汰最早写入的条目"""
+        method_name, request_key = cache_key
+        cache = self._response_caches.setdefault(method_name, {})
+        now = time.monotonic()
+        if request_key not in cache and len(cache) >= _RESPONSE_CACHE_MAXSIZE:
+            for expired_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[expired_key]
+            if len(cache) >= _RESPONSE_CACHE_MAXSIZE:
+                cache.pop(next(iter(cache)))
+        cache[request_key] = (now + ttl if ttl is not None else float('inf'), response)
+    
+    def _invalidate_cache(self, *method_names: str):
+        """清除指定接口的缓存响应"""
+        for method_name in method_names:
+            self._response_caches.pop(method_name, None)
+    
+    @grpc_error_handler
+    async def GetMarketData(
         self, 
         request: data_pb2.MarketDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.MarketDataBatchResponse:
         """获取市场数据"""
+        # 转换 protobuf 请求为内部模型
+        rest_request = self._convert_market_data_request(request)
+        
+        # 调用现有服务
+        results = await self._run(self.data_service.get_market_data, rest_request)
+        
+        # 转换响应为 protobuf，直接在批量响应中构建
+        batch_response = data_pb2.MarketDataBatchResponse(status=_SUCCESS_STATUS)
+        for result in results:
+            self._convert_market_data_response(result, batch_response.data.add())
+        
+        return batch_response
+    
+    async def StreamMarketData(
+        self,
+        request: data_pb2.MarketDataRequest,
+        context: grpc.aio.ServicerContext
+    ):
+        """
+        流式获取市场数据（Server Streaming）
+        
+        每转换完一只股票立即推送，避免在内存中拼装整个批量响应
+        """
         try:
-            # 转换 protobuf 请求为内部模型
             rest_request = self._convert_market_data_request(request)
             
-            # 调用现有服务
-            results = self.data_service.get_market_data(rest_request)
-            
-            # 转换响应为 protobuf
-            pb_responses = []
-            for result in results:
-                bars = []
-                for item in result.data:
-                    bar = data_pb2.KlineBar(
-                        time=str(item.get('time', '')),
-                        open=float(item.get('open', 0.0)),
-                        high=float(item.get('high', 0.0)),
-                        low=float(item.get('low', 0.0)),
-                        close=float(item.get('close', 0.0)),
-                        volume=int(item.get('volume', 0)),
-                        amount=float(item.get('amount', 0.0))
-                    )
-                    bars.append(bar)
-                
-                pb_response = data_pb2.MarketDataResponse(
-                    stock_code=result.stock_code,
-                    bars=bars,
-                    fields=result.fields,
-                    period=result.period,
-                    start_date=result.start_date,
-                    end_date=result.end_date,
-                    status=common_pb2.Status(code=0, message="success")
-                )
-                pb_responses.append(pb_response)
-            
-            return data_pb2.MarketDataBatchResponse(
-                data=pb_responses,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
+            async for result in self._iterate(self.data_service.iter_market_data(rest_request)):
+                yield self._convert_market_data_response(result)
+        
         except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.MarketDataBatchResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
+            await context.abort(*_error_status(e, grpc.StatusCode.INVALID_ARGUMENT))
         except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.MarketDataBatchResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+            await context.abort(*_error_status(e, grpc.StatusCode.INTERNAL))
     
-    def GetFinancialData(
+    @grpc_error_handler
+    async def GetFinancialData(
         self, 
         request: data_pb2.FinancialDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.FinancialDataBatchResponse:
         """获取财务数据"""
-        try:
-            # 转换请求
-            rest_request = RestFinancialDataRequest(
-                stock_codes=list(request.stock_codes),
-                table_list=list(request.table_list),
-                start_date=request.start_date if request.start_date else None,
-                end_date=request.end_date if request.end_date else None
-            )
-            
-            # 调用服务
-            results = self.data_service.get_financial_data(rest_request)
-            
-            # 转换响应
-            pb_responses = []
-            for result in results:
-                rows = []
-                for row_data in result.data:
-                    # 将字典转换为 map<string, string>
-                    fields = {k: str(v) for k, v in row_data.items()}
-                    row = data_pb2.FinancialDataRow(fields=fields)
-                    rows.append(row)
-                
-                pb_response = data_pb2.FinancialDataResponse(
-                    stock_code=result.stock_code,
-                    table_name=result.table_name,
-                    rows=rows,
-                    columns=result.columns,
-                    status=common_pb2.Status(code=0, message="success")
-                )
-                pb_responses.append(pb_response)
-            
-            return data_pb2.FinancialDataBatchResponse(
-                data=pb_responses,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.FinancialDataBatchResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.FinancialDataBatchResponse(
-                status=common_pb2.Status(code=500, message=str(e))
+        # 转换请求
+        # 请求模型无校验器，跳过 pydantic 校验直接构造；
+        # 服务层只遍历股票/表列表，直接传入 protobuf 容器，不再拷贝为 list
+        rest_request = RestFinancialDataRequest.model_construct(
+            stock_codes=request.stock_codes,
+            table_list=request.table_list,
+            start_date=request.start_date if request.start_date else None,
+            end_date=request.end_date if request.end_date else None
+        )
+        
+        # 调用服务
+        results = await self._run(self.data_service.get_financial_data, rest_request, as_str=True)
+        
+        # 转换响应（字段值已在服务层按列转换为字符串），直接在批量响应中构建
+        batch_response = data_pb2.FinancialDataBatchResponse(status=_SUCCESS_STATUS)
+        for result in results:
+            pb_response = batch_response.data.add(
+                stock_code=result.stock_code,
+                table_name=result.table_name,
+                columns=result.columns
             )
+            rows = pb_response.rows
+            for row_data in result.data:
+                rows.add().fields.update(row_data)
+        
+        return batch_response
     
-    def GetSectorList(
+    @grpc_error_handler
+    @cached_response()
+    async def GetSectorList(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.SectorListResponse:
         """获取板块列表"""
-        try:
-            # 调用服务
-            results = self.data_service.get_sector_list()
-            
-            # 转换响应
-            sectors = []
-            for result in results:
-                sector = data_pb2.SectorInfo(
+        # 调用服务
+        results = await self._run(self.data_service.get_sector_list)
+        
+        # 转换响应（列表推导后由构造函数一次性批量写入）
+        return data_pb2.SectorListResponse(
+            sectors=[
+                data_pb2.SectorInfo(
                     sector_name=result.sector_name,
                     stock_list=result.stock_list,
                     sector_type=result.sector_type or ""
                 )
-                sectors.append(sector)
-            
-            return data_pb2.SectorListResponse(
-                sectors=sectors,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.SectorListResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.SectorListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+                for result in results
+            ],
+            status=_SUCCESS_STATUS
+        )
     
-    def GetIndexWeight(
+    @grpc_error_handler
+    async def GetIndexWeight(
         self, 
         request: data_pb2.IndexWeightRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.IndexWeightResponse:
         """获取指数权重"""
-        try:
-            # 转换请求
-            rest_request = RestIndexWeightRequest(
-                index_code=request.index_code,
-                date=request.date if request.date else None
-            )
-            
-            # 调用服务
-            result = self.data_service.get_index_weight(rest_request)
-            
-            # 转换响应
-            weights = []
-            for weight_data in result.weights:
-                weight = data_pb2.ComponentWeight(
+        # 转换请求
+        rest_request = RestIndexWeightRequest.model_construct(
+            index_code=request.index_code,
+            date=request.date if request.date else None
+        )
+        
+        # 调用服务
+        result = await self._run(self.data_service.get_index_weight, rest_request)
+        
+        # 转换响应（列表推导后由构造函数一次性批量写入）
+        return data_pb2.IndexWeightResponse(
+            index_code=result.index_code,
+            date=result.date,
+            weights=[
+                data_pb2.ComponentWeight(
                     stock_code=weight_data.get('stock_code', ''),
                     weight=float(weight_data.get('weight', 0.0)),
                     market_cap=float(weight_data.get('market_cap', 0.0))
                 )
-                weights.append(weight)
-            
-            return data_pb2.IndexWeightResponse(
-                index_code=result.index_code,
-                date=result.date,
-                weights=weights,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.IndexWeightResponse(
-                index_code=request.index_code,
-                date=request.date,
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.IndexWeightResponse(
-                index_code=request.index_code,
-                date=request.date,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+                for weight_data in result.weights
+            ],
+            status=_SUCCESS_STATUS
+        )
     
-    def GetTradingCalendar(
+    @grpc_error_handler
+    @cached_response(key=lambda request: request.year)
+    async def GetTradingCalendar(
         self, 
         request: data_pb2.TradingCalendarRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.TradingCalendarResponse:
         """获取交易日历"""
-        try:
-            # 调用服务
-            result = self.data_service.get_trading_calendar(request.year)
-            
-            return data_pb2.TradingCalendarResponse(
-                trading_dates=result.trading_dates,
-                holidays=result.holidays,
-                year=result.year,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.TradingCalendarResponse(
-                year=request.year,
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.TradingCalendarResponse(
-                year=request.year,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        result = await self._run(self.data_service.get_trading_calendar, request.year)
+        
+        return data_pb2.TradingCalendarResponse(
+            trading_dates=result.trading_dates,
+            holidays=result.holidays,
+            year=result.year,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetInstrumentInfo(
+    @grpc_error_handler
+    @cached_response(key=lambda request: request.stock_code)
+    async def GetInstrumentInfo(
         self, 
         request: data_pb2.InstrumentInfoRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.InstrumentInfoResponse:
         """获取合约信息"""
-        try:
-            # 调用服务
-            result = self.data_service.get_instrument_info(request.stock_code)
-            
-            return data_pb2.InstrumentInfoResponse(
-                instrument_code=result.instrument_code,
-                instrument_name=result.instrument_name,
-                market_type=result.market_type,
-                instrument_type=result.instrument_type,
-                list_date=result.list_date or "",
-                delist_date=result.delist_date or "",
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except DataServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return data_pb2.InstrumentInfoResponse(
-                instrument_code=request.stock_code,
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.InstrumentInfoResponse(
-                instrument_code=request.stock_code,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        result = await self._run(self.data_service.get_instrument_info, request.stock_code)
+        
+        return data_pb2.InstrumentInfoResponse(
+            instrument_code=result.instrument_code,
+            instrument_name=result.instrument_name,
+            market_type=result.market_type,
+            instrument_type=result.instrument_type,
+            list_date=result.list_date or "",
+            delist_date=result.delist_date or "",
+            status=_SUCCESS_STATUS
+        )
     
-    def GetETFInfo(
+    @grpc_error_handler
+    async def GetETFInfo(
         self, 
         request: data_pb2.ETFInfoRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.ETFInfoResponse:
         """获取ETF信息（占位实现）"""
-        try:
-            # 这是占位实现，返回模拟数据
-            return data_pb2.ETFInfoResponse(
-                etf_code=request.etf_code,
-                etf_name=f"ETF{request.etf_code}",
-                underlying_asset="沪深300",
-                creation_unit=1000000,
-                redemption_unit=1000000,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.ETFInfoResponse(
-                etf_code=request.etf_code,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 这是占位实现，在预构建的模板上只填充动态字段
+        response = data_pb2.ETFInfoResponse()
+        response.CopyFrom(_ETF_INFO_TEMPLATE)
+        response.etf_code = request.etf_code
+        response.etf_name = f"ETF{request.etf_code}"
+        return response
+    
+    def _convert_market_data_response(
+        self,
+        result,
+        pb_response: Optional[data_pb2.MarketDataResponse] = None
+    ) -> data_pb2.MarketDataResponse:
+        """转换单只股票的市场数据为 protobuf
+        
+        K线直接在父消息的 repeated 字段中原地构建（bars.add()），
+        避免先构造独立的 KlineBar 再整体拷贝进响应；
+        传入 pb_response（如批量响应的 data.add()）时直接填充该消息；
+        成功与否由外层响应/gRPC 状态码表示，逐股票的 status 不再填充
+        """
+        if pb_response is None:
+            pb_response = data_pb2.MarketDataResponse()
+        pb_response.stock_code = result.stock_code
+        pb_response.fields.extend(result.fields)
+        pb_response.period = result.period
+        pb_response.start_date = result.start_date
+        pb_response.end_date = result.end_date
+        bars = pb_response.bars
+        for item in result.data:
+            bar = bars.add()
+            bar.time = item.get('time', '')
+            bar.open = item.get('open', 0.0)
+            bar.high = item.get('high', 0.0)
+            bar.low = item.get('low', 0.0)
+            bar.close = item.get('close', 0.0)
+            bar.volume = item.get('volume', 0)
+            bar.amount = item.get('amount', 0.0)
+        
+        return pb_response
+    
+    def _fill_kline_map(self, pb_response, results, columnar: bool = False):
+        """将 List[MarketDataResponse] 填充到响应的 data（逐根 KlineBar）或 columnar_data（列式）字段"""
+        for market_data_response in results:
+            stock_code = market_data_response.stock_code
+            # market_data_response.data 是 List[Dict[str, Any]]
+            items = market_data_response.data
+            if columnar:
+                # 每列一次 extend，避免逐根构造消息
+                columns = pb_response.columnar_data[stock_code]
+                columns.time.extend([item.get('time', '') for item in items])
+                columns.open.extend([item.get('open', 0.0) for item in items])
+                columns.high.extend([item.get('high', 0.0) for item in items])
+                columns.low.extend([item.get('low', 0.0) for item in items])
+                columns.close.extend([item.get('close', 0.0) for item in items])
+                columns.volume.extend([item.get('volume', 0) for item in items])
+                columns.amount.extend([item.get('amount', 0.0) for item in items])
+            else:
+                bars = pb_response.data[stock_code].bars
+                for item in items:
+                    bar = bars.add()
+                    bar.time = item.get('time', '')
+                    bar.open = item.get('open', 0.0)
+                    bar.high = item.get('high', 0.0)
+                    bar.low = item.get('low', 0.0)
+                    bar.close = item.get('close', 0.0)
+                    bar.volume = item.get('volume', 0)
+                    bar.amount = item.get('amount', 0.0)
     
     def _convert_market_data_request(self, pb_request: data_pb2.MarketDataRequest) -> RestMarketDataRequest:
-        """转换 protobuf 请求为内部模型"""
-        # 周期类型映射
-        period_map = {
-            common_pb2.PERIOD_TYPE_TICK: PeriodType.TICK,
-            common_pb2.PERIOD_TYPE_1M: PeriodType.MINUTE_1,
-            common_pb2.PERIOD_TYPE_5M: PeriodType.MINUTE_5,
-            common_pb2.PERIOD_TYPE_15M: PeriodType.MINUTE_15,
-            common_pb2.PERIOD_TYPE_30M: PeriodType.MINUTE_30,
-            common_pb2.PERIOD_TYPE_1H: PeriodType.HOUR_1,
-            common_pb2.PERIOD_TYPE_1D: PeriodType.DAILY,
-            common_pb2.PERIOD_TYPE_1W: PeriodType.WEEKLY,
-            common_pb2.PERIOD_TYPE_1MON: PeriodType.MONTHLY,
-            common_pb2.PERIOD_TYPE_1Q: PeriodType.QUARTER,
-            common_pb2.PERIOD_TYPE_1HY: PeriodType.YEAR_HALF,
-            common_pb2.PERIOD_TYPE_1Y: PeriodType.YEAR,
-        }
-        
-        return RestMarketDataRequest(
-            stock_codes=list(pb_request.stock_codes),
+        """转换 protobuf 请求为内部模型
+        
+        protobuf 已保证字段类型，使用 model_construct 跳过 pydantic 校验；
+        DataRequest 中的股票代码校验在此处直接完成，日期复用 DateStr 的 DATE_PATTERN 校验
+        """
+        if not pb_request.stock_codes:
+            raise DataServiceException('股票代码列表不能为空')
+        for date in (pb_request.start_date, pb_request.end_date):
+            if not DATE_PATTERN.fullmatch(date):
+                raise DataServiceException('日期格式必须为YYYYMMDD 或 YYYYMMDDHHMMSS')
+        
+        # 服务层只遍历 stock_codes，直接传入 protobuf 容器
+        return RestMarketDataRequest.model_construct(
+            stock_codes=pb_request.stock_codes,
             start_date=pb_request.start_date,
             end_date=pb_request.end_date,
-            period=period_map.get(pb_request.period, PeriodType.DAILY),
+            period=_PERIOD_TYPE_MAP.get(pb_request.period, PeriodType.DAILY),
             fields=list(pb_request.fields) if pb_request.fields else None,
             adjust_type=pb_request.adjust_type if pb_request.adjust_type else "none"
         )
     
     # ==================== 阶段1: 基础信息接口实现 ====================
     
-    def GetInstrumentType(
+    @grpc_error_handler
+    @cached_response(key=lambda request: request.stock_code)
+    async def GetInstrumentType(
         self, 
         request: data_pb2.InstrumentTypeRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.InstrumentTypeResponse:
         """获取合约类型"""
-        try:
-            result = self.data_service.get_instrument_type(request.stock_code)
-            
-            # result是InstrumentTypeInfo对象，直接访问属性
-            info = data_pb2.InstrumentTypeInfo(
-                stock_code=result.stock_code,
-                index=result.index,
-                stock=result.stock,
-                fund=result.fund,
-                etf=result.etf,
-                bond=result.bond,
-                option=result.option,
-                futures=result.futures
-            )
-            
-            return data_pb2.InstrumentTypeResponse(
-                data=info,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.InstrumentTypeResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        result = await self._run(self.data_service.get_instrument_type, request.stock_code)
+        
+        # result是InstrumentTypeInfo对象，直接访问属性
+        info = data_pb2.InstrumentTypeInfo(
+            stock_code=result.stock_code,
+            index=result.index,
+            stock=result.stock,
+            fund=result.fund,
+            etf=result.etf,
+            bond=result.bond,
+            option=result.option,
+            futures=result.futures
+        )
+        
+        return data_pb2.InstrumentTypeResponse(
+            data=info,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetHolidays(
+    @grpc_error_handler
+    @cached_response()
+    async def GetHolidays(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.HolidayInfoResponse:
         """获取节假日列表"""
-        try:
-            result = self.data_service.get_holidays()
-            
-            # result是HolidayInfo对象，直接访问属性
-            return data_pb2.HolidayInfoResponse(
-                holidays=result.holidays,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.HolidayInfoResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        result = await self._run(self.data_service.get_holidays)
+        
+        # result是HolidayInfo对象，直接访问属性
+        return data_pb2.HolidayInfoResponse(
+            holidays=result.holidays,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetConvertibleBondInfo(
+    @grpc_error_handler
+    async def GetConvertibleBondInfo(
         self, 
-        request: empty_pb2.Empty, 
+        request: data_pb2.ConvertibleBondInfoRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.ConvertibleBondListResponse:
         """获取可转债信息"""
-        try:
-            results = self.data_service.get_cb_info()
-            
-            # 检查是否客户端不支持
-            if isinstance(results, list) and len(results) > 0:
-                # results是ConvertibleBondInfo对象列表，直接访问属性
-                bonds = []
-                for cb in results:
-                    bond = data_pb2.ConvertibleBondInfo(
-                        bond_code=cb.bond_code,
-                        bond_name=cb.bond_name or '',
-                        stock_code=cb.stock_code or '',
-                        stock_name=cb.stock_name or '',
-                        conversion_price=cb.conversion_price or 0.0,
-                        conversion_value=cb.conversion_value or 0.0,
-                        conversion_premium_rate=cb.conversion_premium_rate or 0.0,
-                        current_price=cb.current_price or 0.0,
-                        par_value=cb.par_value or 0.0,
-                        list_date=cb.list_date or '',
-                        maturity_date=cb.maturity_date or '',
-                        conversion_begin_date=cb.conversion_begin_date or '',
-                        conversion_end_date=cb.conversion_end_date or ''
-                    )
-                    bonds.append(bond)
-            
-            return data_pb2.ConvertibleBondListResponse(
-                bonds=bonds,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.ConvertibleBondListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        results = await self._run(self.data_service.get_cb_info)
+        
+        pb_response = data_pb2.ConvertibleBondListResponse(status=_SUCCESS_STATUS)
+        bonds = pb_response.bonds
+        for cb in results:
+            # cb是ConvertibleBondInfo对象，直接访问属性；在响应中原地构建
+            bond = bonds.add(
+                bond_code=cb.bond_code,
+                bond_name=cb.bond_name or '',
+                stock_code=cb.stock_code or '',
+                stock_name=cb.stock_name or '',
+                conversion_price=cb.conversion_price or 0.0,
+                conversion_value=cb.conversion_value or 0.0,
+                conversion_premium_rate=cb.conversion_premium_rate or 0.0,
+                current_price=cb.current_price or 0.0,
+                par_value=cb.par_value or 0.0,
+                list_date=cb.list_date or '',
+                maturity_date=cb.maturity_date or '',
+                conversion_begin_date=cb.conversion_begin_date or '',
+                conversion_end_date=cb.conversion_end_date or ''
+            )
+            # 原始字段体积较大，仅在客户端显式请求时返回
+            if request.include_raw and cb.raw_data:
+                bond.raw_data.update({k: str(v) for k, v in cb.raw_data.items()})
+        
+        return pb_response
     
-    def GetIpoInfo(
+    @grpc_error_handler
+    async def GetIpoInfo(
         self, 
-        request: empty_pb2.Empty, 
+        request: data_pb2.IpoInfoRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.IpoInfoListResponse:
         """获取新股申购信息"""
-        try:
-            results = self.data_service.get_ipo_info()
-            
-            ipos = []
-            for ipo in results:
-                # ipo是IpoInfo对象，直接访问属性
-                ipo_info = data_pb2.IpoInfo(
-                    security_code=ipo.security_code or '',
-                    code_name=ipo.code_name or '',
-                    market=ipo.market or '',
-                    act_issue_qty=ipo.act_issue_qty or 0,
-                    online_issue_qty=ipo.online_issue_qty or 0,
-                    online_sub_code=ipo.online_sub_code or '',
-                    online_sub_max_qty=ipo.online_sub_max_qty or 0,
-                    publish_price=ipo.publish_price or 0.0,
-                    is_profit=ipo.is_profit or 0,
-                    industry_pe=ipo.industry_pe or 0.0,
-                    after_pe=ipo.after_pe or 0.0,
-                    subscribe_date=ipo.subscribe_date or '',
-                    lottery_date=ipo.lottery_date or '',
-                    list_date=ipo.list_date or ''
-                )
-                ipos.append(ipo_info)
-            
-            return data_pb2.IpoInfoListResponse(
-                ipos=ipos,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.IpoInfoListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        results = await self._run(self.data_service.get_ipo_info)
+        
+        pb_response = data_pb2.IpoInfoListResponse(status=_SUCCESS_STATUS)
+        ipos = pb_response.ipos
+        for ipo in results:
+            # ipo是IpoInfo对象，直接访问属性；在响应中原地构建
+            ipo_info = ipos.add(
+                security_code=ipo.security_code or '',
+                code_name=ipo.code_name or '',
+                market=ipo.market or '',
+                act_issue_qty=ipo.act_issue_qty or 0,
+                online_issue_qty=ipo.online_issue_qty or 0,
+                online_sub_code=ipo.online_sub_code or '',
+                online_sub_max_qty=ipo.online_sub_max_qty or 0,
+                publish_price=ipo.publish_price or 0.0,
+                is_profit=ipo.is_profit or 0,
+                industry_pe=ipo.industry_pe or 0.0,
+                after_pe=ipo.after_pe or 0.0,
+                subscribe_date=ipo.subscribe_date or '',
+                lottery_date=ipo.lottery_date or '',
+                list_date=ipo.list_date or ''
+            )
+            # 原始字段体积较大，仅在客户端显式请求时返回
+            if request.include_raw and ipo.raw_data:
+                ipo_info.raw_data.update({k: str(v) for k, v in ipo.raw_data.items()})
+        
+        return pb_response
     
-    def GetPeriodList(
+    @grpc_error_handler
+    @cached_response(ttl=None)
+    async def GetPeriodList(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.PeriodListResponse:
-        """获取可用周期列表"""
-        try:
-            result = self.data_service.get_period_list()
-            
-            # result是PeriodListResponse对象，直接访问属性
-            return data_pb2.PeriodListResponse(
-                periods=result.periods,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            # 检查是否为不支持的功能
-            error_msg = str(e)
-            if "function not realize" in error_msg or "未支持此功能" in error_msg:
-                context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-            else:
-                context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(error_msg)
-            return data_pb2.PeriodListResponse(
-                status=common_pb2.Status(code=500, message=error_msg)
-            )
+        """获取可用周期列表（运行期间不变，首次构建后直接返回）"""
+        result = await self._run(self.data_service.get_period_list)
+        
+        # result是PeriodListResponse对象，直接访问属性
+        return data_pb2.PeriodListResponse(
+            periods=result.periods,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetDataDir(
+    @grpc_error_handler
+    @cached_response(ttl=None)
+    async def GetDataDir(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.DataDirResponse:
-        """获取本地数据路径"""
-        try:
-            result = self.data_service.get_data_dir()
-            
-            # result是DataDirResponse对象，直接访问属性
-            return data_pb2.DataDirResponse(
-                data_dir=result.data_dir,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DataDirResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        """获取本地数据路径（运行期间不变，首次构建后直接返回）"""
+        result = await self._run(self.data_service.get_data_dir)
+        
+        # result是DataDirResponse对象，直接访问属性
+        return data_pb2.DataDirResponse(
+            data_dir=result.data_dir,
+            status=_SUCCESS_STATUS
+        )
     
     # ==================== 阶段2: 行情数据获取接口实现 ====================
     
-    def GetLocalData(
+    @grpc_error_handler
+    async def GetLocalData(
         self, 
         request: data_pb2.LocalDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.LocalDataResponse:
         """获取本地行情数据"""
-        try:
-            # 构造LocalDataRequest对象
-            from app.models.data_models import LocalDataRequest as LocalDataReq
-            req = LocalDataReq(
-                stock_codes=list(request.stock_codes),
-                start_time=request.start_time,
-                end_time=request.end_time,
-                period=request.period,
-                fields=list(request.fields) if request.fields else None,
-                adjust_type=request.adjust_type if request.adjust_type else "none"
-            )
-            
-            # 调用服务层，返回 List[MarketDataResponse]
-            result = self.data_service.get_local_data(req)
-            
-            # 遍历响应列表，构造 gRPC 响应
-            data_map = {}
-            for market_data_response in result:
-                stock_code = market_data_response.stock_code
-                bars = []
-                # market_data_response.data 是 List[Dict[str, Any]]
-                for item in market_data_response.data:
-                    bar = data_pb2.KlineBar(
-                        time=str(item.get('time', '')),
-                        open=float(item.get('open', 0.0)),
-                        high=float(item.get('high', 0.0)),
-                        low=float(item.get('low', 0.0)),
-                        close=float(item.get('close', 0.0)),
-                        volume=int(item.get('volume', 0)),
-                        amount=float(item.get('amount', 0.0))
-                    )
-                    bars.append(bar)
-                data_map[stock_code] = data_pb2.KlineDataList(bars=bars)
-            
-            return data_pb2.LocalDataResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.LocalDataResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 构造LocalDataRequest对象
+        from app.models.data_models import LocalDataRequest as LocalDataReq
+        req = LocalDataReq.model_construct(
+            stock_codes=request.stock_codes,
+            start_time=request.start_time,
+            end_time=request.end_time,
+            period=request.period,
+            fields=list(request.fields) if request.fields else None,
+            adjust_type=request.adjust_type if request.adjust_type else "none"
+        )
+        
+        # 调用服务层，返回 List[MarketDataResponse]
+        result = await self._run(self.data_service.get_local_data, req)
+        
+        pb_response = data_pb2.LocalDataResponse(status=_SUCCESS_STATUS)
+        self._fill_kline_map(pb_response, result, request.columnar)
+        return pb_response
     
-    def GetFullTick(
+    @grpc_error_handler
+    async def GetFullTick(
         self, 
         request: data_pb2.FullTickRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.FullTickResponse:
         """获取完整tick数据"""
-        try:
-            # 构建FullTickRequest对象
-            from app.models.data_models import FullTickRequest as FullTickReq
-            req = FullTickReq(
-                stock_codes=list(request.stock_codes),
-                start_time=request.start_time,
-                end_time=request.end_time
-            )
-            result = self.data_service.get_full_tick(req)
-            
-            data_map = {}
-            for stock_code, tick_list in result.items():
-                ticks = []
-                for tick in tick_list:
-                    # tick 是 TickData Pydantic 模型，使用属性访问
-                    tick_data = data_pb2.TickData(
-                        time=tick.time or '',
-                        last_price=tick.last_price,
-                        open=tick.open or 0.0,
-                        high=tick.high or 0.0,
-                        low=tick.low or 0.0,
-                        last_close=tick.last_close or 0.0,
-                        amount=tick.amount or 0.0,
-                        volume=tick.volume or 0,
-                        pvolume=tick.pvolume or 0,
-                        stock_status=tick.stock_status or 0,
-                        open_int=tick.open_int or 0,
-                        last_settlement_price=tick.last_settlement_price or 0.0,
-                        ask_price=tick.ask_price or [],
-                        bid_price=tick.bid_price or [],
-                        ask_vol=tick.ask_vol or [],
-                        bid_vol=tick.bid_vol or [],
-                        transaction_num=tick.transaction_num or 0
-                    )
-                    ticks.append(tick_data)
-                data_map[stock_code] = data_pb2.TickDataList(ticks=ticks)
-            
-            return data_pb2.FullTickResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.FullTickResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 构建FullTickRequest对象
+        from app.models.data_models import FullTickRequest as FullTickReq
+        req = FullTickReq.model_construct(
+            stock_codes=list(request.stock_codes),
+            start_time=request.start_time,
+            end_time=request.end_time
+        )
+        result = await self._run(self.data_service.get_full_tick, req)
+        
+        # 直接在响应的 map 字段中构建，避免先构造再整体拷贝
+        pb_response = data_pb2.FullTickResponse(status=_SUCCESS_STATUS)
+        for stock_code, tick_list in result.items():
+            ticks = pb_response.data[stock_code].ticks
+            for tick in tick_list:
+                # tick 是 TickData Pydantic 模型，使用属性访问
+                tick_data = ticks.add()
+                tick_data.time = tick.time or ''
+                tick_data.last_price = tick.last_price
+                tick_data.open = tick.open or 0.0
+                tick_data.high = tick.high or 0.0
+                tick_data.low = tick.low or 0.0
+                tick_data.last_close = tick.last_close or 0.0
+                tick_data.amount = tick.amount or 0.0
+                tick_data.volume = tick.volume or 0
+                tick_data.pvolume = tick.pvolume or 0
+                tick_data.stock_status = tick.stock_status or 0
+                tick_data.open_int = tick.open_int or 0
+                tick_data.last_settlement_price = tick.last_settlement_price or 0.0
+                # 盘口数组整体 extend，避免逐个元素追加
+                if tick.ask_price:
+                    tick_data.ask_price.extend(tick.ask_price)
+                if tick.bid_price:
+                    tick_data.bid_price.extend(tick.bid_price)
+                if tick.ask_vol:
+                    tick_data.ask_vol.extend(tick.ask_vol)
+                if tick.bid_vol:
+                    tick_data.bid_vol.extend(tick.bid_vol)
+                tick_data.transaction_num = tick.transaction_num or 0
+        
+        return pb_response
     
-    def GetDividFactors(
+    @grpc_error_handler
+    async def GetDividFactors(
         self, 
         request: data_pb2.DividFactorsRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DividFactorsResponse:
         """获取除权数据"""
-        try:
-            result = self.data_service.get_divid_factors(request.stock_code)
-            
-            factors = []
-            for factor in result:
-                div_factor = data_pb2.DividendFactor(
-                    time=factor.get('time', ''),
-                    interest=factor.get('interest', 0.0),
-                    stock_bonus=factor.get('stock_bonus', 0.0),
-                    stock_gift=factor.get('stock_gift', 0.0),
-                    allot_num=factor.get('allot_num', 0.0),
-                    allot_price=factor.get('allot_price', 0.0),
-                    gugai=factor.get('gugai', 0),
-                    dr=factor.get('dr', 0.0)
+        result = await self._run(self.data_service.get_divid_factors, request.stock_code)
+        
+        # factor 是 DividendFactor Pydantic 模型，使用属性访问
+        return data_pb2.DividFactorsResponse(
+            factors=[
+                data_pb2.DividendFactor(
+                    time=factor.time or '',
+                    interest=factor.interest or 0.0,
+                    stock_bonus=factor.stock_bonus or 0.0,
+                    stock_gift=factor.stock_gift or 0.0,
+                    allot_num=factor.allot_num or 0.0,
+                    allot_price=factor.allot_price or 0.0,
+                    gugai=factor.gugai or 0,
+                    dr=factor.dr or 0.0
                 )
-                factors.append(div_factor)
-            
-            return data_pb2.DividFactorsResponse(
-                factors=factors,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DividFactorsResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+                for factor in result
+            ],
+            status=_SUCCESS_STATUS
+        )
     
-    def GetFullKline(
+    @grpc_error_handler
+    async def GetFullKline(
         self, 
         request: data_pb2.FullKlineRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.FullKlineResponse:
         """获取完整K线数据"""
-        try:
-            # 构造FullKlineRequest对象
-            from app.models.data_models import FullKlineRequest as FullKlineReq
-            req = FullKlineReq(
-                stock_codes=list(request.stock_codes),
-                start_time=request.start_time,
-                end_time=request.end_time,
-                period=request.period,
-                fields=list(request.fields) if request.fields else None,
-                adjust_type=request.adjust_type if request.adjust_type else "none"
-            )
-            
-            # 调用服务层，返回 List[MarketDataResponse]
-            result = self.data_service.get_full_kline(req)
-            
-            # 遍历响应列表，构造 gRPC 响应
-            data_map = {}
-            for market_data_response in result:
-                stock_code = market_data_response.stock_code
-                bars = []
-                # market_data_response.data 是 List[Dict[str, Any]]
-                for item in market_data_response.data:
-                    bar = data_pb2.KlineBar(
-                        time=str(item.get('time', '')),
-                        open=float(item.get('open', 0.0)),
-                        high=float(item.get('high', 0.0)),
-                        low=float(item.get('low', 0.0)),
-                        close=float(item.get('close', 0.0)),
-                        volume=int(item.get('volume', 0)),
-                        amount=float(item.get('amount', 0.0))
-                    )
-                    bars.append(bar)
-                data_map[stock_code] = data_pb2.KlineDataList(bars=bars)
-            
-            return data_pb2.FullKlineResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.FullKlineResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 构造FullKlineRequest对象
+        from app.models.data_models import FullKlineRequest as FullKlineReq
+        req = FullKlineReq.model_construct(
+            stock_codes=request.stock_codes,
+            start_time=request.start_time,
+            end_time=request.end_time,
+            period=request.period,
+            fields=list(request.fields) if request.fields else None,
+            adjust_type=request.adjust_type if request.adjust_type else "none"
+        )
+        
+        # 调用服务层，返回 List[MarketDataResponse]
+        result = await self._run(self.data_service.get_full_kline, req)
+        
+        pb_response = data_pb2.FullKlineResponse(status=_SUCCESS_STATUS)
+        self._fill_kline_map(pb_response, result, request.columnar)
+        return pb_response
     
     # ==================== 阶段3: 数据下载接口实现 ====================
     
-    def DownloadHistoryData(
+    def _convert_download_response(self, result) -> data_pb2.DownloadResponse:
+        """转换下载结果为 protobuf"""
+        return data_pb2.DownloadResponse(
+            task_id=result.task_id,
+            status=_DOWNLOAD_STATUS_MAP.get(result.status, data_pb2.DOWNLOAD_PENDING),
+            progress=result.progress,
+            total=result.total,
+            finished=result.finished,
+            message=result.message,
+            current_stock=result.current_stock or '',
+            rpc_status=_SUCCESS_STATUS
+        )
+    
+    async def _dispatch_download(self, download_callable: Callable, *args) -> data_pb2.DownloadResponse:
+        """在线程池中执行下载并转换结果，异常由各接口的 grpc_error_handler 处理"""
+        result = await self._run(download_callable, *args)
+        return self._convert_download_response(result)
+    
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadHistoryData(
         self, 
         request: data_pb2.DownloadHistoryDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载历史数据（单只）"""
-        try:
-            result = self.data_service.download_history_data(
-                request.stock_code,
-                request.period,
-                request.start_time,
-                request.end_time,
-                request.incrementally
-            )
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                current_stock=result.current_stock or '',
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._dispatch_download(
+            self.data_service.download_history_data,
+            request.stock_code,
+            request.period,
+            request.start_time,
+            request.end_time,
+            request.incrementally
+        )
     
-    def DownloadHistoryDataBatch(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadHistoryDataBatch(
         self, 
         request: data_pb2.DownloadHistoryDataBatchRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """批量下载历史数据"""
+        return await self._dispatch_download(
+            self.data_service.download_history_data_batch,
+            list(request.stock_list),
+            request.period,
+            request.start_time,
+            request.end_time
+        )
+    
+    async def StreamDownloadHistoryDataBatch(
+        self,
+        request: data_pb2.DownloadHistoryDataBatchRequest,
+        context: grpc.aio.ServicerContext
+    ):
+        """
+        批量下载历史数据（Server Streaming）
+        
+        xtdata 每完成一只股票回调一次进度，逐条推送给客户端，最后推送最终结果；
+        客户端无需轮询
+        """
+        loop = asyncio.get_running_loop()
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_progress(data):
+            # 回调在下载线程中执行，转交给事件循环
+            loop.call_soon_threadsafe(progress_queue.put_nowait, data)
+        
         try:
-            result = self.data_service.download_history_data_batch(
+            download_task = asyncio.ensure_future(self._run(
+                self.data_service.download_history_data_batch,
                 list(request.stock_list),
                 request.period,
                 request.start_time,
-                request.end_time
-            )
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                current_stock=result.current_stock or '',
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
+                request.end_time,
+                callback=on_progress
+            ))
+            
+            while not download_task.done():
+                getter = asyncio.ensure_future(progress_queue.get())
+                await asyncio.wait({getter, download_task}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                yield self._convert_download_progress(getter.result())
+            
+            # 推送下载结束前已到达的剩余进度
+            while not progress_queue.empty():
+                yield self._convert_download_progress(progress_queue.get_nowait())
+            
+            yield self._convert_download_response(download_task.result())
+        
+        except DataServiceException as e:
+            await context.abort(*_error_status(e, grpc.StatusCode.INVALID_ARGUMENT))
         except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+            await context.abort(*_error_status(e, grpc.StatusCode.INTERNAL))
+    
+    def _convert_download_progress(self, data: dict) -> data_pb2.DownloadResponse:
+        """转换 xtdata 下载进度回调数据为 protobuf"""
+        total = data.get('total', 0)
+        finished = data.get('finished', 0)
+        return data_pb2.DownloadResponse(
+            status=data_pb2.DOWNLOAD_RUNNING,
+            progress=finished * 100.0 / total if total else 0.0,
+            total=total,
+            finished=finished,
+            message=data.get('message', ''),
+            current_stock=data.get('stockcode', '')
+        )
     
-    def DownloadFinancialData(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadFinancialData(
         self, 
         request: data_pb2.DownloadFinancialDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载财务数据"""
-        try:
-            result = self.data_service.download_financial_data(
-                list(request.stock_list),
-                list(request.table_list),
-                request.start_date,
-                request.end_date
-            )
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
+        return await self._dispatch_download(
+            self.data_service.download_financial_data,
+            DownloadFinancialDataRequest.model_construct(
+                stock_list=list(request.stock_list),
+                table_list=list(request.table_list),
+                start_date=request.start_date,
+                end_date=request.end_date
             )
+        )
     
-    def DownloadFinancialDataBatch(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadFinancialDataBatch(
         self, 
         request: data_pb2.DownloadFinancialDataRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """批量下载财务数据"""
-        try:
-            result = self.data_service.download_financial_data_batch(
-                list(request.stock_list),
-                list(request.table_list),
-                request.start_date,
-                request.end_date
-            )
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
+        return await self._dispatch_download(
+            self.data_service.download_financial_data_batch,
+            DownloadFinancialDataBatchRequest.model_construct(
+                stock_list=list(request.stock_list),
+                table_list=list(request.table_list),
+                start_date=request.start_date,
+                end_date=request.end_date
             )
+        )
     
-    def DownloadSectorData(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadSectorData(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载板块数据"""
-        try:
-            result = self.data_service.download_sector_data()
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        response = await self._dispatch_download(self.data_service.download_sector_data)
+        self._invalidate_cache('GetSectorList')
+        return response
     
-    def DownloadIndexWeight(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadIndexWeight(
         self, 
         request: data_pb2.DownloadIndexWeightRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载指数权重"""
-        try:
-            result = self.data_service.download_index_weight(request.index_code)
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._dispatch_download(
+            self.data_service.download_index_weight,
+            DownloadIndexWeightRequest.model_construct(index_code=request.index_code or None)
+        )
     
-    def DownloadCBData(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadCBData(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载可转债数据"""
-        try:
-            result = self.data_service.download_cb_data()
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._dispatch_download(self.data_service.download_cb_data)
     
-    def DownloadETFInfo(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadETFInfo(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载ETF信息"""
-        try:
-            result = self.data_service.download_etf_info()
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._dispatch_download(self.data_service.download_etf_info)
     
-    def DownloadHolidayData(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadHolidayData(
         self, 
         request: empty_pb2.Empty, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载节假日数据"""
-        try:
-            result = self.data_service.download_holiday_data()
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        response = await self._dispatch_download(self.data_service.download_holiday_data)
+        self._invalidate_cache('GetHolidays', 'GetTradingCalendar')
+        return response
     
-    def DownloadHistoryContracts(
+    @grpc_error_handler
+    @shared_download()
+    async def DownloadHistoryContracts(
         self, 
         request: data_pb2.DownloadHistoryContractsRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.DownloadResponse:
         """下载历史合约数据"""
-        try:
-            result = self.data_service.download_history_contracts(request.market)
-            
-            status_map = {
-                'pending': data_pb2.DOWNLOAD_PENDING,
-                'running': data_pb2.DOWNLOAD_RUNNING,
-                'completed': data_pb2.DOWNLOAD_COMPLETED,
-                'failed': data_pb2.DOWNLOAD_FAILED
-            }
-            
-            return data_pb2.DownloadResponse(
-                task_id=result.task_id,
-                status=status_map.get(result.status, data_pb2.DOWNLOAD_PENDING),
-                progress=result.progress,
-                total=result.total,
-                finished=result.finished,
-                message=result.message,
-                rpc_status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.DownloadResponse(
-                rpc_status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._dispatch_download(
+            self.data_service.download_history_contracts,
+            DownloadHistoryContractsRequest.model_construct(market=request.market or None)
+        )
     
     # ==================== 阶段4: 板块管理接口实现 ====================
     
-    def CreateSectorFolder(
+    @grpc_error_handler
+    async def CreateSectorFolder(
         self, 
         request: data_pb2.CreateSectorFolderRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.CreateSectorFolderResponse:
         """创建板块文件夹"""
-        try:
-            result = self.data_service.create_sector_folder(
-                request.parent_node,
-                request.folder_name,
-                request.overwrite
-            )
-            
-            return data_pb2.CreateSectorFolderResponse(
-                created_name=result,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.CreateSectorFolderResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._create_sector_folder(request)
     
-    def CreateSector(
+    @grpc_error_handler
+    async def CreateSector(
         self, 
         request: data_pb2.CreateSectorRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.CreateSectorResponse:
         """创建板块"""
-        try:
-            result = self.data_service.create_sector(
-                request.parent_node,
-                request.sector_name,
-                request.overwrite
-            )
-            
-            return data_pb2.CreateSectorResponse(
-                created_name=result,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.CreateSectorResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._create_sector(request)
     
-    def AddSector(
+    @grpc_error_handler
+    async def AddSector(
         self, 
         request: data_pb2.AddSectorRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.AddSectorResponse:
         """添加股票到板块"""
-        try:
-            self.data_service.add_sector(
-                request.sector_name,
-                list(request.stock_list)
-            )
-            
-            return data_pb2.AddSectorResponse(
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.AddSectorResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._add_sector(request)
     
-    def RemoveStockFromSector(
+    @grpc_error_handler
+    async def RemoveStockFromSector(
         self, 
         request: data_pb2.RemoveStockFromSectorRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.RemoveStockFromSectorResponse:
         """从板块移除股票"""
-        try:
-            result = self.data_service.remove_stock_from_sector(
-                request.sector_name,
-                list(request.stock_list)
-            )
-            
-            return data_pb2.RemoveStockFromSectorResponse(
-                success=result,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.RemoveStockFromSectorResponse(
-                success=False,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._remove_stock_from_sector(request)
     
-    def RemoveSector(
+    @grpc_error_handler
+    async def RemoveSector(
         self, 
         request: data_pb2.RemoveSectorRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.RemoveSectorResponse:
         """删除板块"""
-        try:
-            self.data_service.remove_sector(request.sector_name)
-            
-            return data_pb2.RemoveSectorResponse(
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.RemoveSectorResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._remove_sector(request)
     
-    def ResetSector(
+    @grpc_error_handler
+    async def ResetSector(
         self, 
         request: data_pb2.ResetSectorRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.ResetSectorResponse:
         """重置板块"""
-        try:
-            result = self.data_service.reset_sector(
-                request.sector_name,
-                list(request.stock_list)
-            )
-            
-            return data_pb2.ResetSectorResponse(
-                success=result,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.ResetSectorResponse(
-                success=False,
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        return await self._reset_sector(request)
+    
+    # 板块操作实现：不带装饰器，一元接口和 SectorStream 共用，异常由各自调用方处理
+    
+    async def _create_sector_folder(self, request: data_pb2.CreateSectorFolderRequest) -> data_pb2.CreateSectorFolderResponse:
+        """创建板块文件夹"""
+        result = await self._run(
+            self.data_service.create_sector_folder,
+            request.parent_node,
+            request.folder_name,
+            request.overwrite
+        )
+        
+        return data_pb2.CreateSectorFolderResponse(
+            created_name=result.created_name,
+            status=_SUCCESS_STATUS
+        )
+    
+    async def _create_sector(self, request: data_pb2.CreateSectorRequest) -> data_pb2.CreateSectorResponse:
+        """创建板块"""
+        result = await self._run(
+            self.data_service.create_sector,
+            request.parent_node,
+            request.sector_name,
+            request.overwrite
+        )
+        self._invalidate_cache('GetSectorList')
+        
+        return data_pb2.CreateSectorResponse(
+            created_name=result.created_name,
+            status=_SUCCESS_STATUS
+        )
+    
+    async def _add_sector(self, request: data_pb2.AddSectorRequest) -> data_pb2.AddSectorResponse:
+        """添加股票到板块"""
+        # 服务层仅在调用 xtdata 时才转换为 list
+        await self._run(
+            self.data_service.add_sector,
+            request.sector_name,
+            request.stock_list
+        )
+        self._invalidate_cache('GetSectorList')
+        
+        return data_pb2.AddSectorResponse(
+            status=_SUCCESS_STATUS
+        )
+    
+    async def _remove_stock_from_sector(self, request: data_pb2.RemoveStockFromSectorRequest) -> data_pb2.RemoveStockFromSectorResponse:
+        """从板块移除股票"""
+        result = await self._run(
+            self.data_service.remove_stock_from_sector,
+            request.sector_name,
+            request.stock_list
+        )
+        self._invalidate_cache('GetSectorList')
+        
+        return data_pb2.RemoveStockFromSectorResponse(
+            success=result,
+            status=_SUCCESS_STATUS
+        )
+    
+    async def _remove_sector(self, request: data_pb2.RemoveSectorRequest) -> data_pb2.RemoveSectorResponse:
+        """删除板块"""
+        await self._run(self.data_service.remove_sector, request.sector_name)
+        self._invalidate_cache('GetSectorList')
+        
+        return data_pb2.RemoveSectorResponse(
+            status=_SUCCESS_STATUS
+        )
+    
+    async def _reset_sector(self, request: data_pb2.ResetSectorRequest) -> data_pb2.ResetSectorResponse:
+        """重置板块"""
+        result = await self._run(
+            self.data_service.reset_sector,
+            request.sector_name,
+            request.stock_list
+        )
+        self._invalidate_cache('GetSectorList')
+        
+        return data_pb2.ResetSectorResponse(
+            success=result,
+            status=_SUCCESS_STATUS
+        )
+    
+    async def SectorStream(
+        self,
+        request_iterator,
+        context: grpc.aio.ServicerContext
+    ):
+        """
+        批量板块管理（双向流）
+        
+        客户端在同一个流上连续发送板块操作，按顺序逐个返回结果；
+        单个操作失败只写入该结果的 status，不中断整个流
+        """
+        async for operation in request_iterator:
+            kind = operation.WhichOneof('operation')
+            if kind is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "未指定板块操作")
+            
+            # 调用与一元接口共用的未装饰实现（grpc_error_handler 出错会 abort 整个流）
+            handler = getattr(self, _SECTOR_OPERATIONS[kind])
+            result = data_pb2.SectorOperationResult()
+            try:
+                getattr(result, kind).CopyFrom(await handler(getattr(operation, kind)))
+            except DataServiceException as e:
+                status = getattr(result, kind).status
+                status.code = 400
+                status.message = _error_status(e, grpc.StatusCode.INVALID_ARGUMENT)[1]
+            except Exception as e:
+                status = getattr(result, kind).status
+                status.code = 500
+                status.message = _error_status(e, grpc.StatusCode.INTERNAL)[1]
+            yield result
     
     # ==================== 阶段5: Level2数据接口实现 ====================
     
-    def GetL2Quote(
+    @grpc_error_handler
+    @cached_response(key=lambda request: request.SerializeToString(deterministic=True), ttl=_L2_QUOTE_CACHE_TTL)
+    async def GetL2Quote(
         self, 
         request: data_pb2.L2QuoteRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.L2QuoteResponse:
         """获取Level2快照数据"""
-        try:
-            result = self.data_service.get_l2_quote(list(request.stock_codes))
-            
-            data_map = {}
-            for stock_code, quote in result.items():
-                # quote 是单个 L2QuoteData 对象，包装为列表
-                quote_data = data_pb2.L2QuoteData(
-                    time=quote.time or '',
-                    last_price=quote.last_price,
-                    open=quote.open or 0.0,
-                    high=quote.high or 0.0,
-                    low=quote.low or 0.0,
-                    amount=quote.amount or 0.0,
-                    volume=quote.volume or 0,
-                    pvolume=quote.pvolume or 0,
-                    open_int=quote.open_int or 0,
-                    stock_status=quote.stock_status or 0,
-                    transaction_num=quote.transaction_num or 0,
-                    last_close=quote.last_close or 0.0,
-                    last_settlement_price=quote.last_settlement_price or 0.0,
-                    settlement_price=quote.settlement_price or 0.0,
-                    pe=quote.pe or 0.0,
-                    ask_price=quote.ask_price or [],
-                    bid_price=quote.bid_price or [],
-                    ask_vol=quote.ask_vol or [],
-                    bid_vol=quote.bid_vol or []
-                )
-                # 包装为列表
-                data_map[stock_code] = data_pb2.L2QuoteDataList(quotes=[quote_data])
-            
-            return data_pb2.L2QuoteResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
+        result = await self._run(self.data_service.get_l2_quote, list(request.stock_codes))
+        
+        # 直接在响应的 map 字段中构建
+        pb_response = data_pb2.L2QuoteResponse(status=_SUCCESS_STATUS)
+        for stock_code, quote in result.items():
+            # quote 是单个 L2QuoteData 对象，包装为列表
+            quote_data = pb_response.data[stock_code].quotes.add(
+                time=quote.time or '',
+                last_price=quote.last_price,
+                open=quote.open or 0.0,
+                high=quote.high or 0.0,
+                low=quote.low or 0.0,
+                amount=quote.amount or 0.0,
+                volume=quote.volume or 0,
+                pvolume=quote.pvolume or 0,
+                open_int=quote.open_int or 0,
+                stock_status=quote.stock_status or 0,
+                transaction_num=quote.transaction_num or 0,
+                last_close=quote.last_close or 0.0,
+                last_settlement_price=quote.last_settlement_price or 0.0,
+                settlement_price=quote.settlement_price or 0.0,
+                pe=quote.pe or 0.0
+            )
+            # 10档盘口整体 extend，空档位不分配临时列表
+            if quote.ask_price:
+                quote_data.ask_price.extend(quote.ask_price)
+            if quote.bid_price:
+                quote_data.bid_price.extend(quote.bid_price)
+            if quote.ask_vol:
+                quote_data.ask_vol.extend(quote.ask_vol)
+            if quote.bid_vol:
+                quote_data.bid_vol.extend(quote.bid_vol)
+        
+        return pb_response
+    
+    def _add_l2_orders(self, orders, order_list) -> None:
+        """将 L2OrderData 列表写入 protobuf repeated 字段"""
+        # 逐笔数据行数多，add 方法只查找一次
+        add_order = orders.add
+        for order in order_list:
+            # order 是 L2OrderData Pydantic 模型
+            add_order(
+                time=order.time or '',
+                price=order.price,
+                volume=order.volume,
+                entrust_no=order.entrust_no or 0,
+                entrust_type=order.entrust_type or 0,
+                entrust_direction=order.entrust_direction or 0
             )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.L2QuoteResponse(
-                status=common_pb2.Status(code=500, message=str(e))
+    
+    def _add_l2_transactions(self, transactions, trans_list) -> None:
+        """将 L2TransactionData 列表写入 protobuf repeated 字段"""
+        # 逐笔数据行数多，add 方法只查找一次
+        add_transaction = transactions.add
+        for trans in trans_list:
+            # trans 是 L2TransactionData Pydantic 模型
+            add_transaction(
+                time=trans.time or '',
+                price=trans.price,
+                volume=trans.volume,
+                amount=trans.amount or 0.0,
+                trade_index=trans.trade_index or 0,
+                buy_no=trans.buy_no or 0,
+                sell_no=trans.sell_no or 0,
+                trade_type=trans.trade_type or 0,
+                trade_flag=trans.trade_flag or 0
             )
     
-    def GetL2Order(
+    @grpc_error_handler
+    async def GetL2Order(
         self, 
         request: data_pb2.L2OrderRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.L2OrderResponse:
         """获取Level2逐笔委托"""
+        # 逐笔数据量大且重复度高，压缩收益明显
+        context.set_compression(_L2_COMPRESSION)
+        result = await self._run(self.data_service.get_l2_order, list(request.stock_codes))
+        
+        # 直接在响应的 map 字段中构建
+        pb_response = data_pb2.L2OrderResponse(status=_SUCCESS_STATUS)
+        for stock_code, order_list in result.items():
+            self._add_l2_orders(pb_response.data[stock_code].orders, order_list)
+        
+        return pb_response
+    
+    async def StreamL2Order(
+        self,
+        request: data_pb2.L2OrderRequest,
+        context: grpc.aio.ServicerContext
+    ):
+        """
+        流式获取Level2逐笔委托（Server Streaming）
+        
+        按股票逐个获取并推送，单只股票按 _L2_STREAM_BATCH_SIZE 条切分，限制单条消息大小
+        """
+        context.set_compression(_L2_COMPRESSION)
         try:
-            result = self.data_service.get_l2_order(list(request.stock_codes))
-            
-            data_map = {}
-            for stock_code, order_list in result.items():
-                orders = []
-                for order in order_list:
-                    # order 是 L2OrderData Pydantic 模型
-                    order_data = data_pb2.L2OrderData(
-                        time=order.time or '',
-                        price=order.price,
-                        volume=order.volume,
-                        entrust_no=order.entrust_no or 0,
-                        entrust_type=order.entrust_type or 0,
-                        entrust_direction=order.entrust_direction or 0
-                    )
-                    orders.append(order_data)
-                data_map[stock_code] = data_pb2.L2OrderDataList(orders=orders)
-            
-            return data_pb2.L2OrderResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
-            )
+            async for stock_code, order_list in self._iterate(
+                self.data_service.iter_l2_order(list(request.stock_codes))
+            ):
+                # 无数据的股票也推送一条空批次，便于客户端区分
+                for start in range(0, max(len(order_list), 1), _L2_STREAM_BATCH_SIZE):
+                    batch = data_pb2.L2OrderBatch(stock_code=stock_code)
+                    self._add_l2_orders(batch.orders, order_list[start:start + _L2_STREAM_BATCH_SIZE])
+                    yield batch
+        
+        except DataServiceException as e:
+            await context.abort(*_error_status(e, grpc.StatusCode.INVALID_ARGUMENT))
         except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.L2OrderResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+            await context.abort(*_error_status(e, grpc.StatusCode.INTERNAL))
     
-    def GetL2Transaction(
+    @grpc_error_handler
+    async def GetL2Transaction(
         self, 
         request: data_pb2.L2TransactionRequest, 
         context: grpc.ServicerContext
     ) -> data_pb2.L2TransactionResponse:
         """获取Level2逐笔成交"""
+        # 逐笔数据量大且重复度高，压缩收益明显
+        context.set_compression(_L2_COMPRESSION)
+        result = await self._run(self.data_service.get_l2_transaction, list(request.stock_codes))
+        
+        # 直接在响应的 map 字段中构建
+        pb_response = data_pb2.L2TransactionResponse(status=_SUCCESS_STATUS)
+        for stock_code, trans_list in result.items():
+            self._add_l2_transactions(pb_response.data[stock_code].transactions, trans_list)
+        
+        return pb_response
+    
+    async def StreamL2Transaction(
+        self,
+        request: data_pb2.L2TransactionRequest,
+        context: grpc.aio.ServicerContext
+    ):
+        """
+        流式获取Level2逐笔成交（Server Streaming）
+        
+        按股票逐个获取并推送，单只股票按 _L2_STREAM_BATCH_SIZE 条切分，限制单条消息大小
+        """
+        context.set_compression(_L2_COMPRESSION)
         try:
-            result = self.data_service.get_l2_transaction(list(request.stock_codes))
-            
-            data_map = {}
-            for stock_code, trans_list in result.items():
-                transactions = []
-                for trans in trans_list:
-                    # trans 是 L2TransactionData Pydantic 模型
-                    trans_data = data_pb2.L2TransactionData(
-                        time=trans.time or '',
-                        price=trans.price,
-                        volume=trans.volume,
-                        amount=trans.amount or 0.0,
-                        trade_index=trans.trade_index or 0,
-                        buy_no=trans.buy_no or 0,
-                        sell_no=trans.sell_no or 0,
-                        trade_type=trans.trade_type or 0,
-                        trade_flag=trans.trade_flag or 0
+            async for stock_code, trans_list in self._iterate(
+                self.data_service.iter_l2_transaction(list(request.stock_codes))
+            ):
+                # 无数据的股票也推送一条空批次，便于客户端区分
+                for start in range(0, max(len(trans_list), 1), _L2_STREAM_BATCH_SIZE):
+                    batch = data_pb2.L2TransactionBatch(stock_code=stock_code)
+                    self._add_l2_transactions(
+                        batch.transactions, trans_list[start:start + _L2_STREAM_BATCH_SIZE]
                     )
-                    transactions.append(trans_data)
-                data_map[stock_code] = data_pb2.L2TransactionDataList(transactions=transactions)
-            
-            return data_pb2.L2TransactionResponse(
-                data=data_map,
-                status=common_pb2.Status(code=0, message="success")
-            )
+                    yield batch
+        
+        except DataServiceException as e:
+            await context.abort(*_error_status(e, grpc.StatusCode.INVALID_ARGUMENT))
         except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.L2TransactionResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+            await context.abort(*_error_status(e, grpc.StatusCode.INTERNAL))
     
     # ==================== 阶段6: 行情订阅接口 ====================
     
@@ -1375,14 +1399,14 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
                 subscription_manager.set_event_loop(loop)
             
             # 验证股票代码列表
-            if not request.symbols or len(list(request.symbols)) == 0:
+            if not request.symbols:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details("股票代码列表不能为空")
                 return
             
             # 创建订阅
             subscription_id = subscription_manager.subscribe_quote(
-                symbols=list(request.symbols),
+                symbols=request.symbols,
                 adjust_type=request.adjust_type or "none"
             )
             
@@ -1529,7 +1553,8 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
             context.set_details(str(e))
             return
     
-    def UnsubscribeQuote(
+    @grpc_error_handler
+    async def UnsubscribeQuote(
         self,
         request: data_pb2.UnsubscribeRequest,
         context: grpc.ServicerContext
@@ -1538,29 +1563,20 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
         from app.config import get_settings
         from app.dependencies import get_subscription_manager
         
-        try:
-            settings = get_settings()
-            subscription_manager = get_subscription_manager(settings)
-            
-            # 取消订阅
-            success = subscription_manager.unsubscribe(request.subscription_id)
-            
-            return data_pb2.UnsubscribeResponse(
-                success=success,
-                message="订阅已取消" if success else "订阅不存在",
-                status=common_pb2.Status(code=0, message="success")
-            )
+        settings = get_settings()
+        subscription_manager = get_subscription_manager(settings)
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.UnsubscribeResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 取消订阅（会调用 xtdata 退订，放到线程池执行）
+        success = await self._run(subscription_manager.unsubscribe, request.subscription_id)
+        
+        return data_pb2.UnsubscribeResponse(
+            success=success,
+            message="订阅已取消" if success else "订阅不存在",
+            status=_SUCCESS_STATUS
+        )
     
-    def GetSubscriptionInfo(
+    @grpc_error_handler
+    async def GetSubscriptionInfo(
         self,
         request: data_pb2.SubscriptionInfoRequest,
         context: grpc.ServicerContext
@@ -1569,40 +1585,29 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
         from app.config import get_settings
         from app.dependencies import get_subscription_manager
         
-        try:
-            settings = get_settings()
-            subscription_manager = get_subscription_manager(settings)
-            
-            # 获取订阅信息
-            info = subscription_manager.get_subscription_info(request.subscription_id)
-            
-            if not info:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"订阅不存在: {request.subscription_id}")
-                return data_pb2.SubscriptionInfoResponse(
-                    status=common_pb2.Status(code=404, message="订阅不存在")
-                )
-            
-            return data_pb2.SubscriptionInfoResponse(
-                subscription_id=info['subscription_id'],
-                symbols=info['symbols'],
-                adjust_type=info['adjust_type'],
-                subscription_type=info['subscription_type'],
-                created_at=info['created_at'],
-                last_heartbeat=info['last_heartbeat'],
-                active=info['active'],
-                queue_size=info['queue_size'],
-                status=common_pb2.Status(code=0, message="success")
-            )
+        settings = get_settings()
+        subscription_manager = get_subscription_manager(settings)
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.SubscriptionInfoResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 获取订阅信息
+        info = subscription_manager.get_subscription_info(request.subscription_id)
+        
+        if not info:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"订阅不存在: {request.subscription_id}")
+        
+        return data_pb2.SubscriptionInfoResponse(
+            subscription_id=info['subscription_id'],
+            symbols=info['symbols'],
+            adjust_type=info['adjust_type'],
+            subscription_type=info['subscription_type'],
+            created_at=info['created_at'],
+            last_heartbeat=info['last_heartbeat'],
+            active=info['active'],
+            queue_size=info['queue_size'],
+            status=_SUCCESS_STATUS
+        )
     
-    def ListSubscriptions(
+    @grpc_error_handler
+    async def ListSubscriptions(
         self,
         request: empty_pb2.Empty,
         context: grpc.ServicerContext
@@ -1611,17 +1616,16 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
         from app.config import get_settings
         from app.dependencies import get_subscription_manager
         
-        try:
-            settings = get_settings()
-            subscription_manager = get_subscription_manager(settings)
-            
-            # 列出所有订阅
-            subscriptions = subscription_manager.list_subscriptions()
-            
-            # 构造响应
-            sub_list = []
-            for info in subscriptions:
-                sub_info = data_pb2.SubscriptionInfoResponse(
+        settings = get_settings()
+        subscription_manager = get_subscription_manager(settings)
+        
+        # 列出所有订阅
+        subscriptions = subscription_manager.list_subscriptions()
+        
+        # 构造响应（列表推导后由构造函数一次性批量写入）
+        return data_pb2.SubscriptionListResponse(
+            subscriptions=[
+                data_pb2.SubscriptionInfoResponse(
                     subscription_id=info['subscription_id'],
                     symbols=info['symbols'],
                     adjust_type=info['adjust_type'],
@@ -1629,20 +1633,9 @@ class DataGrpcService(data_pb2_grpc.DataServiceServicer):
                     created_at=info['created_at'],
                     last_heartbeat=info['last_heartbeat'],
                     active=info['active'],
-                    queue_size=info['queue_size'],
-                    status=common_pb2.Status(code=0, message="success")
+                    queue_size=info['queue_size']
                 )
-                sub_list.append(sub_info)
-            
-            return data_pb2.SubscriptionListResponse(
-                subscriptions=sub_list,
-                status=common_pb2.Status(code=0, message="success")
-            )
-        
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return data_pb2.SubscriptionListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
-
+                for info in subscriptions
+            ],
+            status=_SUCCESS_STATUS
+        )
@@ -10,6 +10,12 @@ from generated import health_pb2, health_pb2_grpc
 class HealthGrpcService(health_pb2_grpc.HealthServicer):
     """gRPC 健康检查服务实现"""
     
+    def __init__(self):
+        # 响应内容固定，预先构造一次；gRPC 只做序列化，不会修改该对象
+        self._serving_response = health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.SERVING
+        )
+    
     def Check(
         self, 
         request: health_pb2.HealthCheckRequest, 
@@ -19,6 +25,4 @@ class HealthGrpcService(health_pb2_grpc.HealthServicer):
         # 这里可以添加实际的健康检查逻辑
         # 例如检查数据库连接、xtquant连接等
         
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.SERVING
-        )
+        return self._serving_response
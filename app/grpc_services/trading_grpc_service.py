@@ -1,7 +1,11 @@
 """
 gRPC 交易服务实现
 """
+import asyncio
+import functools
+from concurrent.futures import Executor
 from datetime import datetime
+from typing import Any, Callable, Optional
 
 import grpc
 
@@ -19,459 +23,484 @@ from app.utils.exceptions import TradingServiceException
 # 导入生成的 protobuf 代码
 from generated import common_pb2, trading_pb2, trading_pb2_grpc
 
+# 成功状态（作为构造参数传入时会被复制，可安全共享）
+_SUCCESS_STATUS = common_pb2.Status(code=0, message="success")
+
+# 断开账户、撤单只有成功/失败两种固定响应，预先构造后直接返回（返回后不再修改）
+_DISCONNECT_OK = trading_pb2.DisconnectResponse(success=True, message="断开账户成功", status=_SUCCESS_STATUS)
+_DISCONNECT_FAILED = trading_pb2.DisconnectResponse(
+    success=False, message="断开账户失败", status=common_pb2.Status(code=400, message="failed")
+)
+_CANCEL_ORDER_OK = trading_pb2.CancelOrderResponse(success=True, message="撤销订单成功", status=_SUCCESS_STATUS)
+_CANCEL_ORDER_FAILED = trading_pb2.CancelOrderResponse(
+    success=False, message="撤销订单失败", status=common_pb2.Status(code=400, message="failed")
+)
+
+# 内部账户类型 -> protobuf 账户类型
+_ACCOUNT_TYPE_MAP = {
+    RestAccountType.FUTURE: trading_pb2.ACCOUNT_TYPE_FUTURE,
+    RestAccountType.SECURITY: trading_pb2.ACCOUNT_TYPE_SECURITY,
+    RestAccountType.CREDIT: trading_pb2.ACCOUNT_TYPE_CREDIT,
+    RestAccountType.FUTURE_OPTION: trading_pb2.ACCOUNT_TYPE_FUTURE_OPTION,
+    RestAccountType.STOCK_OPTION: trading_pb2.ACCOUNT_TYPE_STOCK_OPTION
+}
+
+# protobuf 订单方向/类型 -> 内部订单方向/类型（下单请求转换）
+_REST_ORDER_SIDE_MAP = {
+    trading_pb2.ORDER_SIDE_BUY: RestOrderSide.BUY,
+    trading_pb2.ORDER_SIDE_SELL: RestOrderSide.SELL
+}
+
+_REST_ORDER_TYPE_MAP = {
+    trading_pb2.ORDER_TYPE_MARKET: RestOrderType.MARKET,
+    trading_pb2.ORDER_TYPE_LIMIT: RestOrderType.LIMIT,
+    trading_pb2.ORDER_TYPE_STOP: RestOrderType.STOP,
+    trading_pb2.ORDER_TYPE_STOP_LIMIT: RestOrderType.STOP_LIMIT
+}
+
+# 服务层返回的订单方向/类型/状态字符串 -> protobuf 枚举值
+_ORDER_SIDE_MAP = {
+    "BUY": trading_pb2.ORDER_SIDE_BUY,
+    "SELL": trading_pb2.ORDER_SIDE_SELL
+}
+
+_ORDER_TYPE_MAP = {
+    "MARKET": trading_pb2.ORDER_TYPE_MARKET,
+    "LIMIT": trading_pb2.ORDER_TYPE_LIMIT,
+    "STOP": trading_pb2.ORDER_TYPE_STOP,
+    "STOP_LIMIT": trading_pb2.ORDER_TYPE_STOP_LIMIT
+}
+
+_ORDER_STATUS_MAP = {
+    "PENDING": trading_pb2.ORDER_STATUS_PENDING,
+    "SUBMITTED": trading_pb2.ORDER_STATUS_SUBMITTED,
+    "PARTIAL_FILLED": trading_pb2.ORDER_STATUS_PARTIAL_FILLED,
+    "FILLED": trading_pb2.ORDER_STATUS_FILLED,
+    "CANCELLED": trading_pb2.ORDER_STATUS_CANCELLED,
+    "REJECTED": trading_pb2.ORDER_STATUS_REJECTED
+}
+
+# 映射表未命中时的默认枚举值（模块加载时解析一次，转换循环中不再查 trading_pb2 属性）
+_ACCOUNT_TYPE_UNSPECIFIED = trading_pb2.ACCOUNT_TYPE_UNSPECIFIED
+_ORDER_SIDE_UNSPECIFIED = trading_pb2.ORDER_SIDE_UNSPECIFIED
+_ORDER_TYPE_UNSPECIFIED = trading_pb2.ORDER_TYPE_UNSPECIFIED
+_ORDER_STATUS_UNSPECIFIED = trading_pb2.ORDER_STATUS_UNSPECIFIED
+
+# 流式列表查询每条消息的最大记录数
+_STREAM_BATCH_SIZE = 256
+
+# 列表查询超过该记录数时对响应启用压缩（代码、时间等字段重复度高，小响应压缩不划算）
+_LIST_COMPRESSION = grpc.Compression.Gzip
+_LIST_COMPRESSION_MIN_ROWS = 64
+
+
+def _format_time(value) -> str:
+    """时间字段转字符串：datetime 用 ISO 格式，其余原样转换"""
+    # datetime.isoformat 由 C 实现，直接调用即可；按值缓存反而要先构造键元组
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def trading_error_handler(response_cls, with_message: bool = False):
+    """
+    统一处理 gRPC 交易一元方法的异常
+    
+    TradingServiceException 映射为 INVALID_ARGUMENT/400，其余异常映射为 INTERNAL/500，
+    并返回带错误状态的 response_cls；with_message 为 True 时同时填充 success/message 字段
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request, context):
+            try:
+                return await func(self, request, context)
+            except Exception as e:
+                grpc_code, code = _error_code(e)
+                message = str(e)
+                context.set_code(grpc_code)
+                context.set_details(message)
+                status = common_pb2.Status(code=code, message=message)
+                if with_message:
+                    return response_cls(success=False, message=message, status=status)
+                return response_cls(status=status)
+        return wrapper
+    return decorator
+
+
+def trading_stream_error_handler(func):
+    """统一处理 gRPC 交易流式方法（async generator）的异常，只设置状态码，不再推送消息"""
+    @functools.wraps(func)
+    async def wrapper(self, request, context):
+        try:
+            async for response in func(self, request, context):
+                yield response
+        except Exception as e:
+            grpc_code, _ = _error_code(e)
+            context.set_code(grpc_code)
+            context.set_details(str(e))
+    return wrapper
+
+
+def _error_code(e: Exception):
+    """异常 -> (gRPC 状态码, 响应 status.code)"""
+    if isinstance(e, TradingServiceException):
+        return grpc.StatusCode.INVALID_ARGUMENT, 400
+    return grpc.StatusCode.INTERNAL, 500
+
 
 class TradingGrpcService(trading_pb2_grpc.TradingServiceServicer):
     """gRPC 交易服务实现"""
     
-    def __init__(self, trading_service: TradingService):
+    def __init__(self, trading_service: TradingService, executor: Optional[Executor] = None):
         self.trading_service = trading_service
+        # 执行阻塞交易调用的线程池（None 时使用事件循环默认线程池）
+        self._executor = executor
+    
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """在线程池中执行阻塞的交易服务调用，避免阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
     
-    def Connect(
+    @trading_error_handler(trading_pb2.ConnectResponse, with_message=True)
+    async def Connect(
         self, 
         request: trading_pb2.ConnectRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.ConnectResponse:
         """连接账户"""
-        try:
-            # 转换请求
-            rest_request = RestConnectRequest(
-                account_id=request.account_id,
-                password=request.password if request.password else None,
-                client_id=request.client_id if request.client_id else None
-            )
-            
-            # 调用服务
-            result = self.trading_service.connect_account(rest_request)
-            
-            # 转换响应
-            account_info = None
-            if result.account_info:
-                account_info = self._convert_account_info(result.account_info)
-            
-            return trading_pb2.ConnectResponse(
-                success=result.success,
-                message=result.message,
-                session_id=result.session_id or "",
-                account_info=account_info,
-                status=common_pb2.Status(code=0 if result.success else 400, message=result.message)
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.ConnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.ConnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 转换请求：protobuf 字段类型已确定，跳过 pydantic 校验直接构造
+        rest_request = RestConnectRequest.model_construct(
+            account_id=request.account_id,
+            password=request.password if request.password else None,
+            client_id=request.client_id if request.client_id else None
+        )
+        
+        # 调用服务
+        result = await self._run(self.trading_service.connect_account, rest_request)
+        
+        # 转换响应
+        account_info = None
+        if result.account_info:
+            account_info = self._convert_account_info(result.account_info)
+        
+        return trading_pb2.ConnectResponse(
+            success=result.success,
+            message=result.message,
+            session_id=result.session_id or "",
+            account_info=account_info,
+            status=common_pb2.Status(code=0 if result.success else 400, message=result.message)
+        )
     
-    def Disconnect(
+    @trading_error_handler(trading_pb2.DisconnectResponse, with_message=True)
+    async def Disconnect(
         self, 
         request: trading_pb2.DisconnectRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.DisconnectResponse:
         """断开账户"""
-        try:
-            # 调用服务
-            success = self.trading_service.disconnect_account(request.session_id)
-            
-            return trading_pb2.DisconnectResponse(
-                success=success,
-                message="断开账户成功" if success else "断开账户失败",
-                status=common_pb2.Status(code=0 if success else 400, message="success" if success else "failed")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.DisconnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.DisconnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        success = await self._run(self.trading_service.disconnect_account, request.session_id)
+        
+        return _DISCONNECT_OK if success else _DISCONNECT_FAILED
     
-    def GetAccountInfo(
+    @trading_error_handler(trading_pb2.ConnectResponse, with_message=True)
+    async def GetAccountInfo(
         self, 
         request: trading_pb2.DisconnectRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.ConnectResponse:
         """获取账户信息"""
-        try:
-            # 调用服务
-            result = self.trading_service.get_account_info(request.session_id)
-            
-            # 转换响应
-            account_info = self._convert_account_info(result)
-            
-            return trading_pb2.ConnectResponse(
-                success=True,
-                message="获取账户信息成功",
-                session_id=request.session_id,
-                account_info=account_info,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.ConnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.ConnectResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        result = await self._run(self.trading_service.get_account_info, request.session_id)
+        
+        # 转换响应
+        account_info = self._convert_account_info(result)
+        
+        return trading_pb2.ConnectResponse(
+            success=True,
+            message="获取账户信息成功",
+            session_id=request.session_id,
+            account_info=account_info,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetPositions(
+    @trading_error_handler(trading_pb2.PositionListResponse)
+    async def GetPositions(
         self, 
         request: trading_pb2.PositionRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.PositionListResponse:
         """获取持仓列表"""
-        try:
-            # 调用服务
-            results = self.trading_service.get_positions(request.session_id)
-            
-            # 转换响应
-            positions = []
-            for result in results:
-                position = trading_pb2.PositionInfo(
-                    stock_code=result.stock_code,
-                    stock_name=result.stock_name,
-                    volume=result.volume,
-                    available_volume=result.available_volume,
-                    frozen_volume=result.frozen_volume,
-                    cost_price=result.cost_price,
-                    market_price=result.market_price,
-                    market_value=result.market_value,
-                    profit_loss=result.profit_loss,
-                    profit_loss_ratio=result.profit_loss_ratio
-                )
-                positions.append(position)
-            
-            return trading_pb2.PositionListResponse(
-                positions=positions,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.PositionListResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.PositionListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        results = await self._run(self.trading_service.get_positions, request.session_id)
+        self._compress_if_large(context, len(results))
+        
+        # 转换响应：直接在 repeated 字段中构建，不创建中间消息
+        response = trading_pb2.PositionListResponse(status=_SUCCESS_STATUS)
+        add = response.positions.add
+        for result in results:
+            self._convert_position_info(result, add)
+        
+        return response
     
-    def SubmitOrder(
+    @trading_error_handler(trading_pb2.OrderResponse)
+    async def SubmitOrder(
         self, 
         request: trading_pb2.OrderRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.OrderResponse:
         """提交订单"""
-        try:
-            # 转换请求
-            rest_request = self._convert_order_request(request)
-            
-            # 调用服务
-            result = self.trading_service.submit_order(request.session_id, rest_request)
-            
-            # 转换响应
-            order_info = self._convert_order_info(result)
-            
-            return trading_pb2.OrderResponse(
-                order=order_info,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.OrderResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.OrderResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 转换请求
+        rest_request = self._convert_order_request(request)
+        
+        # 调用服务
+        result = await self._run(self.trading_service.submit_order, request.session_id, rest_request)
+        
+        # 转换响应
+        order_info = self._convert_order_info(result)
+        
+        return trading_pb2.OrderResponse(
+            order=order_info,
+            status=_SUCCESS_STATUS
+        )
     
-    def CancelOrder(
+    @trading_error_handler(trading_pb2.CancelOrderResponse, with_message=True)
+    async def CancelOrder(
         self, 
         request: trading_pb2.CancelOrderRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.CancelOrderResponse:
         """撤销订单"""
-        try:
-            # 转换请求
-            rest_request = RestCancelOrderRequest(order_id=request.order_id)
-            
-            # 调用服务
-            success = self.trading_service.cancel_order(request.session_id, rest_request)
-            
-            return trading_pb2.CancelOrderResponse(
-                success=success,
-                message="撤销订单成功" if success else "撤销订单失败",
-                status=common_pb2.Status(code=0 if success else 400, message="success" if success else "failed")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.CancelOrderResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.CancelOrderResponse(
-                success=False,
-                message=str(e),
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 转换请求：protobuf 字段类型已确定，跳过 pydantic 校验直接构造
+        rest_request = RestCancelOrderRequest.model_construct(order_id=request.order_id)
+        
+        # 调用服务
+        success = await self._run(self.trading_service.cancel_order, request.session_id, rest_request)
+        
+        return _CANCEL_ORDER_OK if success else _CANCEL_ORDER_FAILED
     
-    def GetOrders(
+    @trading_error_handler(trading_pb2.OrderListResponse)
+    async def GetOrders(
         self, 
         request: trading_pb2.OrderListRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.OrderListResponse:
         """获取订单列表"""
-        try:
-            # 调用服务
-            results = self.trading_service.get_orders(request.session_id)
-            
-            # 转换响应
-            orders = []
-            for result in results:
-                order_info = self._convert_order_info(result)
-                orders.append(order_info)
-            
-            return trading_pb2.OrderListResponse(
-                orders=orders,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.OrderListResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.OrderListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        results = await self._run(self.trading_service.get_orders, request.session_id)
+        self._compress_if_large(context, len(results))
+        
+        # 转换响应：直接在 repeated 字段中构建，不创建中间消息
+        response = trading_pb2.OrderListResponse(status=_SUCCESS_STATUS)
+        add = response.orders.add
+        for result in results:
+            self._convert_order_info(result, add)
+        
+        return response
     
-    def GetTrades(
+    @trading_error_handler(trading_pb2.TradeListResponse)
+    async def GetTrades(
         self, 
         request: trading_pb2.TradeListRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.TradeListResponse:
         """获取成交记录"""
-        try:
-            # 调用服务
-            results = self.trading_service.get_trades(request.session_id)
-            
-            # 转换响应
-            trades = []
-            for result in results:
-                side_map = {
-                    "BUY": trading_pb2.ORDER_SIDE_BUY,
-                    "SELL": trading_pb2.ORDER_SIDE_SELL
-                }
-                
-                trade = trading_pb2.TradeInfo(
-                    trade_id=result.trade_id,
-                    order_id=result.order_id,
-                    stock_code=result.stock_code,
-                    side=side_map.get(result.side, trading_pb2.ORDER_SIDE_UNSPECIFIED),
-                    volume=result.volume,
-                    price=result.price,
-                    amount=result.amount,
-                    trade_time=result.trade_time.isoformat() if isinstance(result.trade_time, datetime) else str(result.trade_time),
-                    commission=result.commission
-                )
-                trades.append(trade)
-            
-            return trading_pb2.TradeListResponse(
-                trades=trades,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.TradeListResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.TradeListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        results = await self._run(self.trading_service.get_trades, request.session_id)
+        self._compress_if_large(context, len(results))
+        
+        # 转换响应：直接在 repeated 字段中构建，不创建中间消息
+        response = trading_pb2.TradeListResponse(status=_SUCCESS_STATUS)
+        add = response.trades.add
+        for result in results:
+            self._convert_trade_info(result, add)
+        
+        return response
     
-    def GetAsset(
+    @trading_error_handler(trading_pb2.AssetResponse)
+    async def GetAsset(
         self, 
         request: trading_pb2.AssetRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.AssetResponse:
         """获取资产信息"""
-        try:
-            # 调用服务
-            result = self.trading_service.get_asset_info(request.session_id)
-            
-            # 转换响应
-            asset = trading_pb2.AssetInfo(
-                total_asset=result.total_asset,
-                market_value=result.market_value,
-                cash=result.cash,
-                frozen_cash=result.frozen_cash,
-                available_cash=result.available_cash,
-                profit_loss=result.profit_loss,
-                profit_loss_ratio=result.profit_loss_ratio
-            )
-            
-            return trading_pb2.AssetResponse(
-                asset=asset,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.AssetResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.AssetResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        result = await self._run(self.trading_service.get_asset_info, request.session_id)
+        
+        # 转换响应
+        asset = trading_pb2.AssetInfo(
+            total_asset=result.total_asset,
+            market_value=result.market_value,
+            cash=result.cash,
+            frozen_cash=result.frozen_cash,
+            available_cash=result.available_cash,
+            profit_loss=result.profit_loss,
+            profit_loss_ratio=result.profit_loss_ratio
+        )
+        
+        return trading_pb2.AssetResponse(
+            asset=asset,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetRiskInfo(
+    @trading_error_handler(trading_pb2.RiskInfoResponse)
+    async def GetRiskInfo(
         self, 
         request: trading_pb2.RiskInfoRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.RiskInfoResponse:
         """获取风险信息"""
-        try:
-            # 调用服务
-            result = self.trading_service.get_risk_info(request.session_id)
-            
-            return trading_pb2.RiskInfoResponse(
-                position_ratio=result.position_ratio,
-                cash_ratio=result.cash_ratio,
-                max_drawdown=result.max_drawdown,
-                var_95=result.var_95,
-                var_99=result.var_99,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.RiskInfoResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.RiskInfoResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        result = await self._run(self.trading_service.get_risk_info, request.session_id)
+        
+        return trading_pb2.RiskInfoResponse(
+            position_ratio=result.position_ratio,
+            cash_ratio=result.cash_ratio,
+            max_drawdown=result.max_drawdown,
+            var_95=result.var_95,
+            var_99=result.var_99,
+            status=_SUCCESS_STATUS
+        )
     
-    def GetStrategies(
+    @trading_error_handler(trading_pb2.StrategyListResponse)
+    async def GetStrategies(
         self, 
         request: trading_pb2.StrategyListRequest, 
         context: grpc.ServicerContext
     ) -> trading_pb2.StrategyListResponse:
         """获取策略列表"""
-        try:
-            # 调用服务
-            results = self.trading_service.get_strategies(request.session_id)
-            
-            # 转换响应
-            strategies = []
-            for result in results:
-                # 将parameters字典转换为map<string, string>
-                parameters = {k: str(v) for k, v in result.parameters.items()}
-                
-                strategy = trading_pb2.StrategyInfo(
-                    strategy_name=result.strategy_name,
-                    strategy_type=result.strategy_type,
-                    status=result.status,
-                    created_time=result.created_time.isoformat() if isinstance(result.created_time, datetime) else str(result.created_time),
-                    last_update_time=result.last_update_time.isoformat() if isinstance(result.last_update_time, datetime) else str(result.last_update_time),
-                    parameters=parameters
-                )
-                strategies.append(strategy)
-            
-            return trading_pb2.StrategyListResponse(
-                strategies=strategies,
-                status=common_pb2.Status(code=0, message="success")
-            )
-            
-        except TradingServiceException as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return trading_pb2.StrategyListResponse(
-                status=common_pb2.Status(code=400, message=str(e))
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return trading_pb2.StrategyListResponse(
-                status=common_pb2.Status(code=500, message=str(e))
-            )
+        # 调用服务
+        results = await self._run(self.trading_service.get_strategies, request.session_id)
+        self._compress_if_large(context, len(results))
+        
+        # 转换响应：直接在 repeated 字段中构建，不创建中间消息
+        response = trading_pb2.StrategyListResponse(status=_SUCCESS_STATUS)
+        add = response.strategies.add
+        for result in results:
+            self._convert_strategy_info(result, add)
+        
+        return response
+    
+    # ==================== 流式列表查询 ====================
+    
+    @trading_stream_error_handler
+    async def StreamPositions(
+        self, 
+        request: trading_pb2.PositionRequest, 
+        context: grpc.ServicerContext
+    ):
+        """获取持仓列表（Server Streaming，每批最多 _STREAM_BATCH_SIZE 条）"""
+        results = await self._run(self.trading_service.get_positions, request.session_id)
+        self._compress_if_large(context, len(results))
+        for batch in self._stream_batches(
+            results, trading_pb2.PositionListResponse, 'positions', self._convert_position_info
+        ):
+            yield batch
+    
+    @trading_stream_error_handler
+    async def StreamOrders(
+        self, 
+        request: trading_pb2.OrderListRequest, 
+        context: grpc.ServicerContext
+    ):
+        """获取订单列表（Server Streaming，每批最多 _STREAM_BATCH_SIZE 条）"""
+        results = await self._run(self.trading_service.get_orders, request.session_id)
+        self._compress_if_large(context, len(results))
+        for batch in self._stream_batches(
+            results, trading_pb2.OrderListResponse, 'orders', self._convert_order_info
+        ):
+            yield batch
+    
+    @trading_stream_error_handler
+    async def StreamTrades(
+        self, 
+        request: trading_pb2.TradeListRequest, 
+        context: grpc.ServicerContext
+    ):
+        """获取成交记录（Server Streaming，每批最多 _STREAM_BATCH_SIZE 条）"""
+        results = await self._run(self.trading_service.get_trades, request.session_id)
+        self._compress_if_large(context, len(results))
+        for batch in self._stream_batches(
+            results, trading_pb2.TradeListResponse, 'trades', self._convert_trade_info
+        ):
+            yield batch
+    
+    @trading_stream_error_handler
+    async def StreamStrategies(
+        self, 
+        request: trading_pb2.StrategyListRequest, 
+        context: grpc.ServicerContext
+    ):
+        """获取策略列表（Server Streaming，每批最多 _STREAM_BATCH_SIZE 条）"""
+        results = await self._run(self.trading_service.get_strategies, request.session_id)
+        self._compress_if_large(context, len(results))
+        for batch in self._stream_batches(
+            results, trading_pb2.StrategyListResponse, 'strategies', self._convert_strategy_info
+        ):
+            yield batch
     
     # 辅助转换方法
     
+    def _compress_if_large(self, context, count: int):
+        """记录数超过 _LIST_COMPRESSION_MIN_ROWS 时对本次调用启用压缩"""
+        if count > _LIST_COMPRESSION_MIN_ROWS:
+            context.set_compression(_LIST_COMPRESSION)
+    
+    def _stream_batches(self, results, response_cls, field: str, convert):
+        """将列表结果按 _STREAM_BATCH_SIZE 条切分，逐批转换（客户端断开时调用方协程会被取消）"""
+        for start in range(0, len(results), _STREAM_BATCH_SIZE):
+            batch = response_cls()
+            add = getattr(batch, field).add
+            for result in results[start:start + _STREAM_BATCH_SIZE]:
+                convert(result, add)
+            yield batch
+    
+    def _convert_position_info(self, result, factory=trading_pb2.PositionInfo):
+        """转换持仓信息（factory 传入父消息 repeated 字段的 add 时原地构建）"""
+        return factory(
+            stock_code=result.stock_code,
+            stock_name=result.stock_name,
+            volume=result.volume,
+            available_volume=result.available_volume,
+            frozen_volume=result.frozen_volume,
+            cost_price=result.cost_price,
+            market_price=result.market_price,
+            market_value=result.market_value,
+            profit_loss=result.profit_loss,
+            profit_loss_ratio=result.profit_loss_ratio
+        )
+    
+    def _convert_trade_info(self, result, factory=trading_pb2.TradeInfo):
+        """转换成交信息（factory 传入父消息 repeated 字段的 add 时原地构建）"""
+        return factory(
+            trade_id=result.trade_id,
+            order_id=result.order_id,
+            stock_code=result.stock_code,
+            side=_ORDER_SIDE_MAP.get(result.side, _ORDER_SIDE_UNSPECIFIED),
+            volume=result.volume,
+            price=result.price,
+            amount=result.amount,
+            trade_time=_format_time(result.trade_time),
+            commission=result.commission
+        )
+    
+    def _convert_strategy_info(self, result, factory=trading_pb2.StrategyInfo):
+        """转换策略信息（factory 传入父消息 repeated 字段的 add 时原地构建）"""
+        return factory(
+            strategy_name=result.strategy_name,
+            strategy_type=result.strategy_type,
+            status=result.status,
+            created_time=_format_time(result.created_time),
+            last_update_time=_format_time(result.last_update_time),
+            # 将parameters字典转换为map<string, string>
+            parameters={k: str(v) for k, v in result.parameters.items()}
+        )
+    
     def _convert_account_info(self, account_info):
         """转换账户信息"""
-        account_type_map = {
-            RestAccountType.FUTURE: trading_pb2.ACCOUNT_TYPE_FUTURE,
-            RestAccountType.SECURITY: trading_pb2.ACCOUNT_TYPE_SECURITY,
-            RestAccountType.CREDIT: trading_pb2.ACCOUNT_TYPE_CREDIT,
-            RestAccountType.FUTURE_OPTION: trading_pb2.ACCOUNT_TYPE_FUTURE_OPTION,
-            RestAccountType.STOCK_OPTION: trading_pb2.ACCOUNT_TYPE_STOCK_OPTION
-        }
-        
         return trading_pb2.AccountInfo(
             account_id=account_info.account_id,
-            account_type=account_type_map.get(account_info.account_type, trading_pb2.ACCOUNT_TYPE_UNSPECIFIED),
+            account_type=_ACCOUNT_TYPE_MAP.get(account_info.account_type, _ACCOUNT_TYPE_UNSPECIFIED),
             account_name=account_info.account_name,
             status=account_info.status,
             balance=account_info.balance,
@@ -482,60 +511,27 @@ class TradingGrpcService(trading_pb2_grpc.TradingServiceServicer):
         )
     
     def _convert_order_request(self, pb_request: trading_pb2.OrderRequest) -> RestOrderRequest:
-        """转换订单请求"""
-        side_map = {
-            trading_pb2.ORDER_SIDE_BUY: RestOrderSide.BUY,
-            trading_pb2.ORDER_SIDE_SELL: RestOrderSide.SELL
-        }
-        
-        type_map = {
-            trading_pb2.ORDER_TYPE_MARKET: RestOrderType.MARKET,
-            trading_pb2.ORDER_TYPE_LIMIT: RestOrderType.LIMIT,
-            trading_pb2.ORDER_TYPE_STOP: RestOrderType.STOP,
-            trading_pb2.ORDER_TYPE_STOP_LIMIT: RestOrderType.STOP_LIMIT
-        }
-        
+        """转换订单请求（保留 pydantic 校验：数量、价格必须大于0）"""
         return RestOrderRequest(
             stock_code=pb_request.stock_code,
-            side=side_map.get(pb_request.side, RestOrderSide.BUY),
-            order_type=type_map.get(pb_request.order_type, RestOrderType.LIMIT),
+            side=_REST_ORDER_SIDE_MAP.get(pb_request.side, RestOrderSide.BUY),
+            order_type=_REST_ORDER_TYPE_MAP.get(pb_request.order_type, RestOrderType.LIMIT),
             volume=int(pb_request.volume),
             price=pb_request.price if pb_request.price else None,
             strategy_name=pb_request.strategy_name if pb_request.strategy_name else None
         )
     
-    def _convert_order_info(self, order_response):
-        """转换订单信息"""
-        side_map = {
-            "BUY": trading_pb2.ORDER_SIDE_BUY,
-            "SELL": trading_pb2.ORDER_SIDE_SELL
-        }
-        
-        type_map = {
-            "MARKET": trading_pb2.ORDER_TYPE_MARKET,
-            "LIMIT": trading_pb2.ORDER_TYPE_LIMIT,
-            "STOP": trading_pb2.ORDER_TYPE_STOP,
-            "STOP_LIMIT": trading_pb2.ORDER_TYPE_STOP_LIMIT
-        }
-        
-        status_map = {
-            "PENDING": trading_pb2.ORDER_STATUS_PENDING,
-            "SUBMITTED": trading_pb2.ORDER_STATUS_SUBMITTED,
-            "PARTIAL_FILLED": trading_pb2.ORDER_STATUS_PARTIAL_FILLED,
-            "FILLED": trading_pb2.ORDER_STATUS_FILLED,
-            "CANCELLED": trading_pb2.ORDER_STATUS_CANCELLED,
-            "REJECTED": trading_pb2.ORDER_STATUS_REJECTED
-        }
-        
-        return trading_pb2.OrderInfo(
+    def _convert_order_info(self, order_response, factory=trading_pb2.OrderInfo):
+        """转换订单信息（factory 传入父消息 repeated 字段的 add 时原地构建）"""
+        return factory(
             order_id=order_response.order_id,
             stock_code=order_response.stock_code,
-            side=side_map.get(order_response.side, trading_pb2.ORDER_SIDE_UNSPECIFIED),
-            order_type=type_map.get(order_response.order_type, trading_pb2.ORDER_TYPE_UNSPECIFIED),
+            side=_ORDER_SIDE_MAP.get(order_response.side, _ORDER_SIDE_UNSPECIFIED),
+            order_type=_ORDER_TYPE_MAP.get(order_response.order_type, _ORDER_TYPE_UNSPECIFIED),
             volume=order_response.volume,
             price=order_response.price if order_response.price else 0.0,
-            status=status_map.get(order_response.status, trading_pb2.ORDER_STATUS_UNSPECIFIED),
-            submitted_time=order_response.submitted_time.isoformat() if isinstance(order_response.submitted_time, datetime) else str(order_response.submitted_time),
+            status=_ORDER_STATUS_MAP.get(order_response.status, _ORDER_STATUS_UNSPECIFIED),
+            submitted_time=_format_time(order_response.submitted_time),
             filled_volume=order_response.filled_volume,
             filled_amount=order_response.filled_amount,
             average_price=order_response.average_price if order_response.average_price else 0.0
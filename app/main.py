@@ -5,16 +5,17 @@ FastAPI主应用入口
 import os
 import sys
 from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request, applications
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 # 添加xtquant包到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 from app.routers import data, health, trading, websocket
 from app.utils.exceptions import XTQuantException
 from app.utils.helpers import format_response
@@ -82,6 +83,34 @@ def reset_api_docs(swagger_ui_version: str = "5", redoc_version: str = "2") -> N
     logger.debug("API docs CDN URLs have been successfully patched")
 
 
+# 根路径与 /info 的静态数据，启动时根据配置构建一次
+_ROOT_INFO: Optional[Dict[str, Any]] = None
+_APP_INFO: Optional[Dict[str, Any]] = None
+
+
+def _build_app_info(settings: Settings) -> None:
+    """根据配置构建根路径和 /info 返回的数据"""
+    global _ROOT_INFO, _APP_INFO
+    _ROOT_INFO = {
+        "app_name": settings.app.name,
+        "app_version": settings.app.version,
+        "xtquant_mode": settings.xtquant.mode.value,
+        "description": "基于xtquant的量化交易代理服务",
+        "docs_url": "/docs",
+        "redoc_url": "/redoc",
+    }
+    _APP_INFO = {
+        "name": settings.app.name,
+        "version": settings.app.version,
+        "debug": settings.app.debug,
+        "host": settings.app.host,
+        "port": settings.app.port,
+        "log_level": settings.logging.level,
+        "xtquant_mode": settings.xtquant.mode.value,
+        "allow_real_trading": settings.xtquant.trading.allow_real_trading,
+    }
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
@@ -99,6 +128,8 @@ async def lifespan(app: FastAPI):
         compression=settings.logging.compression,
     )
 
+    _build_app_info(settings)
+
     # 初始化订阅管理器并设置事件循环
     import asyncio
 
@@ -129,7 +160,13 @@ async def lifespan(app: FastAPI):
 
 
 # 创建FastAPI应用
-app = FastAPI(title="xtquant-proxy", description="基于xtquant的量化交易代理服务", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="xtquant-proxy",
+    description="基于xtquant的量化交易代理服务",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # 添加CORS中间件
 app.add_middleware(
@@ -147,7 +184,7 @@ reset_api_docs()
 @app.exception_handler(XTQuantException)
 async def xtquant_exception_handler(request: Request, exc: XTQuantException):
     """处理xtquant相关异常"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500, content=format_response(data=None, message=exc.message, success=False, code=500)
     )
 
@@ -155,7 +192,7 @@ async def xtquant_exception_handler(request: Request, exc: XTQuantException):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """处理HTTP异常"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=format_response(data=None, message=str(exc.detail), success=False, code=exc.status_code),
     )
@@ -164,7 +201,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """处理通用异常"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=format_response(data=None, message=f"内部服务器错误: {str(exc)}", success=False, code=500),
     )
@@ -180,37 +217,17 @@ app.include_router(websocket.router)
 @app.get("/")
 async def root():
     """根路径"""
-    settings = get_settings()
-    return format_response(
-        data={
-            "app_name": settings.app.name,
-            "app_version": settings.app.version,
-            "xtquant_mode": settings.xtquant.mode.value,
-            "description": "基于xtquant的量化交易代理服务",
-            "docs_url": "/docs",
-            "redoc_url": "/redoc",
-        },
-        message="欢迎使用xtquant-proxy服务",
-    )
+    if _ROOT_INFO is None:
+        _build_app_info(get_settings())
+    return format_response(data=_ROOT_INFO, message="欢迎使用xtquant-proxy服务")
 
 
 @app.get("/info")
 async def app_info():
     """应用信息"""
-    settings = get_settings()
-    return format_response(
-        data={
-            "name": settings.app.name,
-            "version": settings.app.version,
-            "debug": settings.app.debug,
-            "host": settings.app.host,
-            "port": settings.app.port,
-            "log_level": settings.logging.level,
-            "xtquant_mode": settings.xtquant.mode.value,
-            "allow_real_trading": settings.xtquant.trading.allow_real_trading,
-        },
-        message="应用信息获取成功",
-    )
+    if _APP_INFO is None:
+        _build_app_info(get_settings())
+    return format_response(data=_APP_INFO, message="应用信息获取成功")
 
 
 if __name__ == "__main__":
@@ -225,5 +242,9 @@ if __name__ == "__main__":
         port=settings.app.port,
         reload=False,  # 热加载已关闭
         reload_includes=None,  # 仅监控 .py 文件（当 reload=True 时）
+        # uvicorn[standard] 已安装 uvloop（Windows 除外）和 httptools，loop/http 为 auto 时自动选用
+        loop="auto",
+        http="auto",
+        workers=1,  # 交易会话、订阅管理器均为进程内状态，不能多进程运行
         log_level=settings.logging.level.lower(),
     )
@@ -1,10 +1,21 @@
 """
 数据相关模型
 """
+import re
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# 日期格式：空字符串（不限）、YYYYMMDD 或 YYYYMMDDHHMMSS；
+# 跳过 pydantic 校验直接构造模型的调用方（如 gRPC 适配层）复用同一正则
+DATE_PATTERN = re.compile(r"^(?:[0-9]{8}(?:[0-9]{6})?)?$")
+
+# 日期字符串，由 pydantic-core 按 DATE_PATTERN 校验
+DateStr = Annotated[str, StringConstraints(pattern=DATE_PATTERN.pattern)]
+
+# 复权类型（由 pydantic-core 直接校验）
+AdjustType = Literal["none", "front", "back", "front_ratio", "back_ratio"]
 
 
 class PeriodType(str, Enum):
@@ -35,23 +46,16 @@ class MarketType(str, Enum):
 class DataRequest(BaseModel):
     """数据请求基础模型"""
     stock_codes: List[str] = Field(..., description="股票代码列表")
-    start_date: str = Field('', description="开始日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
-    end_date: str = Field('', description="结束日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
+    start_date: DateStr = Field('', description="开始日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
+    end_date: DateStr = Field('', description="结束日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
     period: PeriodType = Field(PeriodType.DAILY, description="数据周期")
     
     @field_validator('stock_codes')
+    @classmethod
     def validate_stock_codes(cls, v):
-        if not v or len(v) == 0:
+        if not v:
             raise ValueError('股票代码列表不能为空')
         return v
-    
-    @field_validator('start_date', 'end_date')
-    def validate_date_format(cls, v):
-        if v == '':
-            return v
-        if (len(v) != 8 and len(v) != 14) or not v.isdigit():
-            raise ValueError('日期格式必须为YYYYMMDD 或 YYYYMMDDHHMMSS')
-        return v
 
 
 class MarketDataRequest(DataRequest):
@@ -265,6 +269,13 @@ class DataDirResponse(BaseModel):
 
 # ==================== 阶段2: 行情数据获取接口模型 ====================
 
+class StockTimeRangeRequest(BaseModel):
+    """股票代码列表 + 时间范围请求基础模型"""
+    stock_codes: List[str] = Field(..., description="股票代码列表")
+    start_time: str = Field("", description="开始时间")
+    end_time: str = Field("", description="结束时间")
+
+
 class LocalDataRequest(BaseModel):
     """本地行情数据请求"""
     stock_codes: List[str] = Field(..., description="股票代码列表")
@@ -275,11 +286,8 @@ class LocalDataRequest(BaseModel):
     adjust_type: Optional[str] = Field("none", description="复权类型")
 
 
-class FullTickRequest(BaseModel):
+class FullTickRequest(StockTimeRangeRequest):
     """完整tick数据请求"""
-    stock_codes: List[str] = Field(..., description="股票代码列表")
-    start_time: str = Field("", description="开始时间")
-    end_time: str = Field("", description="结束时间")
 
 
 class DividFactorsRequest(BaseModel):
@@ -440,25 +448,16 @@ class SectorResetRequest(BaseModel):
 
 # ==================== 阶段5: Level2数据接口模型 ====================
 
-class L2QuoteRequest(BaseModel):
+class L2QuoteRequest(StockTimeRangeRequest):
     """Level2快照数据请求"""
-    stock_codes: List[str] = Field(..., description="股票代码列表")
-    start_time: str = Field("", description="开始时间")
-    end_time: str = Field("", description="结束时间")
 
 
-class L2OrderRequest(BaseModel):
+class L2OrderRequest(StockTimeRangeRequest):
     """Level2逐笔委托请求"""
-    stock_codes: List[str] = Field(..., description="股票代码列表")
-    start_time: str = Field("", description="开始时间")
-    end_time: str = Field("", description="结束时间")
 
 
-class L2TransactionRequest(BaseModel):
+class L2TransactionRequest(StockTimeRangeRequest):
     """Level2逐笔成交请求"""
-    stock_codes: List[str] = Field(..., description="股票代码列表")
-    start_time: str = Field("", description="开始时间")
-    end_time: str = Field("", description="结束时间")
 
 
 class L2QuoteData(BaseModel):
@@ -517,38 +516,25 @@ class SubscriptionType(str, Enum):
 
 class SubscriptionRequest(BaseModel):
     """订阅请求"""
-    symbols: List[str] = Field(..., min_items=1, description="股票代码列表（不能为空）")    
+    symbols: List[str] = Field(..., min_length=1, description="股票代码列表（不能为空）")
     period: PeriodType = Field(PeriodType.TICK, description="数据周期")
-    start_date: str = Field('', description="开始日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
-    adjust_type: str = Field("none", description="复权类型: none, front, back, front_ratio, back_ratio")
+    start_date: DateStr = Field('', description="开始日期 YYYYMMDD 或 YYYYMMDDHHMMSS")
+    adjust_type: AdjustType = Field("none", description="复权类型: none, front, back, front_ratio, back_ratio")
     subscription_type: SubscriptionType = Field(
         SubscriptionType.QUOTE,
         description="订阅类型"
     )
     
     @field_validator('symbols')
+    @classmethod
     def validate_symbols(cls, v):
-        if not v or len(v) == 0:
+        if not v:
             raise ValueError('股票代码列表不能为空')
-        # 过滤掉空字符串
-        v = [s.strip() for s in v if s and s.strip()]
+        # 去除首尾空白并过滤掉空字符串
+        v = [*filter(None, map(str.strip, v))]
         if not v:
             raise ValueError('股票代码列表不能为空')
         return v
-    
-    @field_validator('start_date')
-    def validate_date_format(cls, v):
-        if v == '':
-            return v
-        if (len(v) != 8 and len(v) != 14) or not v.isdigit():
-            raise ValueError('日期格式必须为YYYYMMDD 或 YYYYMMDDHHMMSS')
-        return v
-    
-    @field_validator('adjust_type')
-    def validate_adjust_type(cls, v):
-        if v not in ["none", "front", "back", "front_ratio", "back_ratio"]:
-            raise ValueError('复权类型必须是 none, front, back, "front_ratio" 或 "back_ratio"')
-        return v
 
 
 class WholeQuoteRequest(BaseModel):
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 
 class AccountType(str, Enum):
@@ -77,21 +77,9 @@ class OrderRequest(BaseModel):
     stock_code: str = Field(..., description="股票代码")
     side: OrderSide = Field(..., description="买卖方向")
     order_type: OrderType = Field(OrderType.LIMIT, description="订单类型")
-    volume: int = Field(..., description="数量")
-    price: Optional[float] = Field(None, description="价格")
+    volume: int = Field(..., gt=0, description="数量（必须大于0）")
+    price: Optional[float] = Field(None, gt=0, description="价格（必须大于0）")
     strategy_name: Optional[str] = Field(None, description="策略名称")
-    
-    @field_validator('volume')
-    def validate_volume(cls, v):
-        if v <= 0:
-            raise ValueError('数量必须大于0')
-        return v
-    
-    @field_validator('price')
-    def validate_price(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError('价格必须大于0')
-        return v
 
 
 class OrderResponse(BaseModel):
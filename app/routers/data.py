@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
 
 from app.config import Settings, get_settings
 from app.dependencies import get_data_service, verify_api_key
@@ -42,17 +44,58 @@ from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/v1/data", tags=["数据服务"])
 
+# 列表接口的序列化器：模块加载时构建一次，由 pydantic-core 直接输出 JSON 字节
+_MARKET_DATA_LIST = TypeAdapter(List[MarketDataResponse])
+_FINANCIAL_DATA_LIST = TypeAdapter(List[FinancialDataResponse])
+_SECTOR_LIST = TypeAdapter(List[SectorResponse])
+
+
+def _dump_models(data):
+    """将 {代码: 模型 / [模型]} 结构转换为普通 dict/list"""
+    if isinstance(data, BaseModel):
+        return data.model_dump()
+    if isinstance(data, dict):
+        return {key: _dump_models(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [item.model_dump() if isinstance(item, BaseModel) else item for item in data]
+    return data
+
+
+def _raw_response(data, message: str) -> ORJSONResponse:
+    """
+    直接返回 ORJSONResponse，用于 tick / Level2 等大批量数据接口
+    
+    模型先用 pydantic-core 的 model_dump 转为 dict，跳过 FastAPI 对返回值的
+    jsonable_encoder 逐字段遍历
+    """
+    return ORJSONResponse(content=format_response(data=_dump_models(data), message=message))
+
+
+def _model_response(result) -> ORJSONResponse:
+    """
+    直接返回模型（或模型列表）的 ORJSONResponse
+    
+    用于声明了 response_model 的接口：response_model 仅用于生成文档，返回 Response 时
+    FastAPI 不会再对服务层已校验过的结果重新校验一遍
+    """
+    return ORJSONResponse(content=_dump_models(result))
+
+
+def _list_response(adapter: TypeAdapter, results) -> Response:
+    """用预构建的 TypeAdapter 一次性序列化模型列表，不经过中间 dict"""
+    return Response(content=adapter.dump_json(results), media_type="application/json")
+
 
 @router.post("/market", response_model=List[MarketDataResponse])
 async def get_market_data(
     request: MarketDataRequest,
     api_key: str = Depends(verify_api_key),
     data_service: DataService = Depends(get_data_service)
-) -> List[MarketDataResponse]:
+):
     """获取市场数据"""
     try:
         results = data_service.get_market_data(request)
-        return results
+        return _list_response(_MARKET_DATA_LIST, results)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -67,11 +110,11 @@ async def get_financial_data(
     request: FinancialDataRequest,
     api_key: str = Depends(verify_api_key),
     data_service: DataService = Depends(get_data_service)
-)-> List[FinancialDataResponse]:
+):
     """获取财务数据"""
     try:
         results = data_service.get_financial_data(request)
-        return results
+        return _list_response(_FINANCIAL_DATA_LIST, results)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -85,11 +128,11 @@ async def get_financial_data(
 async def get_sector_list(
     api_key: str = Depends(verify_api_key),
     data_service: DataService = Depends(get_data_service)
-) -> List[SectorResponse]:
+):
     """获取板块列表"""
     try:
         results = data_service.get_sector_list()
-        return results
+        return _list_response(_SECTOR_LIST, results)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -142,7 +185,7 @@ async def get_index_weight(
     """获取指数权重"""
     try:
         result = data_service.get_index_weight(request)
-        return result
+        return _model_response(result)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -161,7 +204,7 @@ async def get_trading_calendar(
     """获取交易日历"""
     try:
         result = data_service.get_trading_calendar(year)
-        return result
+        return _model_response(result)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -180,7 +223,7 @@ async def get_instrument_info(
     """获取合约信息"""
     try:
         result = data_service.get_instrument_info(stock_code)
-        return result
+        return _model_response(result)
     except DataServiceException as e:
         raise handle_xtquant_exception(e)
     except Exception as e:
@@ -198,7 +241,8 @@ async def get_etf_info(
     """获取ETF信息"""
     try:
         # 这里可以添加获取ETF信息的逻辑
-        return ETFInfoResponse(
+        # 字段均由服务端直接给出，跳过构造时校验（response_model 序列化时仍会校验）
+        return ETFInfoResponse.model_construct(
             etf_code=etf_code,
             etf_name=f"ETF{etf_code}",
             underlying_asset="沪深300",
@@ -339,7 +383,7 @@ async def get_full_tick(
     """获取完整tick数据"""
     try:
         result = data_service.get_full_tick(request)
-        return format_response(data=result, message="获取完整tick数据成功")
+        return _raw_response(result, "获取完整tick数据成功")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -680,7 +724,7 @@ async def get_l2_quote(
     """获取Level2快照数据（10档行情）"""
     try:
         result = data_service.get_l2_quote(request.stock_codes)
-        return format_response(data=result, message="获取Level2快照数据成功")
+        return _raw_response(result, "获取Level2快照数据成功")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -697,7 +741,7 @@ async def get_l2_order(
     """获取Level2逐笔委托数据"""
     try:
         result = data_service.get_l2_order(request.stock_codes)
-        return format_response(data=result, message="获取Level2逐笔委托数据成功")
+        return _raw_response(result, "获取Level2逐笔委托数据成功")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -714,7 +758,7 @@ async def get_l2_transaction(
     """获取Level2逐笔成交数据"""
     try:
         result = data_service.get_l2_transaction(request.stock_codes)
-        return format_response(data=result, message="获取Level2逐笔成交数据成功")
+        return _raw_response(result, "获取Level2逐笔成交数据成功")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
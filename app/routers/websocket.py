@@ -5,6 +5,7 @@ import asyncio
 import json
 from datetime import datetime
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 
 from app.config import Settings, get_settings
@@ -14,6 +15,9 @@ from app.utils.logger import logger
 
 router = APIRouter(tags=["WebSocket"])
 
+# 行情推送序列化选项：兼容非字符串键和 numpy 数值（与 ORJSONResponse 一致）
+_QUOTE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 @router.websocket("/ws/quote/{subscription_id}")
 async def websocket_quote_stream(
@@ -82,12 +86,12 @@ async def websocket_quote_stream(
             # 流式推送行情数据
             async for quote_data in subscription_manager.stream_quotes(subscription_id):
                 try:
-                    # 发送行情数据
-                    await websocket.send_json({
+                    # 发送行情数据：每个 tick 一条消息，用 orjson 序列化，仍以文本帧发送
+                    await websocket.send_text(orjson.dumps({
                         "type": "quote",
                         "data": quote_data,
                         "timestamp": datetime.now().isoformat()
-                    })
+                    }, option=_QUOTE_JSON_OPTIONS).decode())
                 
                 except WebSocketDisconnect:
                     logger.info(f"客户端已断开: {subscription_id}")
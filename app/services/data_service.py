@@ -4,7 +4,7 @@
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from app.utils.logger import logger
 # 添加xtquant包到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -64,6 +64,15 @@ from app.models.data_models import (
 from app.utils.exceptions import DataServiceException
 from app.utils.helpers import validate_stock_code
 
+# xtquant K线数值字段；整数字段在服务层统一转为 int，其余转为 float，
+# 下游（gRPC/REST）可直接使用，无需再次类型转换
+_KLINE_FIELDS = ['open', 'high', 'low', 'close', 'volume', 'amount', 'settle', 'openInterest', 'preClose', 'suspendFlag']
+_KLINE_INT_FIELDS = {'volume', 'openInterest', 'suspendFlag'}
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    """将可选的 xtdata 数值转换为 int，None 保持不变"""
+    return int(value) if value is not None else None
 
 
 class DataService:
@@ -142,8 +151,11 @@ class DataService:
     
     def get_market_data(self, request: MarketDataRequest) -> List[MarketDataResponse]:
         """获取市场数据"""
+        return list(self.iter_market_data(request))
+    
+    def iter_market_data(self, request: MarketDataRequest) -> Iterator[MarketDataResponse]:
+        """按股票逐个生成市场数据，调用方处理完一只股票后即可释放其数据"""
         try:
-            results = []
             for stock_code in request.stock_codes:
                 if not validate_stock_code(stock_code):
                     raise DataServiceException(f"无效的股票代码: {stock_code}")
@@ -211,15 +223,18 @@ class DataService:
                     start_date=request.start_date,
                     end_date=request.end_date
                 )
-                results.append(response)
-            
-            return results
+                yield response
             
         except Exception as e:
             raise DataServiceException(f"获取市场数据失败: {str(e)}")
     
-    def get_financial_data(self, request: FinancialDataRequest) -> List[FinancialDataResponse]:
-        """获取财务数据"""
+    def get_financial_data(self, request: FinancialDataRequest, as_str: bool = False) -> List[FinancialDataResponse]:
+        """获取财务数据
+
+        Args:
+            request: 财务数据请求
+            as_str: 是否将字段值统一转换为字符串（gRPC map<string, string> 使用）
+        """
         logger.debug("获取财务数据请求:")
         logger.debug(f"股票代码: {request.stock_codes}")
         logger.debug(f"表名: {request.table_list}")
@@ -246,7 +261,7 @@ class DataService:
                             
                             # 转换数据格式
                             # xtdata返回格式: {stock_code: {table_name: DataFrame}}
-                            formatted_data = self._format_financial_data(data, stock_code, table_name)
+                            formatted_data = self._format_financial_data(data, stock_code, table_name, as_str)
                             logger.debug(f"格式化后数据条数: {len(formatted_data)}")
                             
                         except Exception as e:
@@ -256,6 +271,10 @@ class DataService:
                     else:
                         # 使用模拟数据（仅mock模式）
                         formatted_data = self._get_mock_financial_data(stock_code, table_name)
+                        if as_str:
+                            formatted_data = [
+                                {k: str(v) for k, v in item.items()} for item in formatted_data
+                            ]
                     
                     response = FinancialDataResponse(
                         stock_code=stock_code,
@@ -548,13 +567,13 @@ class DataService:
                         record['time'] = str(date)
                     
                     # 添加其他字段 (包含xtquant所有K线字段)
-                    for field in ['open', 'high', 'low', 'close', 'volume', 'amount', 'settle', 'openInterest', 'preClose', 'suspendFlag']:
+                    for field in _KLINE_FIELDS:
                         if field in data:
                             try:
                                 value = data[field].loc[stock_code, date]
                                 # 转换为Python原生类型
                                 if hasattr(value, 'item'):  # numpy类型
-                                    if field in ['volume', 'openInterest', 'suspendFlag']:
+                                    if field in _KLINE_INT_FIELDS:
                                         record[field] = int(value)
                                     else:
                                         record[field] = float(value)
@@ -583,6 +602,18 @@ class DataService:
             # 重置索引，将时间索引变成列
             df_reset = df.reset_index()
             
+            # 按列一次性统一数值类型，to_dict 后即为 Python 原生 int/float
+            dtypes = {
+                field: 'int64' if field in _KLINE_INT_FIELDS else 'float64'
+                for field in _KLINE_FIELDS if field in df_reset.columns
+            }
+            # 缺失K线、非期货的 openInterest 等会出现 NaN，整数列先补 0 再转换，
+            # 否则 astype 抛出 IntCastingNaNError 导致整只股票数据丢失
+            int_fields = [field for field, dtype in dtypes.items() if dtype == 'int64']
+            if int_fields:
+                df_reset[int_fields] = df_reset[int_fields].fillna(0)
+            df_reset = df_reset.astype(dtypes)
+            
             # 转换为字典列表
             records = df_reset.to_dict('records')
             
@@ -597,17 +628,9 @@ class DataService:
                     formatted_item['time'] = str(record['index'])
                 
                 # 处理所有K线数据字段（与_format_market_data保持一致）
-                for field in ['open', 'high', 'low', 'close', 'volume', 'amount', 'settle', 'openInterest', 'preClose', 'suspendFlag']:
+                for field in _KLINE_FIELDS:
                     if field in record:
-                        value = record[field]
-                        # 转换为Python原生类型
-                        if hasattr(value, 'item'):  # numpy类型
-                            if field in ['volume', 'openInterest', 'suspendFlag']:
-                                formatted_item[field] = int(value)
-                            else:
-                                formatted_item[field] = float(value)
-                        else:
-                            formatted_item[field] = value
+                        formatted_item[field] = record[field]
                 
                 formatted_data.append(formatted_item)
             
@@ -618,9 +641,10 @@ class DataService:
             logger.exception(e)
             return []
     
-    def _format_financial_data(self, data: Any, stock_code: str, table_name: str) -> List[Dict[str, Any]]:
+    def _format_financial_data(self, data: Any, stock_code: str, table_name: str, as_str: bool = False) -> List[Dict[str, Any]]:
         """格式化财务数据
         xtdata返回格式: {stock_code: {table_name: DataFrame}}
+        as_str为True时按列整体转换为字符串，避免逐值调用str()
         """
         if not data:
             return []
@@ -645,6 +669,9 @@ class DataService:
                             
                             # 重置索引，将索引变成列
                             df_reset = df.reset_index()
+                            if as_str:
+                                # 按列向量化转换为字符串，直接返回
+                                return df_reset.astype(str).to_dict('records')
                             records = df_reset.to_dict('records')
                             
                             formatted_data = []
@@ -1539,6 +1566,9 @@ class DataService:
         try:
             if self._should_use_real_data():
                 try:
+                    # gRPC 直接传入 protobuf 容器，仅在交给 xtdata 时转换一次
+                    if not isinstance(stock_list, list):
+                        stock_list = list(stock_list)
                     xtdata.add_sector(sector_name=sector_name, stock_list=stock_list)
                     return True
                 except Exception as e:
@@ -1554,6 +1584,8 @@ class DataService:
         try:
             if self._should_use_real_data():
                 try:
+                    if not isinstance(stock_list, list):
+                        stock_list = list(stock_list)
                     result = xtdata.remove_stock_from_sector(
                         sector_name=sector_name,
                         stock_list=stock_list
@@ -1587,6 +1619,8 @@ class DataService:
         try:
             if self._should_use_real_data():
                 try:
+                    if not isinstance(stock_list, list):
+                        stock_list = list(stock_list)
                     result = xtdata.reset_sector(
                         sector_name=sector_name,
                         stock_list=stock_list
@@ -1678,14 +1712,15 @@ class DataService:
                             order_list = []
                             
                             if hasattr(orders, '__iter__'):
+                                # 逐笔数据量大，所有字段在此显式转换类型后跳过 pydantic 逐行校验
                                 for order in orders:
-                                    order_list.append(L2OrderData(
+                                    order_list.append(L2OrderData.model_construct(
                                         time=str(order.get('time', '')),
                                         price=float(order.get('price', 0)),
                                         volume=int(order.get('volume', 0)),
-                                        entrust_no=order.get('entrustNo'),
-                                        entrust_type=order.get('entrustType'),
-                                        entrust_direction=order.get('entrustDirection')
+                                        entrust_no=_optional_int(order.get('entrustNo')),
+                                        entrust_type=_optional_int(order.get('entrustType')),
+                                        entrust_direction=_optional_int(order.get('entrustDirection'))
                                     ))
                             results[stock_code] = order_list
                     return results
@@ -1700,7 +1735,7 @@ class DataService:
                         time=datetime.now().strftime("%Y%m%d%H%M%S"),
                         price=100.0,
                         volume=1000,
-                        entrust_no="123456",
+                        entrust_no=123456,
                         entrust_type=1,
                         entrust_direction=1
                     )
@@ -1709,6 +1744,11 @@ class DataService:
         except Exception as e:
             raise DataServiceException(f"获取Level2委托失败: {str(e)}")
     
+    def iter_l2_order(self, stock_codes: List[str]) -> Iterator[Tuple[str, List[L2OrderData]]]:
+        """按股票逐个获取Level2逐笔委托，调用方处理完一只股票后即可释放其数据"""
+        for stock_code in stock_codes:
+            yield from self.get_l2_order([stock_code]).items()
+    
     def get_l2_transaction(self, stock_codes: List[str]) -> Dict[str, List[L2TransactionData]]:
         """获取Level2逐笔成交数据 - 支持多标的"""
         try:
@@ -1728,17 +1768,18 @@ class DataService:
                             trans_list = []
                             
                             if hasattr(transactions, '__iter__'):
+                                # 逐笔数据量大，所有字段在此显式转换类型后跳过 pydantic 逐行校验
                                 for trans in transactions:
-                                    trans_list.append(L2TransactionData(
+                                    trans_list.append(L2TransactionData.model_construct(
                                         time=str(trans.get('time', '')),
                                         price=float(trans.get('price', 0)),
                                         volume=int(trans.get('volume', 0)),
                                         amount=float(trans.get('amount', 0)),
-                                        trade_index=trans.get('tradeIndex'),
-                                        buy_no=trans.get('buyNo'),
-                                        sell_no=trans.get('sellNo'),
-                                        trade_type=trans.get('tradeType'),
-                                        trade_flag=trans.get('tradeFlag')
+                                        trade_index=_optional_int(trans.get('tradeIndex')),
+                                        buy_no=_optional_int(trans.get('buyNo')),
+                                        sell_no=_optional_int(trans.get('sellNo')),
+                                        trade_type=_optional_int(trans.get('tradeType')),
+                                        trade_flag=_optional_int(trans.get('tradeFlag'))
                                     ))
                             results[stock_code] = trans_list
                     return results
@@ -1754,9 +1795,9 @@ class DataService:
                         price=100.0,
                         volume=1000,
                         amount=100000.0,
-                        trade_index="1",
-                        buy_no="B123",
-                        sell_no="S456",
+                        trade_index=1,
+                        buy_no=123,
+                        sell_no=456,
                         trade_type=1,
                         trade_flag=1
                     )
@@ -1764,3 +1805,8 @@ class DataService:
             return results
         except Exception as e:
             raise DataServiceException(f"获取Level2成交失败: {str(e)}")
+    
+    def iter_l2_transaction(self, stock_codes: List[str]) -> Iterator[Tuple[str, List[L2TransactionData]]]:
+        """按股票逐个获取Level2逐笔成交，调用方处理完一只股票后即可释放其数据"""
+        for stock_code in stock_codes:
+            yield from self.get_l2_transaction([stock_code]).items()
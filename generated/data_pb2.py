@@ -26,7 +26,7 @@ from generated import common_pb2 as common__pb2
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ndata.proto\x12\x08qmt.data\x1a\x0c\x63ommon.proto\x1a\x1bgoogle/protobuf/empty.proto\"\x9b\x01\n\x11MarketDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12&\n\x06period\x18\x04 \x01(\x0e\x32\x16.qmt.common.PeriodType\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x06 \x01(\t\"p\n\x08KlineBar\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x0c\n\x04open\x18\x02 \x01(\x01\x12\x0c\n\x04high\x18\x03 \x01(\x01\x12\x0b\n\x03low\x18\x04 \x01(\x01\x12\r\n\x05\x63lose\x18\x05 \x01(\x01\x12\x0e\n\x06volume\x18\x06 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\"\xb4\x01\n\x12MarketDataResponse\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12 \n\x04\x62\x61rs\x18\x02 \x03(\x0b\x32\x12.qmt.data.KlineBar\x12\x0e\n\x06\x66ields\x18\x03 \x03(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\"\n\x06status\x18\x07 \x01(\x0b\x32\x12.qmt.common.Status\"i\n\x17MarketDataBatchResponse\x12*\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.qmt.data.MarketDataResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"e\n\x14\x46inancialDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\ntable_list\x18\x02 \x03(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"y\n\x10\x46inancialDataRow\x12\x36\n\x06\x66ields\x18\x01 \x03(\x0b\x32&.qmt.data.FinancialDataRow.FieldsEntry\x1a-\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x9e\x01\n\x15\x46inancialDataResponse\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x12\n\ntable_name\x18\x02 \x01(\t\x12(\n\x04rows\x18\x03 \x03(\x0b\x32\x1a.qmt.data.FinancialDataRow\x12\x0f\n\x07\x63olumns\x18\x04 \x03(\t\x12\"\n\x06status\x18\x05 \x01(\x0b\x32\x12.qmt.common.Status\"o\n\x1a\x46inancialDataBatchResponse\x12-\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1f.qmt.data.FinancialDataResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"J\n\nSectorInfo\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\x12\x13\n\x0bsector_type\x18\x03 \x01(\t\"_\n\x12SectorListResponse\x12%\n\x07sectors\x18\x01 \x03(\x0b\x32\x14.qmt.data.SectorInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"6\n\x12IndexWeightRequest\x12\x12\n\nindex_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\"I\n\x0f\x43omponentWeight\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x0e\n\x06weight\x18\x02 \x01(\x01\x12\x12\n\nmarket_cap\x18\x03 \x01(\x01\"\x87\x01\n\x13IndexWeightResponse\x12\x12\n\nindex_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12*\n\x07weights\x18\x03 \x03(\x0b\x32\x19.qmt.data.ComponentWeight\x12\"\n\x06status\x18\x04 \x01(\x0b\x32\x12.qmt.common.Status\"&\n\x16TradingCalendarRequest\x12\x0c\n\x04year\x18\x01 \x01(\x05\"t\n\x17TradingCalendarResponse\x12\x15\n\rtrading_dates\x18\x01 \x03(\t\x12\x10\n\x08holidays\x18\x02 \x03(\t\x12\x0c\n\x04year\x18\x03 \x01(\x05\x12\"\n\x06status\x18\x04 \x01(\x0b\x32\x12.qmt.common.Status\"+\n\x15InstrumentInfoRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"\xc4\x01\n\x16InstrumentInfoResponse\x12\x17\n\x0finstrument_code\x18\x01 \x01(\t\x12\x17\n\x0finstrument_name\x18\x02 \x01(\t\x12\x13\n\x0bmarket_type\x18\x03 \x01(\t\x12\x17\n\x0finstrument_type\x18\x04 \x01(\t\x12\x11\n\tlist_date\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65list_date\x18\x06 \x01(\t\x12\"\n\x06status\x18\x07 \x01(\x0b\x32\x12.qmt.common.Status\"\"\n\x0e\x45TFInfoRequest\x12\x10\n\x08\x65tf_code\x18\x01 \x01(\t\"\xa3\x01\n\x0f\x45TFInfoResponse\x12\x10\n\x08\x65tf_code\x18\x01 \x01(\t\x12\x10\n\x08\x65tf_name\x18\x02 \x01(\t\x12\x18\n\x10underlying_asset\x18\x03 \x01(\t\x12\x15\n\rcreation_unit\x18\x04 \x01(\x03\x12\x17\n\x0fredemption_unit\x18\x05 \x01(\x03\x12\"\n\x06status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\"\x90\x01\n\x12InstrumentTypeInfo\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x01(\x08\x12\r\n\x05stock\x18\x03 \x01(\x08\x12\x0c\n\x04\x66und\x18\x04 \x01(\x08\x12\x0b\n\x03\x65tf\x18\x05 \x01(\x08\x12\x0c\n\x04\x62ond\x18\x06 \x01(\x08\x12\x0e\n\x06option\x18\x07 \x01(\x08\x12\x0f\n\x07\x66utures\x18\x08 \x01(\x08\"+\n\x15InstrumentTypeRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"h\n\x16InstrumentTypeResponse\x12*\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x1c.qmt.data.InstrumentTypeInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"K\n\x13HolidayInfoResponse\x12\x10\n\x08holidays\x18\x01 \x03(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\xb6\x03\n\x13\x43onvertibleBondInfo\x12\x11\n\tbond_code\x18\x01 \x01(\t\x12\x11\n\tbond_name\x18\x02 \x01(\t\x12\x12\n\nstock_code\x18\x03 \x01(\t\x12\x12\n\nstock_name\x18\x04 \x01(\t\x12\x18\n\x10\x63onversion_price\x18\x05 \x01(\x01\x12\x18\n\x10\x63onversion_value\x18\x06 \x01(\x01\x12\x1f\n\x17\x63onversion_premium_rate\x18\x07 \x01(\x01\x12\x15\n\rcurrent_price\x18\x08 \x01(\x01\x12\x11\n\tpar_value\x18\t \x01(\x01\x12\x11\n\tlist_date\x18\n \x01(\t\x12\x15\n\rmaturity_date\x18\x0b \x01(\t\x12\x1d\n\x15\x63onversion_begin_date\x18\x0c \x01(\t\x12\x1b\n\x13\x63onversion_end_date\x18\r \x01(\t\x12<\n\x08raw_data\x18\x0e \x03(\x0b\x32*.qmt.data.ConvertibleBondInfo.RawDataEntry\x1a.\n\x0cRawDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"o\n\x1b\x43onvertibleBondListResponse\x12,\n\x05\x62onds\x18\x01 \x03(\x0b\x32\x1d.qmt.data.ConvertibleBondInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\x9d\x03\n\x07IpoInfo\x12\x15\n\rsecurity_code\x18\x01 \x01(\t\x12\x11\n\tcode_name\x18\x02 \x01(\t\x12\x0e\n\x06market\x18\x03 \x01(\t\x12\x15\n\ract_issue_qty\x18\x04 \x01(\x03\x12\x18\n\x10online_issue_qty\x18\x05 \x01(\x03\x12\x17\n\x0fonline_sub_code\x18\x06 \x01(\t\x12\x1a\n\x12online_sub_max_qty\x18\x07 \x01(\x03\x12\x15\n\rpublish_price\x18\x08 \x01(\x01\x12\x11\n\tis_profit\x18\t \x01(\x05\x12\x13\n\x0bindustry_pe\x18\n \x01(\x01\x12\x10\n\x08\x61\x66ter_pe\x18\x0b \x01(\x01\x12\x16\n\x0esubscribe_date\x18\x0c \x01(\t\x12\x14\n\x0clottery_date\x18\r \x01(\t\x12\x11\n\tlist_date\x18\x0e \x01(\t\x12\x30\n\x08raw_data\x18\x0f \x03(\x0b\x32\x1e.qmt.data.IpoInfo.RawDataEntry\x1a.\n\x0cRawDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"Z\n\x13IpoInfoListResponse\x12\x1f\n\x04ipos\x18\x01 \x03(\x0b\x32\x11.qmt.data.IpoInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"I\n\x12PeriodListResponse\x12\x0f\n\x07periods\x18\x01 \x03(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"G\n\x0f\x44\x61taDirResponse\x12\x10\n\x08\x64\x61ta_dir\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"]\n\x10LocalDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\"\xb2\x01\n\x11LocalDataResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32%.qmt.data.LocalDataResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x44\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineDataList:\x02\x38\x01\"1\n\rKlineDataList\x12 \n\x04\x62\x61rs\x18\x01 \x03(\x0b\x32\x12.qmt.data.KlineBar\"\xc2\x02\n\x08TickData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x12\n\nlast_price\x18\x02 \x01(\x01\x12\x0c\n\x04open\x18\x03 \x01(\x01\x12\x0c\n\x04high\x18\x04 \x01(\x01\x12\x0b\n\x03low\x18\x05 \x01(\x01\x12\x12\n\nlast_close\x18\x06 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\x12\x0e\n\x06volume\x18\x08 \x01(\x03\x12\x0f\n\x07pvolume\x18\t \x01(\x03\x12\x14\n\x0cstock_status\x18\n \x01(\x05\x12\x10\n\x08open_int\x18\x0b \x01(\x05\x12\x1d\n\x15last_settlement_price\x18\x0c \x01(\x01\x12\x11\n\task_price\x18\r \x03(\x01\x12\x11\n\tbid_price\x18\x0e \x03(\x01\x12\x0f\n\x07\x61sk_vol\x18\x0f \x03(\x05\x12\x0f\n\x07\x62id_vol\x18\x10 \x03(\x05\x12\x17\n\x0ftransaction_num\x18\x11 \x01(\x05\"L\n\x0f\x46ullTickRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xaf\x01\n\x10\x46ullTickResponse\x12\x32\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32$.qmt.data.FullTickResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x43\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.qmt.data.TickDataList:\x02\x38\x01\"1\n\x0cTickDataList\x12!\n\x05ticks\x18\x01 \x03(\x0b\x32\x12.qmt.data.TickData\"\x9c\x01\n\x0e\x44ividendFactor\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x10\n\x08interest\x18\x02 \x01(\x01\x12\x13\n\x0bstock_bonus\x18\x03 \x01(\x01\x12\x12\n\nstock_gift\x18\x04 \x01(\x01\x12\x11\n\tallot_num\x18\x05 \x01(\x01\x12\x13\n\x0b\x61llot_price\x18\x06 \x01(\x01\x12\r\n\x05gugai\x18\x07 \x01(\x05\x12\n\n\x02\x64r\x18\x08 \x01(\x01\")\n\x13\x44ividFactorsRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"e\n\x14\x44ividFactorsResponse\x12)\n\x07\x66\x61\x63tors\x18\x01 \x03(\x0b\x32\x18.qmt.data.DividendFactor\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"]\n\x10\x46ullKlineRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\"\xb2\x01\n\x11\x46ullKlineResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32%.qmt.data.FullKlineResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x44\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineDataList:\x02\x38\x01\"}\n\x1a\x44ownloadHistoryDataRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t\x12\x15\n\rincrementally\x18\x05 \x01(\x08\"k\n\x1f\x44ownloadHistoryDataBatchRequest\x12\x12\n\nstock_list\x18\x01 \x03(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t\"\xd4\x01\n\x10\x44ownloadResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12,\n\x06status\x18\x02 \x01(\x0e\x32\x1c.qmt.data.DownloadTaskStatus\x12\x10\n\x08progress\x18\x03 \x01(\x01\x12\r\n\x05total\x18\x04 \x01(\x05\x12\x10\n\x08\x66inished\x18\x05 \x01(\x05\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\x15\n\rcurrent_stock\x18\x07 \x01(\t\x12&\n\nrpc_status\x18\x08 \x01(\x0b\x32\x12.qmt.common.Status\"l\n\x1c\x44ownloadFinancialDataRequest\x12\x12\n\nstock_list\x18\x01 \x03(\t\x12\x12\n\ntable_list\x18\x02 \x03(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"0\n\x1a\x44ownloadIndexWeightRequest\x12\x12\n\nindex_code\x18\x01 \x01(\t\"1\n\x1f\x44ownloadHistoryContractsRequest\x12\x0e\n\x06market\x18\x01 \x01(\t\"X\n\x19\x43reateSectorFolderRequest\x12\x13\n\x0bparent_node\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"V\n\x1a\x43reateSectorFolderResponse\x12\x14\n\x0c\x63reated_name\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"R\n\x13\x43reateSectorRequest\x12\x13\n\x0bparent_node\x18\x01 \x01(\t\x12\x13\n\x0bsector_name\x18\x02 \x01(\t\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"P\n\x14\x43reateSectorResponse\x12\x14\n\x0c\x63reated_name\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\";\n\x10\x41\x64\x64SectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"7\n\x11\x41\x64\x64SectorResponse\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.qmt.common.Status\"G\n\x1cRemoveStockFromSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"T\n\x1dRemoveStockFromSectorResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"*\n\x13RemoveSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\":\n\x14RemoveSectorResponse\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.qmt.common.Status\"=\n\x12ResetSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"J\n\x13ResetSectorResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\xeb\x02\n\x0bL2QuoteData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x12\n\nlast_price\x18\x02 \x01(\x01\x12\x0c\n\x04open\x18\x03 \x01(\x01\x12\x0c\n\x04high\x18\x04 \x01(\x01\x12\x0b\n\x03low\x18\x05 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x06 \x01(\x01\x12\x0e\n\x06volume\x18\x07 \x01(\x03\x12\x0f\n\x07pvolume\x18\x08 \x01(\x03\x12\x10\n\x08open_int\x18\t \x01(\x05\x12\x14\n\x0cstock_status\x18\n \x01(\x05\x12\x17\n\x0ftransaction_num\x18\x0b \x01(\x05\x12\x12\n\nlast_close\x18\x0c \x01(\x01\x12\x1d\n\x15last_settlement_price\x18\r \x01(\x01\x12\x18\n\x10settlement_price\x18\x0e \x01(\x01\x12\n\n\x02pe\x18\x0f \x01(\x01\x12\x11\n\task_price\x18\x10 \x03(\x01\x12\x11\n\tbid_price\x18\x11 \x03(\x01\x12\x0f\n\x07\x61sk_vol\x18\x12 \x03(\x05\x12\x0f\n\x07\x62id_vol\x18\x13 \x03(\x05\"K\n\x0eL2QuoteRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xb0\x01\n\x0fL2QuoteResponse\x12\x31\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32#.qmt.data.L2QuoteResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x46\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.qmt.data.L2QuoteDataList:\x02\x38\x01\"8\n\x0fL2QuoteDataList\x12%\n\x06quotes\x18\x01 \x03(\x0b\x32\x15.qmt.data.L2QuoteData\"\x7f\n\x0bL2OrderData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x05\x12\x12\n\nentrust_no\x18\x04 \x01(\x03\x12\x14\n\x0c\x65ntrust_type\x18\x05 \x01(\x05\x12\x19\n\x11\x65ntrust_direction\x18\x06 \x01(\x05\"K\n\x0eL2OrderRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xb0\x01\n\x0fL2OrderResponse\x12\x31\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32#.qmt.data.L2OrderResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x46\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.qmt.data.L2OrderDataList:\x02\x38\x01\"8\n\x0fL2OrderDataList\x12%\n\x06orders\x18\x01 \x03(\x0b\x32\x15.qmt.data.L2OrderData\"\xae\x01\n\x11L2TransactionData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x05\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12\x13\n\x0btrade_index\x18\x05 \x01(\x03\x12\x0e\n\x06\x62uy_no\x18\x06 \x01(\x03\x12\x0f\n\x07sell_no\x18\x07 \x01(\x03\x12\x12\n\ntrade_type\x18\x08 \x01(\x05\x12\x12\n\ntrade_flag\x18\t \x01(\x05\"Q\n\x14L2TransactionRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xc2\x01\n\x15L2TransactionResponse\x12\x37\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32).qmt.data.L2TransactionResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1aL\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12.\n\x05value\x18\x02 \x01(\x0b\x32\x1f.qmt.data.L2TransactionDataList:\x02\x38\x01\"J\n\x15L2TransactionDataList\x12\x31\n\x0ctransactions\x18\x01 \x03(\x0b\x32\x1b.qmt.data.L2TransactionData\"r\n\x13SubscriptionRequest\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x02 \x01(\t\x12\x35\n\x11subscription_type\x18\x03 \x01(\x0e\x32\x1a.qmt.data.SubscriptionType\"$\n\x11WholeQuoteRequest\x12\x0f\n\x07markets\x18\x01 \x03(\t\"\xa7\x01\n\x14SubscriptionResponse\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\x12\x0f\n\x07symbols\x18\x04 \x03(\t\x12\x19\n\x11subscription_type\x18\x05 \x01(\t\x12&\n\nrpc_status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\"-\n\x12UnsubscribeRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\"[\n\x13UnsubscribeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"\xfb\x01\n\x0bQuoteUpdate\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x12\n\nlast_price\x18\x03 \x01(\x01\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\x0c\n\x04high\x18\x05 \x01(\x01\x12\x0b\n\x03low\x18\x06 \x01(\x01\x12\r\n\x05\x63lose\x18\x07 \x01(\x01\x12\x0e\n\x06volume\x18\x08 \x01(\x03\x12\x0e\n\x06\x61mount\x18\t \x01(\x01\x12\x11\n\tpre_close\x18\n \x01(\x01\x12\x11\n\tbid_price\x18\x0b \x03(\x01\x12\x11\n\task_price\x18\x0c \x03(\x01\x12\x0f\n\x07\x62id_vol\x18\r \x03(\x05\x12\x0f\n\x07\x61sk_vol\x18\x0e \x03(\x05\"2\n\x17SubscriptionInfoRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\"\xe8\x01\n\x18SubscriptionInfoResponse\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x03 \x01(\t\x12\x19\n\x11subscription_type\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x16\n\x0elast_heartbeat\x18\x06 \x01(\t\x12\x0e\n\x06\x61\x63tive\x18\x07 \x01(\x08\x12\x12\n\nqueue_size\x18\x08 \x01(\x05\x12\"\n\x06status\x18\t \x01(\x0b\x32\x12.qmt.common.Status\"y\n\x18SubscriptionListResponse\x12\x39\n\rsubscriptions\x18\x01 \x03(\x0b\x32\".qmt.data.SubscriptionInfoResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status*m\n\x12\x44ownloadTaskStatus\x12\x14\n\x10\x44OWNLOAD_PENDING\x10\x00\x12\x14\n\x10\x44OWNLOAD_RUNNING\x10\x01\x12\x16\n\x12\x44OWNLOAD_COMPLETED\x10\x02\x12\x13\n\x0f\x44OWNLOAD_FAILED\x10\x03*H\n\x10SubscriptionType\x12\x16\n\x12SUBSCRIPTION_QUOTE\x10\x00\x12\x1c\n\x18SUBSCRIPTION_WHOLE_QUOTE\x10\x01\x32\xf8\x19\n\x0b\x44\x61taService\x12O\n\rGetMarketData\x12\x1b.qmt.data.MarketDataRequest\x1a!.qmt.data.MarketDataBatchResponse\x12X\n\x10GetFinancialData\x12\x1e.qmt.data.FinancialDataRequest\x1a$.qmt.data.FinancialDataBatchResponse\x12\x45\n\rGetSectorList\x12\x16.google.protobuf.Empty\x1a\x1c.qmt.data.SectorListResponse\x12M\n\x0eGetIndexWeight\x12\x1c.qmt.data.IndexWeightRequest\x1a\x1d.qmt.data.IndexWeightResponse\x12Y\n\x12GetTradingCalendar\x12 .qmt.data.TradingCalendarRequest\x1a!.qmt.data.TradingCalendarResponse\x12V\n\x11GetInstrumentInfo\x12\x1f.qmt.data.InstrumentInfoRequest\x1a .qmt.data.InstrumentInfoResponse\x12\x41\n\nGetETFInfo\x12\x18.qmt.data.ETFInfoRequest\x1a\x19.qmt.data.ETFInfoResponse\x12V\n\x11GetInstrumentType\x12\x1f.qmt.data.InstrumentTypeRequest\x1a .qmt.data.InstrumentTypeResponse\x12\x44\n\x0bGetHolidays\x12\x16.google.protobuf.Empty\x1a\x1d.qmt.data.HolidayInfoResponse\x12W\n\x16GetConvertibleBondInfo\x12\x16.google.protobuf.Empty\x1a%.qmt.data.ConvertibleBondListResponse\x12\x43\n\nGetIpoInfo\x12\x16.google.protobuf.Empty\x1a\x1d.qmt.data.IpoInfoListResponse\x12\x45\n\rGetPeriodList\x12\x16.google.protobuf.Empty\x1a\x1c.qmt.data.PeriodListResponse\x12?\n\nGetDataDir\x12\x16.google.protobuf.Empty\x1a\x19.qmt.data.DataDirResponse\x12G\n\x0cGetLocalData\x12\x1a.qmt.data.LocalDataRequest\x1a\x1b.qmt.data.LocalDataResponse\x12\x44\n\x0bGetFullTick\x12\x19.qmt.data.FullTickRequest\x1a\x1a.qmt.data.FullTickResponse\x12P\n\x0fGetDividFactors\x12\x1d.qmt.data.DividFactorsRequest\x1a\x1e.qmt.data.DividFactorsResponse\x12G\n\x0cGetFullKline\x12\x1a.qmt.data.FullKlineRequest\x1a\x1b.qmt.data.FullKlineResponse\x12W\n\x13\x44ownloadHistoryData\x12$.qmt.data.DownloadHistoryDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12\x61\n\x18\x44ownloadHistoryDataBatch\x12).qmt.data.DownloadHistoryDataBatchRequest\x1a\x1a.qmt.data.DownloadResponse\x12[\n\x15\x44ownloadFinancialData\x12&.qmt.data.DownloadFinancialDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12`\n\x1a\x44ownloadFinancialDataBatch\x12&.qmt.data.DownloadFinancialDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12H\n\x12\x44ownloadSectorData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12W\n\x13\x44ownloadIndexWeight\x12$.qmt.data.DownloadIndexWeightRequest\x1a\x1a.qmt.data.DownloadResponse\x12\x44\n\x0e\x44ownloadCBData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12\x45\n\x0f\x44ownloadETFInfo\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12I\n\x13\x44ownloadHolidayData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12\x61\n\x18\x44ownloadHistoryContracts\x12).qmt.data.DownloadHistoryContractsRequest\x1a\x1a.qmt.data.DownloadResponse\x12_\n\x12\x43reateSectorFolder\x12#.qmt.data.CreateSectorFolderRequest\x1a$.qmt.data.CreateSectorFolderResponse\x12M\n\x0c\x43reateSector\x12\x1d.qmt.data.CreateSectorRequest\x1a\x1e.qmt.data.CreateSectorResponse\x12\x44\n\tAddSector\x12\x1a.qmt.data.AddSectorRequest\x1a\x1b.qmt.data.AddSectorResponse\x12h\n\x15RemoveStockFromSector\x12&.qmt.data.RemoveStockFromSectorRequest\x1a\'.qmt.data.RemoveStockFromSectorResponse\x12M\n\x0cRemoveSector\x12\x1d.qmt.data.RemoveSectorRequest\x1a\x1e.qmt.data.RemoveSectorResponse\x12J\n\x0bResetSector\x12\x1c.qmt.data.ResetSectorRequest\x1a\x1d.qmt.data.ResetSectorResponse\x12\x41\n\nGetL2Quote\x12\x18.qmt.data.L2QuoteRequest\x1a\x19.qmt.data.L2QuoteResponse\x12\x41\n\nGetL2Order\x12\x18.qmt.data.L2OrderRequest\x1a\x19.qmt.data.L2OrderResponse\x12S\n\x10GetL2Transaction\x12\x1e.qmt.data.L2TransactionRequest\x1a\x1f.qmt.data.L2TransactionResponse\x12H\n\x0eSubscribeQuote\x12\x1d.qmt.data.SubscriptionRequest\x1a\x15.qmt.data.QuoteUpdate0\x01\x12K\n\x13SubscribeWholeQuote\x12\x1b.qmt.data.WholeQuoteRequest\x1a\x15.qmt.data.QuoteUpdate0\x01\x12O\n\x10UnsubscribeQuote\x12\x1c.qmt.data.UnsubscribeRequest\x1a\x1d.qmt.data.UnsubscribeResponse\x12\\\n\x13GetSubscriptionInfo\x12!.qmt.data.SubscriptionInfoRequest\x1a\".qmt.data.SubscriptionInfoResponse\x12O\n\x11ListSubscriptions\x12\x16.google.protobuf.Empty\x1a\".qmt.data.SubscriptionListResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ndata.proto\x12\x08qmt.data\x1a\x0c\x63ommon.proto\x1a\x1bgoogle/protobuf/empty.proto\"\x9b\x01\n\x11MarketDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12&\n\x06period\x18\x04 \x01(\x0e\x32\x16.qmt.common.PeriodType\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x06 \x01(\t\"p\n\x08KlineBar\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x0c\n\x04open\x18\x02 \x01(\x01\x12\x0c\n\x04high\x18\x03 \x01(\x01\x12\x0b\n\x03low\x18\x04 \x01(\x01\x12\r\n\x05\x63lose\x18\x05 \x01(\x01\x12\x0e\n\x06volume\x18\x06 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\"\xb4\x01\n\x12MarketDataResponse\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12 \n\x04\x62\x61rs\x18\x02 \x03(\x0b\x32\x12.qmt.data.KlineBar\x12\x0e\n\x06\x66ields\x18\x03 \x03(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\"\n\x06status\x18\x07 \x01(\x0b\x32\x12.qmt.common.Status\"i\n\x17MarketDataBatchResponse\x12*\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.qmt.data.MarketDataResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"e\n\x14\x46inancialDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\ntable_list\x18\x02 \x03(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"y\n\x10\x46inancialDataRow\x12\x36\n\x06\x66ields\x18\x01 \x03(\x0b\x32&.qmt.data.FinancialDataRow.FieldsEntry\x1a-\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x9e\x01\n\x15\x46inancialDataResponse\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x12\n\ntable_name\x18\x02 \x01(\t\x12(\n\x04rows\x18\x03 \x03(\x0b\x32\x1a.qmt.data.FinancialDataRow\x12\x0f\n\x07\x63olumns\x18\x04 \x03(\t\x12\"\n\x06status\x18\x05 \x01(\x0b\x32\x12.qmt.common.Status\"o\n\x1a\x46inancialDataBatchResponse\x12-\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1f.qmt.data.FinancialDataResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"J\n\nSectorInfo\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\x12\x13\n\x0bsector_type\x18\x03 \x01(\t\"_\n\x12SectorListResponse\x12%\n\x07sectors\x18\x01 \x03(\x0b\x32\x14.qmt.data.SectorInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"6\n\x12IndexWeightRequest\x12\x12\n\nindex_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\"I\n\x0f\x43omponentWeight\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x0e\n\x06weight\x18\x02 \x01(\x01\x12\x12\n\nmarket_cap\x18\x03 \x01(\x01\"\x87\x01\n\x13IndexWeightResponse\x12\x12\n\nindex_code\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12*\n\x07weights\x18\x03 \x03(\x0b\x32\x19.qmt.data.ComponentWeight\x12\"\n\x06status\x18\x04 \x01(\x0b\x32\x12.qmt.common.Status\"&\n\x16TradingCalendarRequest\x12\x0c\n\x04year\x18\x01 \x01(\x05\"t\n\x17TradingCalendarResponse\x12\x15\n\rtrading_dates\x18\x01 \x03(\t\x12\x10\n\x08holidays\x18\x02 \x03(\t\x12\x0c\n\x04year\x18\x03 \x01(\x05\x12\"\n\x06status\x18\x04 \x01(\x0b\x32\x12.qmt.common.Status\"+\n\x15InstrumentInfoRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"\xc4\x01\n\x16InstrumentInfoResponse\x12\x17\n\x0finstrument_code\x18\x01 \x01(\t\x12\x17\n\x0finstrument_name\x18\x02 \x01(\t\x12\x13\n\x0bmarket_type\x18\x03 \x01(\t\x12\x17\n\x0finstrument_type\x18\x04 \x01(\t\x12\x11\n\tlist_date\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65list_date\x18\x06 \x01(\t\x12\"\n\x06status\x18\x07 \x01(\x0b\x32\x12.qmt.common.Status\"\"\n\x0e\x45TFInfoRequest\x12\x10\n\x08\x65tf_code\x18\x01 \x01(\t\"\xa3\x01\n\x0f\x45TFInfoResponse\x12\x10\n\x08\x65tf_code\x18\x01 \x01(\t\x12\x10\n\x08\x65tf_name\x18\x02 \x01(\t\x12\x18\n\x10underlying_asset\x18\x03 \x01(\t\x12\x15\n\rcreation_unit\x18\x04 \x01(\x03\x12\x17\n\x0fredemption_unit\x18\x05 \x01(\x03\x12\"\n\x06status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\"\x90\x01\n\x12InstrumentTypeInfo\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x01(\x08\x12\r\n\x05stock\x18\x03 \x01(\x08\x12\x0c\n\x04\x66und\x18\x04 \x01(\x08\x12\x0b\n\x03\x65tf\x18\x05 \x01(\x08\x12\x0c\n\x04\x62ond\x18\x06 \x01(\x08\x12\x0e\n\x06option\x18\x07 \x01(\x08\x12\x0f\n\x07\x66utures\x18\x08 \x01(\x08\"+\n\x15InstrumentTypeRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"h\n\x16InstrumentTypeResponse\x12*\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x1c.qmt.data.InstrumentTypeInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"K\n\x13HolidayInfoResponse\x12\x10\n\x08holidays\x18\x01 \x03(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"1\n\x1a\x43onvertibleBondInfoRequest\x12\x13\n\x0binclude_raw\x18\x01 \x01(\x08\"\xb6\x03\n\x13\x43onvertibleBondInfo\x12\x11\n\tbond_code\x18\x01 \x01(\t\x12\x11\n\tbond_name\x18\x02 \x01(\t\x12\x12\n\nstock_code\x18\x03 \x01(\t\x12\x12\n\nstock_name\x18\x04 \x01(\t\x12\x18\n\x10\x63onversion_price\x18\x05 \x01(\x01\x12\x18\n\x10\x63onversion_value\x18\x06 \x01(\x01\x12\x1f\n\x17\x63onversion_premium_rate\x18\x07 \x01(\x01\x12\x15\n\rcurrent_price\x18\x08 \x01(\x01\x12\x11\n\tpar_value\x18\t \x01(\x01\x12\x11\n\tlist_date\x18\n \x01(\t\x12\x15\n\rmaturity_date\x18\x0b \x01(\t\x12\x1d\n\x15\x63onversion_begin_date\x18\x0c \x01(\t\x12\x1b\n\x13\x63onversion_end_date\x18\r \x01(\t\x12<\n\x08raw_data\x18\x0e \x03(\x0b\x32*.qmt.data.ConvertibleBondInfo.RawDataEntry\x1a.\n\x0cRawDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"o\n\x1b\x43onvertibleBondListResponse\x12,\n\x05\x62onds\x18\x01 \x03(\x0b\x32\x1d.qmt.data.ConvertibleBondInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"%\n\x0eIpoInfoRequest\x12\x13\n\x0binclude_raw\x18\x01 \x01(\x08\"\x9d\x03\n\x07IpoInfo\x12\x15\n\rsecurity_code\x18\x01 \x01(\t\x12\x11\n\tcode_name\x18\x02 \x01(\t\x12\x0e\n\x06market\x18\x03 \x01(\t\x12\x15\n\ract_issue_qty\x18\x04 \x01(\x03\x12\x18\n\x10online_issue_qty\x18\x05 \x01(\x03\x12\x17\n\x0fonline_sub_code\x18\x06 \x01(\t\x12\x1a\n\x12online_sub_max_qty\x18\x07 \x01(\x03\x12\x15\n\rpublish_price\x18\x08 \x01(\x01\x12\x11\n\tis_profit\x18\t \x01(\x05\x12\x13\n\x0bindustry_pe\x18\n \x01(\x01\x12\x10\n\x08\x61\x66ter_pe\x18\x0b \x01(\x01\x12\x16\n\x0esubscribe_date\x18\x0c \x01(\t\x12\x14\n\x0clottery_date\x18\r \x01(\t\x12\x11\n\tlist_date\x18\x0e \x01(\t\x12\x30\n\x08raw_data\x18\x0f \x03(\x0b\x32\x1e.qmt.data.IpoInfo.RawDataEntry\x1a.\n\x0cRawDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"Z\n\x13IpoInfoListResponse\x12\x1f\n\x04ipos\x18\x01 \x03(\x0b\x32\x11.qmt.data.IpoInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"I\n\x12PeriodListResponse\x12\x0f\n\x07periods\x18\x01 \x03(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"G\n\x0f\x44\x61taDirResponse\x12\x10\n\x08\x64\x61ta_dir\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\x94\x01\n\x10LocalDataRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x06 \x01(\t\x12\x10\n\x08\x63olumnar\x18\x07 \x01(\x08\"\xc6\x02\n\x11LocalDataResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32%.qmt.data.LocalDataResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x12\x44\n\rcolumnar_data\x18\x03 \x03(\x0b\x32-.qmt.data.LocalDataResponse.ColumnarDataEntry\x1a\x44\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineDataList:\x02\x38\x01\x1aL\n\x11\x43olumnarDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineColumnar:\x02\x38\x01\"1\n\rKlineDataList\x12 \n\x04\x62\x61rs\x18\x01 \x03(\x0b\x32\x12.qmt.data.KlineBar\"u\n\rKlineColumnar\x12\x0c\n\x04time\x18\x01 \x03(\t\x12\x0c\n\x04open\x18\x02 \x03(\x01\x12\x0c\n\x04high\x18\x03 \x03(\x01\x12\x0b\n\x03low\x18\x04 \x03(\x01\x12\r\n\x05\x63lose\x18\x05 \x03(\x01\x12\x0e\n\x06volume\x18\x06 \x03(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x03(\x01\"\xc2\x02\n\x08TickData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x12\n\nlast_price\x18\x02 \x01(\x01\x12\x0c\n\x04open\x18\x03 \x01(\x01\x12\x0c\n\x04high\x18\x04 \x01(\x01\x12\x0b\n\x03low\x18\x05 \x01(\x01\x12\x12\n\nlast_close\x18\x06 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\x12\x0e\n\x06volume\x18\x08 \x01(\x03\x12\x0f\n\x07pvolume\x18\t \x01(\x03\x12\x14\n\x0cstock_status\x18\n \x01(\x05\x12\x10\n\x08open_int\x18\x0b \x01(\x05\x12\x1d\n\x15last_settlement_price\x18\x0c \x01(\x01\x12\x11\n\task_price\x18\r \x03(\x01\x12\x11\n\tbid_price\x18\x0e \x03(\x01\x12\x0f\n\x07\x61sk_vol\x18\x0f \x03(\x05\x12\x0f\n\x07\x62id_vol\x18\x10 \x03(\x05\x12\x17\n\x0ftransaction_num\x18\x11 \x01(\x05\"L\n\x0f\x46ullTickRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xaf\x01\n\x10\x46ullTickResponse\x12\x32\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32$.qmt.data.FullTickResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x43\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.qmt.data.TickDataList:\x02\x38\x01\"1\n\x0cTickDataList\x12!\n\x05ticks\x18\x01 \x03(\x0b\x32\x12.qmt.data.TickData\"\x9c\x01\n\x0e\x44ividendFactor\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x10\n\x08interest\x18\x02 \x01(\x01\x12\x13\n\x0bstock_bonus\x18\x03 \x01(\x01\x12\x12\n\nstock_gift\x18\x04 \x01(\x01\x12\x11\n\tallot_num\x18\x05 \x01(\x01\x12\x13\n\x0b\x61llot_price\x18\x06 \x01(\x01\x12\r\n\x05gugai\x18\x07 \x01(\x05\x12\n\n\x02\x64r\x18\x08 \x01(\x01\")\n\x13\x44ividFactorsRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\"e\n\x14\x44ividFactorsResponse\x12)\n\x07\x66\x61\x63tors\x18\x01 \x03(\x0b\x32\x18.qmt.data.DividendFactor\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\x94\x01\n\x10\x46ullKlineRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x06 \x01(\t\x12\x10\n\x08\x63olumnar\x18\x07 \x01(\x08\"\xc6\x02\n\x11\x46ullKlineResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32%.qmt.data.FullKlineResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x12\x44\n\rcolumnar_data\x18\x03 \x03(\x0b\x32-.qmt.data.FullKlineResponse.ColumnarDataEntry\x1a\x44\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineDataList:\x02\x38\x01\x1aL\n\x11\x43olumnarDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.qmt.data.KlineColumnar:\x02\x38\x01\"}\n\x1a\x44ownloadHistoryDataRequest\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t\x12\x15\n\rincrementally\x18\x05 \x01(\x08\"k\n\x1f\x44ownloadHistoryDataBatchRequest\x12\x12\n\nstock_list\x18\x01 \x03(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t\"\xd4\x01\n\x10\x44ownloadResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12,\n\x06status\x18\x02 \x01(\x0e\x32\x1c.qmt.data.DownloadTaskStatus\x12\x10\n\x08progress\x18\x03 \x01(\x01\x12\r\n\x05total\x18\x04 \x01(\x05\x12\x10\n\x08\x66inished\x18\x05 \x01(\x05\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\x15\n\rcurrent_stock\x18\x07 \x01(\t\x12&\n\nrpc_status\x18\x08 \x01(\x0b\x32\x12.qmt.common.Status\"l\n\x1c\x44ownloadFinancialDataRequest\x12\x12\n\nstock_list\x18\x01 \x03(\t\x12\x12\n\ntable_list\x18\x02 \x03(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"0\n\x1a\x44ownloadIndexWeightRequest\x12\x12\n\nindex_code\x18\x01 \x01(\t\"1\n\x1f\x44ownloadHistoryContractsRequest\x12\x0e\n\x06market\x18\x01 \x01(\t\"X\n\x19\x43reateSectorFolderRequest\x12\x13\n\x0bparent_node\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"V\n\x1a\x43reateSectorFolderResponse\x12\x14\n\x0c\x63reated_name\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"R\n\x13\x43reateSectorRequest\x12\x13\n\x0bparent_node\x18\x01 \x01(\t\x12\x13\n\x0bsector_name\x18\x02 \x01(\t\x12\x11\n\toverwrite\x18\x03 \x01(\x08\"P\n\x14\x43reateSectorResponse\x12\x14\n\x0c\x63reated_name\x18\x01 \x01(\t\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\";\n\x10\x41\x64\x64SectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"7\n\x11\x41\x64\x64SectorResponse\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.qmt.common.Status\"G\n\x1cRemoveStockFromSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"T\n\x1dRemoveStockFromSectorResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"*\n\x13RemoveSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\":\n\x14RemoveSectorResponse\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.qmt.common.Status\"=\n\x12ResetSectorRequest\x12\x13\n\x0bsector_name\x18\x01 \x01(\t\x12\x12\n\nstock_list\x18\x02 \x03(\t\"J\n\x13ResetSectorResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\x87\x03\n\x0fSectorOperation\x12\x43\n\x14\x63reate_sector_folder\x18\x01 \x01(\x0b\x32#.qmt.data.CreateSectorFolderRequestH\x00\x12\x36\n\rcreate_sector\x18\x02 \x01(\x0b\x32\x1d.qmt.data.CreateSectorRequestH\x00\x12\x30\n\nadd_sector\x18\x03 \x01(\x0b\x32\x1a.qmt.data.AddSectorRequestH\x00\x12J\n\x18remove_stock_from_sector\x18\x04 \x01(\x0b\x32&.qmt.data.RemoveStockFromSectorRequestH\x00\x12\x36\n\rremove_sector\x18\x05 \x01(\x0b\x32\x1d.qmt.data.RemoveSectorRequestH\x00\x12\x34\n\x0creset_sector\x18\x06 \x01(\x0b\x32\x1c.qmt.data.ResetSectorRequestH\x00\x42\x0b\n\toperation\"\x90\x03\n\x15SectorOperationResult\x12\x44\n\x14\x63reate_sector_folder\x18\x01 \x01(\x0b\x32$.qmt.data.CreateSectorFolderResponseH\x00\x12\x37\n\rcreate_sector\x18\x02 \x01(\x0b\x32\x1e.qmt.data.CreateSectorResponseH\x00\x12\x31\n\nadd_sector\x18\x03 \x01(\x0b\x32\x1b.qmt.data.AddSectorResponseH\x00\x12K\n\x18remove_stock_from_sector\x18\x04 \x01(\x0b\x32\'.qmt.data.RemoveStockFromSectorResponseH\x00\x12\x37\n\rremove_sector\x18\x05 \x01(\x0b\x32\x1e.qmt.data.RemoveSectorResponseH\x00\x12\x35\n\x0creset_sector\x18\x06 \x01(\x0b\x32\x1d.qmt.data.ResetSectorResponseH\x00\x42\x08\n\x06result\"\xeb\x02\n\x0bL2QuoteData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x12\n\nlast_price\x18\x02 \x01(\x01\x12\x0c\n\x04open\x18\x03 \x01(\x01\x12\x0c\n\x04high\x18\x04 \x01(\x01\x12\x0b\n\x03low\x18\x05 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x06 \x01(\x01\x12\x0e\n\x06volume\x18\x07 \x01(\x03\x12\x0f\n\x07pvolume\x18\x08 \x01(\x03\x12\x10\n\x08open_int\x18\t \x01(\x05\x12\x14\n\x0cstock_status\x18\n \x01(\x05\x12\x17\n\x0ftransaction_num\x18\x0b \x01(\x05\x12\x12\n\nlast_close\x18\x0c \x01(\x01\x12\x1d\n\x15last_settlement_price\x18\r \x01(\x01\x12\x18\n\x10settlement_price\x18\x0e \x01(\x01\x12\n\n\x02pe\x18\x0f \x01(\x01\x12\x11\n\task_price\x18\x10 \x03(\x01\x12\x11\n\tbid_price\x18\x11 \x03(\x01\x12\x0f\n\x07\x61sk_vol\x18\x12 \x03(\x05\x12\x0f\n\x07\x62id_vol\x18\x13 \x03(\x05\"K\n\x0eL2QuoteRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xb0\x01\n\x0fL2QuoteResponse\x12\x31\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32#.qmt.data.L2QuoteResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x46\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.qmt.data.L2QuoteDataList:\x02\x38\x01\"8\n\x0fL2QuoteDataList\x12%\n\x06quotes\x18\x01 \x03(\x0b\x32\x15.qmt.data.L2QuoteData\"\x7f\n\x0bL2OrderData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x05\x12\x12\n\nentrust_no\x18\x04 \x01(\x03\x12\x14\n\x0c\x65ntrust_type\x18\x05 \x01(\x05\x12\x19\n\x11\x65ntrust_direction\x18\x06 \x01(\x05\"K\n\x0eL2OrderRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xb0\x01\n\x0fL2OrderResponse\x12\x31\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32#.qmt.data.L2OrderResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1a\x46\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.qmt.data.L2OrderDataList:\x02\x38\x01\"8\n\x0fL2OrderDataList\x12%\n\x06orders\x18\x01 \x03(\x0b\x32\x15.qmt.data.L2OrderData\"I\n\x0cL2OrderBatch\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12%\n\x06orders\x18\x02 \x03(\x0b\x32\x15.qmt.data.L2OrderData\"\xae\x01\n\x11L2TransactionData\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x05\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12\x13\n\x0btrade_index\x18\x05 \x01(\x03\x12\x0e\n\x06\x62uy_no\x18\x06 \x01(\x03\x12\x0f\n\x07sell_no\x18\x07 \x01(\x03\x12\x12\n\ntrade_type\x18\x08 \x01(\x05\x12\x12\n\ntrade_flag\x18\t \x01(\x05\"Q\n\x14L2TransactionRequest\x12\x13\n\x0bstock_codes\x18\x01 \x03(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"\xc2\x01\n\x15L2TransactionResponse\x12\x37\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32).qmt.data.L2TransactionResponse.DataEntry\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\x1aL\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12.\n\x05value\x18\x02 \x01(\x0b\x32\x1f.qmt.data.L2TransactionDataList:\x02\x38\x01\"J\n\x15L2TransactionDataList\x12\x31\n\x0ctransactions\x18\x01 \x03(\x0b\x32\x1b.qmt.data.L2TransactionData\"[\n\x12L2TransactionBatch\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x31\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x1b.qmt.data.L2TransactionData\"r\n\x13SubscriptionRequest\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x02 \x01(\t\x12\x35\n\x11subscription_type\x18\x03 \x01(\x0e\x32\x1a.qmt.data.SubscriptionType\"$\n\x11WholeQuoteRequest\x12\x0f\n\x07markets\x18\x01 \x03(\t\"\xa7\x01\n\x14SubscriptionResponse\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\x12\x0f\n\x07symbols\x18\x04 \x03(\t\x12\x19\n\x11subscription_type\x18\x05 \x01(\t\x12&\n\nrpc_status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\"-\n\x12UnsubscribeRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\"[\n\x13UnsubscribeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"\xfb\x01\n\x0bQuoteUpdate\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x12\n\nlast_price\x18\x03 \x01(\x01\x12\x0c\n\x04open\x18\x04 \x01(\x01\x12\x0c\n\x04high\x18\x05 \x01(\x01\x12\x0b\n\x03low\x18\x06 \x01(\x01\x12\r\n\x05\x63lose\x18\x07 \x01(\x01\x12\x0e\n\x06volume\x18\x08 \x01(\x03\x12\x0e\n\x06\x61mount\x18\t \x01(\x01\x12\x11\n\tpre_close\x18\n \x01(\x01\x12\x11\n\tbid_price\x18\x0b \x03(\x01\x12\x11\n\task_price\x18\x0c \x03(\x01\x12\x0f\n\x07\x62id_vol\x18\r \x03(\x05\x12\x0f\n\x07\x61sk_vol\x18\x0e \x03(\x05\"2\n\x17SubscriptionInfoRequest\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\"\xe8\x01\n\x18SubscriptionInfoResponse\x12\x17\n\x0fsubscription_id\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t\x12\x13\n\x0b\x61\x64just_type\x18\x03 \x01(\t\x12\x19\n\x11subscription_type\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x16\n\x0elast_heartbeat\x18\x06 \x01(\t\x12\x0e\n\x06\x61\x63tive\x18\x07 \x01(\x08\x12\x12\n\nqueue_size\x18\x08 \x01(\x05\x12\"\n\x06status\x18\t \x01(\x0b\x32\x12.qmt.common.Status\"y\n\x18SubscriptionListResponse\x12\x39\n\rsubscriptions\x18\x01 \x03(\x0b\x32\".qmt.data.SubscriptionInfoResponse\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status*m\n\x12\x44ownloadTaskStatus\x12\x14\n\x10\x44OWNLOAD_PENDING\x10\x00\x12\x14\n\x10\x44OWNLOAD_RUNNING\x10\x01\x12\x16\n\x12\x44OWNLOAD_COMPLETED\x10\x02\x12\x13\n\x0f\x44OWNLOAD_FAILED\x10\x03*H\n\x10SubscriptionType\x12\x16\n\x12SUBSCRIPTION_QUOTE\x10\x00\x12\x1c\n\x18SUBSCRIPTION_WHOLE_QUOTE\x10\x01\x32\xb0\x1d\n\x0b\x44\x61taService\x12O\n\rGetMarketData\x12\x1b.qmt.data.MarketDataRequest\x1a!.qmt.data.MarketDataBatchResponse\x12O\n\x10StreamMarketData\x12\x1b.qmt.data.MarketDataRequest\x1a\x1c.qmt.data.MarketDataResponse0\x01\x12X\n\x10GetFinancialData\x12\x1e.qmt.data.FinancialDataRequest\x1a$.qmt.data.FinancialDataBatchResponse\x12\x45\n\rGetSectorList\x12\x16.google.protobuf.Empty\x1a\x1c.qmt.data.SectorListResponse\x12M\n\x0eGetIndexWeight\x12\x1c.qmt.data.IndexWeightRequest\x1a\x1d.qmt.data.IndexWeightResponse\x12Y\n\x12GetTradingCalendar\x12 .qmt.data.TradingCalendarRequest\x1a!.qmt.data.TradingCalendarResponse\x12V\n\x11GetInstrumentInfo\x12\x1f.qmt.data.InstrumentInfoRequest\x1a .qmt.data.InstrumentInfoResponse\x12\x41\n\nGetETFInfo\x12\x18.qmt.data.ETFInfoRequest\x1a\x19.qmt.data.ETFInfoResponse\x12V\n\x11GetInstrumentType\x12\x1f.qmt.data.InstrumentTypeRequest\x1a .qmt.data.InstrumentTypeResponse\x12\x44\n\x0bGetHolidays\x12\x16.google.protobuf.Empty\x1a\x1d.qmt.data.HolidayInfoResponse\x12\x65\n\x16GetConvertibleBondInfo\x12$.qmt.data.ConvertibleBondInfoRequest\x1a%.qmt.data.ConvertibleBondListResponse\x12\x45\n\nGetIpoInfo\x12\x18.qmt.data.IpoInfoRequest\x1a\x1d.qmt.data.IpoInfoListResponse\x12\x45\n\rGetPeriodList\x12\x16.google.protobuf.Empty\x1a\x1c.qmt.data.PeriodListResponse\x12?\n\nGetDataDir\x12\x16.google.protobuf.Empty\x1a\x19.qmt.data.DataDirResponse\x12G\n\x0cGetLocalData\x12\x1a.qmt.data.LocalDataRequest\x1a\x1b.qmt.data.LocalDataResponse\x12\x44\n\x0bGetFullTick\x12\x19.qmt.data.FullTickRequest\x1a\x1a.qmt.data.FullTickResponse\x12P\n\x0fGetDividFactors\x12\x1d.qmt.data.DividFactorsRequest\x1a\x1e.qmt.data.DividFactorsResponse\x12G\n\x0cGetFullKline\x12\x1a.qmt.data.FullKlineRequest\x1a\x1b.qmt.data.FullKlineResponse\x12W\n\x13\x44ownloadHistoryData\x12$.qmt.data.DownloadHistoryDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12\x61\n\x18\x44ownloadHistoryDataBatch\x12).qmt.data.DownloadHistoryDataBatchRequest\x1a\x1a.qmt.data.DownloadResponse\x12i\n\x1eStreamDownloadHistoryDataBatch\x12).qmt.data.DownloadHistoryDataBatchRequest\x1a\x1a.qmt.data.DownloadResponse0\x01\x12[\n\x15\x44ownloadFinancialData\x12&.qmt.data.DownloadFinancialDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12`\n\x1a\x44ownloadFinancialDataBatch\x12&.qmt.data.DownloadFinancialDataRequest\x1a\x1a.qmt.data.DownloadResponse\x12H\n\x12\x44ownloadSectorData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12W\n\x13\x44ownloadIndexWeight\x12$.qmt.data.DownloadIndexWeightRequest\x1a\x1a.qmt.data.DownloadResponse\x12\x44\n\x0e\x44ownloadCBData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12\x45\n\x0f\x44ownloadETFInfo\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12I\n\x13\x44ownloadHolidayData\x12\x16.google.protobuf.Empty\x1a\x1a.qmt.data.DownloadResponse\x12\x61\n\x18\x44ownloadHistoryContracts\x12).qmt.data.DownloadHistoryContractsRequest\x1a\x1a.qmt.data.DownloadResponse\x12_\n\x12\x43reateSectorFolder\x12#.qmt.data.CreateSectorFolderRequest\x1a$.qmt.data.CreateSectorFolderResponse\x12M\n\x0c\x43reateSector\x12\x1d.qmt.data.CreateSectorRequest\x1a\x1e.qmt.data.CreateSectorResponse\x12\x44\n\tAddSector\x12\x1a.qmt.data.AddSectorRequest\x1a\x1b.qmt.data.AddSectorResponse\x12h\n\x15RemoveStockFromSector\x12&.qmt.data.RemoveStockFromSectorRequest\x1a\'.qmt.data.RemoveStockFromSectorResponse\x12M\n\x0cRemoveSector\x12\x1d.qmt.data.RemoveSectorRequest\x1a\x1e.qmt.data.RemoveSectorResponse\x12J\n\x0bResetSector\x12\x1c.qmt.data.ResetSectorRequest\x1a\x1d.qmt.data.ResetSectorResponse\x12N\n\x0cSectorStream\x12\x19.qmt.data.SectorOperation\x1a\x1f.qmt.data.SectorOperationResult(\x01\x30\x01\x12\x41\n\nGetL2Quote\x12\x18.qmt.data.L2QuoteRequest\x1a\x19.qmt.data.L2QuoteResponse\x12\x41\n\nGetL2Order\x12\x18.qmt.data.L2OrderRequest\x1a\x19.qmt.data.L2OrderResponse\x12\x43\n\rStreamL2Order\x12\x18.qmt.data.L2OrderRequest\x1a\x16.qmt.data.L2OrderBatch0\x01\x12S\n\x10GetL2Transaction\x12\x1e.qmt.data.L2TransactionRequest\x1a\x1f.qmt.data.L2TransactionResponse\x12U\n\x13StreamL2Transaction\x12\x1e.qmt.data.L2TransactionRequest\x1a\x1c.qmt.data.L2TransactionBatch0\x01\x12H\n\x0eSubscribeQuote\x12\x1d.qmt.data.SubscriptionRequest\x1a\x15.qmt.data.QuoteUpdate0\x01\x12K\n\x13SubscribeWholeQuote\x12\x1b.qmt.data.WholeQuoteRequest\x1a\x15.qmt.data.QuoteUpdate0\x01\x12O\n\x10UnsubscribeQuote\x12\x1c.qmt.data.UnsubscribeRequest\x1a\x1d.qmt.data.UnsubscribeResponse\x12\\\n\x13GetSubscriptionInfo\x12!.qmt.data.SubscriptionInfoRequest\x1a\".qmt.data.SubscriptionInfoResponse\x12O\n\x11ListSubscriptions\x12\x16.google.protobuf.Empty\x1a\".qmt.data.SubscriptionListResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -41,20 +41,24 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_IPOINFO_RAWDATAENTRY']._serialized_options = b'8\001'
   _globals['_LOCALDATARESPONSE_DATAENTRY']._loaded_options = None
   _globals['_LOCALDATARESPONSE_DATAENTRY']._serialized_options = b'8\001'
+  _globals['_LOCALDATARESPONSE_COLUMNARDATAENTRY']._loaded_options = None
+  _globals['_LOCALDATARESPONSE_COLUMNARDATAENTRY']._serialized_options = b'8\001'
   _globals['_FULLTICKRESPONSE_DATAENTRY']._loaded_options = None
   _globals['_FULLTICKRESPONSE_DATAENTRY']._serialized_options = b'8\001'
   _globals['_FULLKLINERESPONSE_DATAENTRY']._loaded_options = None
   _globals['_FULLKLINERESPONSE_DATAENTRY']._serialized_options = b'8\001'
+  _globals['_FULLKLINERESPONSE_COLUMNARDATAENTRY']._loaded_options = None
+  _globals['_FULLKLINERESPONSE_COLUMNARDATAENTRY']._serialized_options = b'8\001'
   _globals['_L2QUOTERESPONSE_DATAENTRY']._loaded_options = None
   _globals['_L2QUOTERESPONSE_DATAENTRY']._serialized_options = b'8\001'
   _globals['_L2ORDERRESPONSE_DATAENTRY']._loaded_options = None
   _globals['_L2ORDERRESPONSE_DATAENTRY']._serialized_options = b'8\001'
   _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._loaded_options = None
   _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._serialized_options = b'8\001'
-  _globals['_DOWNLOADTASKSTATUS']._serialized_start=9610
-  _globals['_DOWNLOADTASKSTATUS']._serialized_end=9719
-  _globals['_SUBSCRIPTIONTYPE']._serialized_start=9721
-  _globals['_SUBSCRIPTIONTYPE']._serialized_end=9793
+  _globals['_DOWNLOADTASKSTATUS']._serialized_start=11192
+  _globals['_DOWNLOADTASKSTATUS']._serialized_end=11301
+  _globals['_SUBSCRIPTIONTYPE']._serialized_start=11303
+  _globals['_SUBSCRIPTIONTYPE']._serialized_end=11375
   _globals['_MARKETDATAREQUEST']._serialized_start=68
   _globals['_MARKETDATAREQUEST']._serialized_end=223
   _globals['_KLINEBAR']._serialized_start=225
@@ -103,136 +107,154 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_INSTRUMENTTYPERESPONSE']._serialized_end=2471
   _globals['_HOLIDAYINFORESPONSE']._serialized_start=2473
   _globals['_HOLIDAYINFORESPONSE']._serialized_end=2548
-  _globals['_CONVERTIBLEBONDINFO']._serialized_start=2551
-  _globals['_CONVERTIBLEBONDINFO']._serialized_end=2989
-  _globals['_CONVERTIBLEBONDINFO_RAWDATAENTRY']._serialized_start=2943
-  _globals['_CONVERTIBLEBONDINFO_RAWDATAENTRY']._serialized_end=2989
-  _globals['_CONVERTIBLEBONDLISTRESPONSE']._serialized_start=2991
-  _globals['_CONVERTIBLEBONDLISTRESPONSE']._serialized_end=3102
-  _globals['_IPOINFO']._serialized_start=3105
-  _globals['_IPOINFO']._serialized_end=3518
-  _globals['_IPOINFO_RAWDATAENTRY']._serialized_start=2943
-  _globals['_IPOINFO_RAWDATAENTRY']._serialized_end=2989
-  _globals['_IPOINFOLISTRESPONSE']._serialized_start=3520
-  _globals['_IPOINFOLISTRESPONSE']._serialized_end=3610
-  _globals['_PERIODLISTRESPONSE']._serialized_start=3612
-  _globals['_PERIODLISTRESPONSE']._serialized_end=3685
-  _globals['_DATADIRRESPONSE']._serialized_start=3687
-  _globals['_DATADIRRESPONSE']._serialized_end=3758
-  _globals['_LOCALDATAREQUEST']._serialized_start=3760
-  _globals['_LOCALDATAREQUEST']._serialized_end=3853
-  _globals['_LOCALDATARESPONSE']._serialized_start=3856
-  _globals['_LOCALDATARESPONSE']._serialized_end=4034
-  _globals['_LOCALDATARESPONSE_DATAENTRY']._serialized_start=3966
-  _globals['_LOCALDATARESPONSE_DATAENTRY']._serialized_end=4034
-  _globals['_KLINEDATALIST']._serialized_start=4036
-  _globals['_KLINEDATALIST']._serialized_end=4085
-  _globals['_TICKDATA']._serialized_start=4088
-  _globals['_TICKDATA']._serialized_end=4410
-  _globals['_FULLTICKREQUEST']._serialized_start=4412
-  _globals['_FULLTICKREQUEST']._serialized_end=4488
-  _globals['_FULLTICKRESPONSE']._serialized_start=4491
-  _globals['_FULLTICKRESPONSE']._serialized_end=4666
-  _globals['_FULLTICKRESPONSE_DATAENTRY']._serialized_start=4599
-  _globals['_FULLTICKRESPONSE_DATAENTRY']._serialized_end=4666
-  _globals['_TICKDATALIST']._serialized_start=4668
-  _globals['_TICKDATALIST']._serialized_end=4717
-  _globals['_DIVIDENDFACTOR']._serialized_start=4720
-  _globals['_DIVIDENDFACTOR']._serialized_end=4876
-  _globals['_DIVIDFACTORSREQUEST']._serialized_start=4878
-  _globals['_DIVIDFACTORSREQUEST']._serialized_end=4919
-  _globals['_DIVIDFACTORSRESPONSE']._serialized_start=4921
-  _globals['_DIVIDFACTORSRESPONSE']._serialized_end=5022
-  _globals['_FULLKLINEREQUEST']._serialized_start=5024
-  _globals['_FULLKLINEREQUEST']._serialized_end=5117
-  _globals['_FULLKLINERESPONSE']._serialized_start=5120
-  _globals['_FULLKLINERESPONSE']._serialized_end=5298
-  _globals['_FULLKLINERESPONSE_DATAENTRY']._serialized_start=3966
-  _globals['_FULLKLINERESPONSE_DATAENTRY']._serialized_end=4034
-  _globals['_DOWNLOADHISTORYDATAREQUEST']._serialized_start=5300
-  _globals['_DOWNLOADHISTORYDATAREQUEST']._serialized_end=5425
-  _globals['_DOWNLOADHISTORYDATABATCHREQUEST']._serialized_start=5427
-  _globals['_DOWNLOADHISTORYDATABATCHREQUEST']._serialized_end=5534
-  _globals['_DOWNLOADRESPONSE']._serialized_start=5537
-  _globals['_DOWNLOADRESPONSE']._serialized_end=5749
-  _globals['_DOWNLOADFINANCIALDATAREQUEST']._serialized_start=5751
-  _globals['_DOWNLOADFINANCIALDATAREQUEST']._serialized_end=5859
-  _globals['_DOWNLOADINDEXWEIGHTREQUEST']._serialized_start=5861
-  _globals['_DOWNLOADINDEXWEIGHTREQUEST']._serialized_end=5909
-  _globals['_DOWNLOADHISTORYCONTRACTSREQUEST']._serialized_start=5911
-  _globals['_DOWNLOADHISTORYCONTRACTSREQUEST']._serialized_end=5960
-  _globals['_CREATESECTORFOLDERREQUEST']._serialized_start=5962
-  _globals['_CREATESECTORFOLDERREQUEST']._serialized_end=6050
-  _globals['_CREATESECTORFOLDERRESPONSE']._serialized_start=6052
-  _globals['_CREATESECTORFOLDERRESPONSE']._serialized_end=6138
-  _globals['_CREATESECTORREQUEST']._serialized_start=6140
-  _globals['_CREATESECTORREQUEST']._serialized_end=6222
-  _globals['_CREATESECTORRESPONSE']._serialized_start=6224
-  _globals['_CREATESECTORRESPONSE']._serialized_end=6304
-  _globals['_ADDSECTORREQUEST']._serialized_start=6306
-  _globals['_ADDSECTORREQUEST']._serialized_end=6365
-  _globals['_ADDSECTORRESPONSE']._serialized_start=6367
-  _globals['_ADDSECTORRESPONSE']._serialized_end=6422
-  _globals['_REMOVESTOCKFROMSECTORREQUEST']._serialized_start=6424
-  _globals['_REMOVESTOCKFROMSECTORREQUEST']._serialized_end=6495
-  _globals['_REMOVESTOCKFROMSECTORRESPONSE']._serialized_start=6497
-  _globals['_REMOVESTOCKFROMSECTORRESPONSE']._serialized_end=6581
-  _globals['_REMOVESECTORREQUEST']._serialized_start=6583
-  _globals['_REMOVESECTORREQUEST']._serialized_end=6625
-  _globals['_REMOVESECTORRESPONSE']._serialized_start=6627
-  _globals['_REMOVESECTORRESPONSE']._serialized_end=6685
-  _globals['_RESETSECTORREQUEST']._serialized_start=6687
-  _globals['_RESETSECTORREQUEST']._serialized_end=6748
-  _globals['_RESETSECTORRESPONSE']._serialized_start=6750
-  _globals['_RESETSECTORRESPONSE']._serialized_end=6824
-  _globals['_L2QUOTEDATA']._serialized_start=6827
-  _globals['_L2QUOTEDATA']._serialized_end=7190
-  _globals['_L2QUOTEREQUEST']._serialized_start=7192
-  _globals['_L2QUOTEREQUEST']._serialized_end=7267
-  _globals['_L2QUOTERESPONSE']._serialized_start=7270
-  _globals['_L2QUOTERESPONSE']._serialized_end=7446
-  _globals['_L2QUOTERESPONSE_DATAENTRY']._serialized_start=7376
-  _globals['_L2QUOTERESPONSE_DATAENTRY']._serialized_end=7446
-  _globals['_L2QUOTEDATALIST']._serialized_start=7448
-  _globals['_L2QUOTEDATALIST']._serialized_end=7504
-  _globals['_L2ORDERDATA']._serialized_start=7506
-  _globals['_L2ORDERDATA']._serialized_end=7633
-  _globals['_L2ORDERREQUEST']._serialized_start=7635
-  _globals['_L2ORDERREQUEST']._serialized_end=7710
-  _globals['_L2ORDERRESPONSE']._serialized_start=7713
-  _globals['_L2ORDERRESPONSE']._serialized_end=7889
-  _globals['_L2ORDERRESPONSE_DATAENTRY']._serialized_start=7819
-  _globals['_L2ORDERRESPONSE_DATAENTRY']._serialized_end=7889
-  _globals['_L2ORDERDATALIST']._serialized_start=7891
-  _globals['_L2ORDERDATALIST']._serialized_end=7947
-  _globals['_L2TRANSACTIONDATA']._serialized_start=7950
-  _globals['_L2TRANSACTIONDATA']._serialized_end=8124
-  _globals['_L2TRANSACTIONREQUEST']._serialized_start=8126
-  _globals['_L2TRANSACTIONREQUEST']._serialized_end=8207
-  _globals['_L2TRANSACTIONRESPONSE']._serialized_start=8210
-  _globals['_L2TRANSACTIONRESPONSE']._serialized_end=8404
-  _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._serialized_start=8328
-  _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._serialized_end=8404
-  _globals['_L2TRANSACTIONDATALIST']._serialized_start=8406
-  _globals['_L2TRANSACTIONDATALIST']._serialized_end=8480
-  _globals['_SUBSCRIPTIONREQUEST']._serialized_start=8482
-  _globals['_SUBSCRIPTIONREQUEST']._serialized_end=8596
-  _globals['_WHOLEQUOTEREQUEST']._serialized_start=8598
-  _globals['_WHOLEQUOTEREQUEST']._serialized_end=8634
-  _globals['_SUBSCRIPTIONRESPONSE']._serialized_start=8637
-  _globals['_SUBSCRIPTIONRESPONSE']._serialized_end=8804
-  _globals['_UNSUBSCRIBEREQUEST']._serialized_start=8806
-  _globals['_UNSUBSCRIBEREQUEST']._serialized_end=8851
-  _globals['_UNSUBSCRIBERESPONSE']._serialized_start=8853
-  _globals['_UNSUBSCRIBERESPONSE']._serialized_end=8944
-  _globals['_QUOTEUPDATE']._serialized_start=8947
-  _globals['_QUOTEUPDATE']._serialized_end=9198
-  _globals['_SUBSCRIPTIONINFOREQUEST']._serialized_start=9200
-  _globals['_SUBSCRIPTIONINFOREQUEST']._serialized_end=9250
-  _globals['_SUBSCRIPTIONINFORESPONSE']._serialized_start=9253
-  _globals['_SUBSCRIPTIONINFORESPONSE']._serialized_end=9485
-  _globals['_SUBSCRIPTIONLISTRESPONSE']._serialized_start=9487
-  _globals['_SUBSCRIPTIONLISTRESPONSE']._serialized_end=9608
-  _globals['_DATASERVICE']._serialized_start=9796
-  _globals['_DATASERVICE']._serialized_end=13116
+  _globals['_CONVERTIBLEBONDINFOREQUEST']._serialized_start=2550
+  _globals['_CONVERTIBLEBONDINFOREQUEST']._serialized_end=2599
+  _globals['_CONVERTIBLEBONDINFO']._serialized_start=2602
+  _globals['_CONVERTIBLEBONDINFO']._serialized_end=3040
+  _globals['_CONVERTIBLEBONDINFO_RAWDATAENTRY']._serialized_start=2994
+  _globals['_CONVERTIBLEBONDINFO_RAWDATAENTRY']._serialized_end=3040
+  _globals['_CONVERTIBLEBONDLISTRESPONSE']._serialized_start=3042
+  _globals['_CONVERTIBLEBONDLISTRESPONSE']._serialized_end=3153
+  _globals['_IPOINFOREQUEST']._serialized_start=3155
+  _globals['_IPOINFOREQUEST']._serialized_end=3192
+  _globals['_IPOINFO']._serialized_start=3195
+  _globals['_IPOINFO']._serialized_end=3608
+  _globals['_IPOINFO_RAWDATAENTRY']._serialized_start=2994
+  _globals['_IPOINFO_RAWDATAENTRY']._serialized_end=3040
+  _globals['_IPOINFOLISTRESPONSE']._serialized_start=3610
+  _globals['_IPOINFOLISTRESPONSE']._serialized_end=3700
+  _globals['_PERIODLISTRESPONSE']._serialized_start=3702
+  _globals['_PERIODLISTRESPONSE']._serialized_end=3775
+  _globals['_DATADIRRESPONSE']._serialized_start=3777
+  _globals['_DATADIRRESPONSE']._serialized_end=3848
+  _globals['_LOCALDATAREQUEST']._serialized_start=3851
+  _globals['_LOCALDATAREQUEST']._serialized_end=3999
+  _globals['_LOCALDATARESPONSE']._serialized_start=4002
+  _globals['_LOCALDATARESPONSE']._serialized_end=4328
+  _globals['_LOCALDATARESPONSE_DATAENTRY']._serialized_start=4182
+  _globals['_LOCALDATARESPONSE_DATAENTRY']._serialized_end=4250
+  _globals['_LOCALDATARESPONSE_COLUMNARDATAENTRY']._serialized_start=4252
+  _globals['_LOCALDATARESPONSE_COLUMNARDATAENTRY']._serialized_end=4328
+  _globals['_KLINEDATALIST']._serialized_start=4330
+  _globals['_KLINEDATALIST']._serialized_end=4379
+  _globals['_KLINECOLUMNAR']._serialized_start=4381
+  _globals['_KLINECOLUMNAR']._serialized_end=4498
+  _globals['_TICKDATA']._serialized_start=4501
+  _globals['_TICKDATA']._serialized_end=4823
+  _globals['_FULLTICKREQUEST']._serialized_start=4825
+  _globals['_FULLTICKREQUEST']._serialized_end=4901
+  _globals['_FULLTICKRESPONSE']._serialized_start=4904
+  _globals['_FULLTICKRESPONSE']._serialized_end=5079
+  _globals['_FULLTICKRESPONSE_DATAENTRY']._serialized_start=5012
+  _globals['_FULLTICKRESPONSE_DATAENTRY']._serialized_end=5079
+  _globals['_TICKDATALIST']._serialized_start=5081
+  _globals['_TICKDATALIST']._serialized_end=5130
+  _globals['_DIVIDENDFACTOR']._serialized_start=5133
+  _globals['_DIVIDENDFACTOR']._serialized_end=5289
+  _globals['_DIVIDFACTORSREQUEST']._serialized_start=5291
+  _globals['_DIVIDFACTORSREQUEST']._serialized_end=5332
+  _globals['_DIVIDFACTORSRESPONSE']._serialized_start=5334
+  _globals['_DIVIDFACTORSRESPONSE']._serialized_end=5435
+  _globals['_FULLKLINEREQUEST']._serialized_start=5438
+  _globals['_FULLKLINEREQUEST']._serialized_end=5586
+  _globals['_FULLKLINERESPONSE']._serialized_start=5589
+  _globals['_FULLKLINERESPONSE']._serialized_end=5915
+  _globals['_FULLKLINERESPONSE_DATAENTRY']._serialized_start=4182
+  _globals['_FULLKLINERESPONSE_DATAENTRY']._serialized_end=4250
+  _globals['_FULLKLINERESPONSE_COLUMNARDATAENTRY']._serialized_start=4252
+  _globals['_FULLKLINERESPONSE_COLUMNARDATAENTRY']._serialized_end=4328
+  _globals['_DOWNLOADHISTORYDATAREQUEST']._serialized_start=5917
+  _globals['_DOWNLOADHISTORYDATAREQUEST']._serialized_end=6042
+  _globals['_DOWNLOADHISTORYDATABATCHREQUEST']._serialized_start=6044
+  _globals['_DOWNLOADHISTORYDATABATCHREQUEST']._serialized_end=6151
+  _globals['_DOWNLOADRESPONSE']._serialized_start=6154
+  _globals['_DOWNLOADRESPONSE']._serialized_end=6366
+  _globals['_DOWNLOADFINANCIALDATAREQUEST']._serialized_start=6368
+  _globals['_DOWNLOADFINANCIALDATAREQUEST']._serialized_end=6476
+  _globals['_DOWNLOADINDEXWEIGHTREQUEST']._serialized_start=6478
+  _globals['_DOWNLOADINDEXWEIGHTREQUEST']._serialized_end=6526
+  _globals['_DOWNLOADHISTORYCONTRACTSREQUEST']._serialized_start=6528
+  _globals['_DOWNLOADHISTORYCONTRACTSREQUEST']._serialized_end=6577
+  _globals['_CREATESECTORFOLDERREQUEST']._serialized_start=6579
+  _globals['_CREATESECTORFOLDERREQUEST']._serialized_end=6667
+  _globals['_CREATESECTORFOLDERRESPONSE']._serialized_start=6669
+  _globals['_CREATESECTORFOLDERRESPONSE']._serialized_end=6755
+  _globals['_CREATESECTORREQUEST']._serialized_start=6757
+  _globals['_CREATESECTORREQUEST']._serialized_end=6839
+  _globals['_CREATESECTORRESPONSE']._serialized_start=6841
+  _globals['_CREATESECTORRESPONSE']._serialized_end=6921
+  _globals['_ADDSECTORREQUEST']._serialized_start=6923
+  _globals['_ADDSECTORREQUEST']._serialized_end=6982
+  _globals['_ADDSECTORRESPONSE']._serialized_start=6984
+  _globals['_ADDSECTORRESPONSE']._serialized_end=7039
+  _globals['_REMOVESTOCKFROMSECTORREQUEST']._serialized_start=7041
+  _globals['_REMOVESTOCKFROMSECTORREQUEST']._serialized_end=7112
+  _globals['_REMOVESTOCKFROMSECTORRESPONSE']._serialized_start=7114
+  _globals['_REMOVESTOCKFROMSECTORRESPONSE']._serialized_end=7198
+  _globals['_REMOVESECTORREQUEST']._serialized_start=7200
+  _globals['_REMOVESECTORREQUEST']._serialized_end=7242
+  _globals['_REMOVESECTORRESPONSE']._serialized_start=7244
+  _globals['_REMOVESECTORRESPONSE']._serialized_end=7302
+  _globals['_RESETSECTORREQUEST']._serialized_start=7304
+  _globals['_RESETSECTORREQUEST']._serialized_end=7365
+  _globals['_RESETSECTORRESPONSE']._serialized_start=7367
+  _globals['_RESETSECTORRESPONSE']._serialized_end=7441
+  _globals['_SECTOROPERATION']._serialized_start=7444
+  _globals['_SECTOROPERATION']._serialized_end=7835
+  _globals['_SECTOROPERATIONRESULT']._serialized_start=7838
+  _globals['_SECTOROPERATIONRESULT']._serialized_end=8238
+  _globals['_L2QUOTEDATA']._serialized_start=8241
+  _globals['_L2QUOTEDATA']._serialized_end=8604
+  _globals['_L2QUOTEREQUEST']._serialized_start=8606
+  _globals['_L2QUOTEREQUEST']._serialized_end=8681
+  _globals['_L2QUOTERESPONSE']._serialized_start=8684
+  _globals['_L2QUOTERESPONSE']._serialized_end=8860
+  _globals['_L2QUOTERESPONSE_DATAENTRY']._serialized_start=8790
+  _globals['_L2QUOTERESPONSE_DATAENTRY']._serialized_end=8860
+  _globals['_L2QUOTEDATALIST']._serialized_start=8862
+  _globals['_L2QUOTEDATALIST']._serialized_end=8918
+  _globals['_L2ORDERDATA']._serialized_start=8920
+  _globals['_L2ORDERDATA']._serialized_end=9047
+  _globals['_L2ORDERREQUEST']._serialized_start=9049
+  _globals['_L2ORDERREQUEST']._serialized_end=9124
+  _globals['_L2ORDERRESPONSE']._serialized_start=9127
+  _globals['_L2ORDERRESPONSE']._serialized_end=9303
+  _globals['_L2ORDERRESPONSE_DATAENTRY']._serialized_start=9233
+  _globals['_L2ORDERRESPONSE_DATAENTRY']._serialized_end=9303
+  _globals['_L2ORDERDATALIST']._serialized_start=9305
+  _globals['_L2ORDERDATALIST']._serialized_end=9361
+  _globals['_L2ORDERBATCH']._serialized_start=9363
+  _globals['_L2ORDERBATCH']._serialized_end=9436
+  _globals['_L2TRANSACTIONDATA']._serialized_start=9439
+  _globals['_L2TRANSACTIONDATA']._serialized_end=9613
+  _globals['_L2TRANSACTIONREQUEST']._serialized_start=9615
+  _globals['_L2TRANSACTIONREQUEST']._serialized_end=9696
+  _globals['_L2TRANSACTIONRESPONSE']._serialized_start=9699
+  _globals['_L2TRANSACTIONRESPONSE']._serialized_end=9893
+  _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._serialized_start=9817
+  _globals['_L2TRANSACTIONRESPONSE_DATAENTRY']._serialized_end=9893
+  _globals['_L2TRANSACTIONDATALIST']._serialized_start=9895
+  _globals['_L2TRANSACTIONDATALIST']._serialized_end=9969
+  _globals['_L2TRANSACTIONBATCH']._serialized_start=9971
+  _globals['_L2TRANSACTIONBATCH']._serialized_end=10062
+  _globals['_SUBSCRIPTIONREQUEST']._serialized_start=10064
+  _globals['_SUBSCRIPTIONREQUEST']._serialized_end=10178
+  _globals['_WHOLEQUOTEREQUEST']._serialized_start=10180
+  _globals['_WHOLEQUOTEREQUEST']._serialized_end=10216
+  _globals['_SUBSCRIPTIONRESPONSE']._serialized_start=10219
+  _globals['_SUBSCRIPTIONRESPONSE']._serialized_end=10386
+  _globals['_UNSUBSCRIBEREQUEST']._serialized_start=10388
+  _globals['_UNSUBSCRIBEREQUEST']._serialized_end=10433
+  _globals['_UNSUBSCRIBERESPONSE']._serialized_start=10435
+  _globals['_UNSUBSCRIBERESPONSE']._serialized_end=10526
+  _globals['_QUOTEUPDATE']._serialized_start=10529
+  _globals['_QUOTEUPDATE']._serialized_end=10780
+  _globals['_SUBSCRIPTIONINFOREQUEST']._serialized_start=10782
+  _globals['_SUBSCRIPTIONINFOREQUEST']._serialized_end=10832
+  _globals['_SUBSCRIPTIONINFORESPONSE']._serialized_start=10835
+  _globals['_SUBSCRIPTIONINFORESPONSE']._serialized_end=11067
+  _globals['_SUBSCRIPTIONLISTRESPONSE']._serialized_start=11069
+  _globals['_SUBSCRIPTIONLISTRESPONSE']._serialized_end=11190
+  _globals['_DATASERVICE']._serialized_start=11378
+  _globals['_DATASERVICE']._serialized_end=15138
 # @@protoc_insertion_point(module_scope)
@@ -42,6 +42,11 @@ class DataServiceStub(object):
                 request_serializer=data__pb2.MarketDataRequest.SerializeToString,
                 response_deserializer=data__pb2.MarketDataBatchResponse.FromString,
                 _registered_method=True)
+        self.StreamMarketData = channel.unary_stream(
+                '/qmt.data.DataService/StreamMarketData',
+                request_serializer=data__pb2.MarketDataRequest.SerializeToString,
+                response_deserializer=data__pb2.MarketDataResponse.FromString,
+                _registered_method=True)
         self.GetFinancialData = channel.unary_unary(
                 '/qmt.data.DataService/GetFinancialData',
                 request_serializer=data__pb2.FinancialDataRequest.SerializeToString,
@@ -84,12 +89,12 @@ class DataServiceStub(object):
                 _registered_method=True)
         self.GetConvertibleBondInfo = channel.unary_unary(
                 '/qmt.data.DataService/GetConvertibleBondInfo',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=data__pb2.ConvertibleBondInfoRequest.SerializeToString,
                 response_deserializer=data__pb2.ConvertibleBondListResponse.FromString,
                 _registered_method=True)
         self.GetIpoInfo = channel.unary_unary(
                 '/qmt.data.DataService/GetIpoInfo',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=data__pb2.IpoInfoRequest.SerializeToString,
                 response_deserializer=data__pb2.IpoInfoListResponse.FromString,
                 _registered_method=True)
         self.GetPeriodList = channel.unary_unary(
@@ -132,6 +137,11 @@ class DataServiceStub(object):
                 request_serializer=data__pb2.DownloadHistoryDataBatchRequest.SerializeToString,
                 response_deserializer=data__pb2.DownloadResponse.FromString,
                 _registered_method=True)
+        self.StreamDownloadHistoryDataBatch = channel.unary_stream(
+                '/qmt.data.DataService/StreamDownloadHistoryDataBatch',
+                request_serializer=data__pb2.DownloadHistoryDataBatchRequest.SerializeToString,
+                response_deserializer=data__pb2.DownloadResponse.FromString,
+                _registered_method=True)
         self.DownloadFinancialData = channel.unary_unary(
                 '/qmt.data.DataService/DownloadFinancialData',
                 request_serializer=data__pb2.DownloadFinancialDataRequest.SerializeToString,
@@ -202,6 +212,11 @@ class DataServiceStub(object):
                 request_serializer=data__pb2.ResetSectorRequest.SerializeToString,
                 response_deserializer=data__pb2.ResetSectorResponse.FromString,
                 _registered_method=True)
+        self.SectorStream = channel.stream_stream(
+                '/qmt.data.DataService/SectorStream',
+                request_serializer=data__pb2.SectorOperation.SerializeToString,
+                response_deserializer=data__pb2.SectorOperationResult.FromString,
+                _registered_method=True)
         self.GetL2Quote = channel.unary_unary(
                 '/qmt.data.DataService/GetL2Quote',
                 request_serializer=data__pb2.L2QuoteRequest.SerializeToString,
@@ -212,11 +227,21 @@ class DataServiceStub(object):
                 request_serializer=data__pb2.L2OrderRequest.SerializeToString,
                 response_deserializer=data__pb2.L2OrderResponse.FromString,
                 _registered_method=True)
+        self.StreamL2Order = channel.unary_stream(
+                '/qmt.data.DataService/StreamL2Order',
+                request_serializer=data__pb2.L2OrderRequest.SerializeToString,
+                response_deserializer=data__pb2.L2OrderBatch.FromString,
+                _registered_method=True)
         self.GetL2Transaction = channel.unary_unary(
                 '/qmt.data.DataService/GetL2Transaction',
                 request_serializer=data__pb2.L2TransactionRequest.SerializeToString,
                 response_deserializer=data__pb2.L2TransactionResponse.FromString,
                 _registered_method=True)
+        self.StreamL2Transaction = channel.unary_stream(
+                '/qmt.data.DataService/StreamL2Transaction',
+                request_serializer=data__pb2.L2TransactionRequest.SerializeToString,
+                response_deserializer=data__pb2.L2TransactionBatch.FromString,
+                _registered_method=True)
         self.SubscribeQuote = channel.unary_stream(
                 '/qmt.data.DataService/SubscribeQuote',
                 request_serializer=data__pb2.SubscriptionRequest.SerializeToString,
@@ -257,6 +282,13 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamMarketData(self, request, context):
+        """获取市场数据（Server Streaming，按股票逐条返回）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetFinancialData(self, request, context):
         """获取财务数据（一元调用）
         """
@@ -386,6 +418,13 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamDownloadHistoryDataBatch(self, request, context):
+        """批量下载历史数据（Server Streaming，按进度逐条推送）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DownloadFinancialData(self, request, context):
         """下载财务数据
         """
@@ -485,6 +524,13 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SectorStream(self, request_iterator, context):
+        """批量板块管理（双向流，按发送顺序逐个返回操作结果）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetL2Quote(self, request, context):
         """===== 阶段5: Level2数据接口 =====
         获取Level2快照数据
@@ -500,6 +546,13 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamL2Order(self, request, context):
+        """获取Level2逐笔委托（Server Streaming，按股票分批返回）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetL2Transaction(self, request, context):
         """获取Level2逐笔成交
         """
@@ -507,6 +560,13 @@ class DataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamL2Transaction(self, request, context):
+        """获取Level2逐笔成交（Server Streaming，按股票分批返回）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SubscribeQuote(self, request, context):
         """===== 阶段6: 行情订阅接口 =====
         订阅行情（Server Streaming）
@@ -551,6 +611,11 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=data__pb2.MarketDataRequest.FromString,
                     response_serializer=data__pb2.MarketDataBatchResponse.SerializeToString,
             ),
+            'StreamMarketData': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMarketData,
+                    request_deserializer=data__pb2.MarketDataRequest.FromString,
+                    response_serializer=data__pb2.MarketDataResponse.SerializeToString,
+            ),
             'GetFinancialData': grpc.unary_unary_rpc_method_handler(
                     servicer.GetFinancialData,
                     request_deserializer=data__pb2.FinancialDataRequest.FromString,
@@ -593,12 +658,12 @@ def add_DataServiceServicer_to_server(servicer, server):
             ),
             'GetConvertibleBondInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.GetConvertibleBondInfo,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=data__pb2.ConvertibleBondInfoRequest.FromString,
                     response_serializer=data__pb2.ConvertibleBondListResponse.SerializeToString,
             ),
             'GetIpoInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.GetIpoInfo,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=data__pb2.IpoInfoRequest.FromString,
                     response_serializer=data__pb2.IpoInfoListResponse.SerializeToString,
             ),
             'GetPeriodList': grpc.unary_unary_rpc_method_handler(
@@ -641,6 +706,11 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=data__pb2.DownloadHistoryDataBatchRequest.FromString,
                     response_serializer=data__pb2.DownloadResponse.SerializeToString,
             ),
+            'StreamDownloadHistoryDataBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamDownloadHistoryDataBatch,
+                    request_deserializer=data__pb2.DownloadHistoryDataBatchRequest.FromString,
+                    response_serializer=data__pb2.DownloadResponse.SerializeToString,
+            ),
             'DownloadFinancialData': grpc.unary_unary_rpc_method_handler(
                     servicer.DownloadFinancialData,
                     request_deserializer=data__pb2.DownloadFinancialDataRequest.FromString,
@@ -711,6 +781,11 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=data__pb2.ResetSectorRequest.FromString,
                     response_serializer=data__pb2.ResetSectorResponse.SerializeToString,
             ),
+            'SectorStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.SectorStream,
+                    request_deserializer=data__pb2.SectorOperation.FromString,
+                    response_serializer=data__pb2.SectorOperationResult.SerializeToString,
+            ),
             'GetL2Quote': grpc.unary_unary_rpc_method_handler(
                     servicer.GetL2Quote,
                     request_deserializer=data__pb2.L2QuoteRequest.FromString,
@@ -721,11 +796,21 @@ def add_DataServiceServicer_to_server(servicer, server):
                     request_deserializer=data__pb2.L2OrderRequest.FromString,
                     response_serializer=data__pb2.L2OrderResponse.SerializeToString,
             ),
+            'StreamL2Order': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamL2Order,
+                    request_deserializer=data__pb2.L2OrderRequest.FromString,
+                    response_serializer=data__pb2.L2OrderBatch.SerializeToString,
+            ),
             'GetL2Transaction': grpc.unary_unary_rpc_method_handler(
                     servicer.GetL2Transaction,
                     request_deserializer=data__pb2.L2TransactionRequest.FromString,
                     response_serializer=data__pb2.L2TransactionResponse.SerializeToString,
             ),
+            'StreamL2Transaction': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamL2Transaction,
+                    request_deserializer=data__pb2.L2TransactionRequest.FromString,
+                    response_serializer=data__pb2.L2TransactionBatch.SerializeToString,
+            ),
             'SubscribeQuote': grpc.unary_stream_rpc_method_handler(
                     servicer.SubscribeQuote,
                     request_deserializer=data__pb2.SubscriptionRequest.FromString,
@@ -791,6 +876,33 @@ class DataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamMarketData(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.data.DataService/StreamMarketData',
+            data__pb2.MarketDataRequest.SerializeToString,
+            data__pb2.MarketDataResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetFinancialData(request,
             target,
@@ -1022,7 +1134,7 @@ class DataService(object):
             request,
             target,
             '/qmt.data.DataService/GetConvertibleBondInfo',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            data__pb2.ConvertibleBondInfoRequest.SerializeToString,
             data__pb2.ConvertibleBondListResponse.FromString,
             options,
             channel_credentials,
@@ -1049,7 +1161,7 @@ class DataService(object):
             request,
             target,
             '/qmt.data.DataService/GetIpoInfo',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            data__pb2.IpoInfoRequest.SerializeToString,
             data__pb2.IpoInfoListResponse.FromString,
             options,
             channel_credentials,
@@ -1277,6 +1389,33 @@ class DataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamDownloadHistoryDataBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.data.DataService/StreamDownloadHistoryDataBatch',
+            data__pb2.DownloadHistoryDataBatchRequest.SerializeToString,
+            data__pb2.DownloadResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DownloadFinancialData(request,
             target,
@@ -1655,6 +1794,33 @@ class DataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SectorStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/qmt.data.DataService/SectorStream',
+            data__pb2.SectorOperation.SerializeToString,
+            data__pb2.SectorOperationResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetL2Quote(request,
             target,
@@ -1709,6 +1875,33 @@ class DataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamL2Order(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.data.DataService/StreamL2Order',
+            data__pb2.L2OrderRequest.SerializeToString,
+            data__pb2.L2OrderBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetL2Transaction(request,
             target,
@@ -1736,6 +1929,33 @@ class DataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamL2Transaction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.data.DataService/StreamL2Transaction',
+            data__pb2.L2TransactionRequest.SerializeToString,
+            data__pb2.L2TransactionBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SubscribeQuote(request,
             target,
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from generated import common_pb2 as common__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rtrading.proto\x12\x0bqmt.trading\x1a\x0c\x63ommon.proto\"I\n\x0e\x43onnectRequest\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\x05\"\xe6\x01\n\x0b\x41\x63\x63ountInfo\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12.\n\x0c\x61\x63\x63ount_type\x18\x02 \x01(\x0e\x32\x18.qmt.trading.AccountType\x12\x14\n\x0c\x61\x63\x63ount_name\x18\x03 \x01(\t\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x05 \x01(\x01\x12\x19\n\x11\x61vailable_balance\x18\x06 \x01(\x01\x12\x16\n\x0e\x66rozen_balance\x18\x07 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x08 \x01(\x01\x12\x13\n\x0btotal_asset\x18\t \x01(\x01\"\x9b\x01\n\x0f\x43onnectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12.\n\x0c\x61\x63\x63ount_info\x18\x04 \x01(\x0b\x32\x18.qmt.trading.AccountInfo\x12\"\n\x06status\x18\x05 \x01(\x0b\x32\x12.qmt.common.Status\"\'\n\x11\x44isconnectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"Z\n\x12\x44isconnectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"%\n\x0fPositionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xe7\x01\n\x0cPositionInfo\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x12\n\nstock_name\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x03\x12\x18\n\x10\x61vailable_volume\x18\x04 \x01(\x03\x12\x15\n\rfrozen_volume\x18\x05 \x01(\x03\x12\x12\n\ncost_price\x18\x06 \x01(\x01\x12\x14\n\x0cmarket_price\x18\x07 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x08 \x01(\x01\x12\x13\n\x0bprofit_loss\x18\t \x01(\x01\x12\x19\n\x11profit_loss_ratio\x18\n \x01(\x01\"h\n\x14PositionListResponse\x12,\n\tpositions\x18\x01 \x03(\x0b\x32\x19.qmt.trading.PositionInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\xbe\x01\n\x0cOrderRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstock_code\x18\x02 \x01(\t\x12$\n\x04side\x18\x03 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12*\n\norder_type\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderType\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12\x15\n\rstrategy_name\x18\x07 \x01(\t\"\xa9\x02\n\tOrderInfo\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x12\n\nstock_code\x18\x02 \x01(\t\x12$\n\x04side\x18\x03 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12*\n\norder_type\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderType\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12(\n\x06status\x18\x07 \x01(\x0e\x32\x18.qmt.trading.OrderStatus\x12\x16\n\x0esubmitted_time\x18\x08 \x01(\t\x12\x15\n\rfilled_volume\x18\t \x01(\x03\x12\x15\n\rfilled_amount\x18\n \x01(\x01\x12\x15\n\raverage_price\x18\x0b \x01(\x01\"Z\n\rOrderResponse\x12%\n\x05order\x18\x01 \x01(\x0b\x32\x16.qmt.trading.OrderInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\":\n\x12\x43\x61ncelOrderRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\"[\n\x13\x43\x61ncelOrderResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"L\n\x10OrderListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\"_\n\x11OrderListResponse\x12&\n\x06orders\x18\x01 \x03(\x0b\x32\x16.qmt.trading.OrderInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"&\n\x10TradeListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xc0\x01\n\tTradeInfo\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x12\n\nstock_code\x18\x03 \x01(\t\x12$\n\x04side\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\x12\x12\n\ntrade_time\x18\x08 \x01(\t\x12\x12\n\ncommission\x18\t \x01(\x01\"_\n\x11TradeListResponse\x12&\n\x06trades\x18\x01 \x03(\x0b\x32\x16.qmt.trading.TradeInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\"\n\x0c\x41ssetRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xa1\x01\n\tAssetInfo\x12\x13\n\x0btotal_asset\x18\x01 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x02 \x01(\x01\x12\x0c\n\x04\x63\x61sh\x18\x03 \x01(\x01\x12\x13\n\x0b\x66rozen_cash\x18\x04 \x01(\x01\x12\x16\n\x0e\x61vailable_cash\x18\x05 \x01(\x01\x12\x13\n\x0bprofit_loss\x18\x06 \x01(\x01\x12\x19\n\x11profit_loss_ratio\x18\x07 \x01(\x01\"Z\n\rAssetResponse\x12%\n\x05\x61sset\x18\x01 \x01(\x0b\x32\x16.qmt.trading.AssetInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"%\n\x0fRiskInfoRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\x98\x01\n\x10RiskInfoResponse\x12\x16\n\x0eposition_ratio\x18\x01 \x01(\x01\x12\x12\n\ncash_ratio\x18\x02 \x01(\x01\x12\x14\n\x0cmax_drawdown\x18\x03 \x01(\x01\x12\x0e\n\x06var_95\x18\x04 \x01(\x01\x12\x0e\n\x06var_99\x18\x05 \x01(\x01\x12\"\n\x06status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\")\n\x13StrategyListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xee\x01\n\x0cStrategyInfo\x12\x15\n\rstrategy_name\x18\x01 \x01(\t\x12\x15\n\rstrategy_type\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x14\n\x0c\x63reated_time\x18\x04 \x01(\t\x12\x18\n\x10last_update_time\x18\x05 \x01(\t\x12=\n\nparameters\x18\x06 \x03(\x0b\x32).qmt.trading.StrategyInfo.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"i\n\x14StrategyListResponse\x12-\n\nstrategies\x18\x01 \x03(\x0b\x32\x19.qmt.trading.StrategyInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status*\xb7\x01\n\x0b\x41\x63\x63ountType\x12\x1c\n\x18\x41\x43\x43OUNT_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x41\x43\x43OUNT_TYPE_FUTURE\x10\x01\x12\x19\n\x15\x41\x43\x43OUNT_TYPE_SECURITY\x10\x02\x12\x17\n\x13\x41\x43\x43OUNT_TYPE_CREDIT\x10\x03\x12\x1e\n\x1a\x41\x43\x43OUNT_TYPE_FUTURE_OPTION\x10\x04\x12\x1d\n\x19\x41\x43\x43OUNT_TYPE_STOCK_OPTION\x10\x05*P\n\tOrderSide\x12\x1a\n\x16ORDER_SIDE_UNSPECIFIED\x10\x00\x12\x12\n\x0eORDER_SIDE_BUY\x10\x01\x12\x13\n\x0fORDER_SIDE_SELL\x10\x02*\x84\x01\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11ORDER_TYPE_MARKET\x10\x01\x12\x14\n\x10ORDER_TYPE_LIMIT\x10\x02\x12\x13\n\x0fORDER_TYPE_STOP\x10\x03\x12\x19\n\x15ORDER_TYPE_STOP_LIMIT\x10\x04*\xd2\x01\n\x0bOrderStatus\x12\x1c\n\x18ORDER_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14ORDER_STATUS_PENDING\x10\x01\x12\x1a\n\x16ORDER_STATUS_SUBMITTED\x10\x02\x12\x1f\n\x1bORDER_STATUS_PARTIAL_FILLED\x10\x03\x12\x17\n\x13ORDER_STATUS_FILLED\x10\x04\x12\x1a\n\x16ORDER_STATUS_CANCELLED\x10\x05\x12\x19\n\x15ORDER_STATUS_REJECTED\x10\x06\x32\xdb\x06\n\x0eTradingService\x12\x44\n\x07\x43onnect\x12\x1b.qmt.trading.ConnectRequest\x1a\x1c.qmt.trading.ConnectResponse\x12M\n\nDisconnect\x12\x1e.qmt.trading.DisconnectRequest\x1a\x1f.qmt.trading.DisconnectResponse\x12N\n\x0eGetAccountInfo\x12\x1e.qmt.trading.DisconnectRequest\x1a\x1c.qmt.trading.ConnectResponse\x12O\n\x0cGetPositions\x12\x1c.qmt.trading.PositionRequest\x1a!.qmt.trading.PositionListResponse\x12\x44\n\x0bSubmitOrder\x12\x19.qmt.trading.OrderRequest\x1a\x1a.qmt.trading.OrderResponse\x12P\n\x0b\x43\x61ncelOrder\x12\x1f.qmt.trading.CancelOrderRequest\x1a .qmt.trading.CancelOrderResponse\x12J\n\tGetOrders\x12\x1d.qmt.trading.OrderListRequest\x1a\x1e.qmt.trading.OrderListResponse\x12J\n\tGetTrades\x12\x1d.qmt.trading.TradeListRequest\x1a\x1e.qmt.trading.TradeListResponse\x12\x41\n\x08GetAsset\x12\x19.qmt.trading.AssetRequest\x1a\x1a.qmt.trading.AssetResponse\x12J\n\x0bGetRiskInfo\x12\x1c.qmt.trading.RiskInfoRequest\x1a\x1d.qmt.trading.RiskInfoResponse\x12T\n\rGetStrategies\x12 .qmt.trading.StrategyListRequest\x1a!.qmt.trading.StrategyListResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rtrading.proto\x12\x0bqmt.trading\x1a\x0c\x63ommon.proto\"I\n\x0e\x43onnectRequest\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x11\n\tclient_id\x18\x03 \x01(\x05\"\xe6\x01\n\x0b\x41\x63\x63ountInfo\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12.\n\x0c\x61\x63\x63ount_type\x18\x02 \x01(\x0e\x32\x18.qmt.trading.AccountType\x12\x14\n\x0c\x61\x63\x63ount_name\x18\x03 \x01(\t\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x05 \x01(\x01\x12\x19\n\x11\x61vailable_balance\x18\x06 \x01(\x01\x12\x16\n\x0e\x66rozen_balance\x18\x07 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x08 \x01(\x01\x12\x13\n\x0btotal_asset\x18\t \x01(\x01\"\x9b\x01\n\x0f\x43onnectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12.\n\x0c\x61\x63\x63ount_info\x18\x04 \x01(\x0b\x32\x18.qmt.trading.AccountInfo\x12\"\n\x06status\x18\x05 \x01(\x0b\x32\x12.qmt.common.Status\"\'\n\x11\x44isconnectRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"Z\n\x12\x44isconnectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"%\n\x0fPositionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xe7\x01\n\x0cPositionInfo\x12\x12\n\nstock_code\x18\x01 \x01(\t\x12\x12\n\nstock_name\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x03\x12\x18\n\x10\x61vailable_volume\x18\x04 \x01(\x03\x12\x15\n\rfrozen_volume\x18\x05 \x01(\x03\x12\x12\n\ncost_price\x18\x06 \x01(\x01\x12\x14\n\x0cmarket_price\x18\x07 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x08 \x01(\x01\x12\x13\n\x0bprofit_loss\x18\t \x01(\x01\x12\x19\n\x11profit_loss_ratio\x18\n \x01(\x01\"h\n\x14PositionListResponse\x12,\n\tpositions\x18\x01 \x03(\x0b\x32\x19.qmt.trading.PositionInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\xbe\x01\n\x0cOrderRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstock_code\x18\x02 \x01(\t\x12$\n\x04side\x18\x03 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12*\n\norder_type\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderType\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12\x15\n\rstrategy_name\x18\x07 \x01(\t\"\xa9\x02\n\tOrderInfo\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x12\n\nstock_code\x18\x02 \x01(\t\x12$\n\x04side\x18\x03 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12*\n\norder_type\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderType\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12(\n\x06status\x18\x07 \x01(\x0e\x32\x18.qmt.trading.OrderStatus\x12\x16\n\x0esubmitted_time\x18\x08 \x01(\t\x12\x15\n\rfilled_volume\x18\t \x01(\x03\x12\x15\n\rfilled_amount\x18\n \x01(\x01\x12\x15\n\raverage_price\x18\x0b \x01(\x01\"Z\n\rOrderResponse\x12%\n\x05order\x18\x01 \x01(\x0b\x32\x16.qmt.trading.OrderInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\":\n\x12\x43\x61ncelOrderRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\"[\n\x13\x43\x61ncelOrderResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06status\x18\x03 \x01(\x0b\x32\x12.qmt.common.Status\"L\n\x10OrderListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\"_\n\x11OrderListResponse\x12&\n\x06orders\x18\x01 \x03(\x0b\x32\x16.qmt.trading.OrderInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"&\n\x10TradeListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xc0\x01\n\tTradeInfo\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x12\n\nstock_code\x18\x03 \x01(\t\x12$\n\x04side\x18\x04 \x01(\x0e\x32\x16.qmt.trading.OrderSide\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\r\n\x05price\x18\x06 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x01\x12\x12\n\ntrade_time\x18\x08 \x01(\t\x12\x12\n\ncommission\x18\t \x01(\x01\"_\n\x11TradeListResponse\x12&\n\x06trades\x18\x01 \x03(\x0b\x32\x16.qmt.trading.TradeInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"\"\n\x0c\x41ssetRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xa1\x01\n\tAssetInfo\x12\x13\n\x0btotal_asset\x18\x01 \x01(\x01\x12\x14\n\x0cmarket_value\x18\x02 \x01(\x01\x12\x0c\n\x04\x63\x61sh\x18\x03 \x01(\x01\x12\x13\n\x0b\x66rozen_cash\x18\x04 \x01(\x01\x12\x16\n\x0e\x61vailable_cash\x18\x05 \x01(\x01\x12\x13\n\x0bprofit_loss\x18\x06 \x01(\x01\x12\x19\n\x11profit_loss_ratio\x18\x07 \x01(\x01\"Z\n\rAssetResponse\x12%\n\x05\x61sset\x18\x01 \x01(\x0b\x32\x16.qmt.trading.AssetInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status\"%\n\x0fRiskInfoRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\x98\x01\n\x10RiskInfoResponse\x12\x16\n\x0eposition_ratio\x18\x01 \x01(\x01\x12\x12\n\ncash_ratio\x18\x02 \x01(\x01\x12\x14\n\x0cmax_drawdown\x18\x03 \x01(\x01\x12\x0e\n\x06var_95\x18\x04 \x01(\x01\x12\x0e\n\x06var_99\x18\x05 \x01(\x01\x12\"\n\x06status\x18\x06 \x01(\x0b\x32\x12.qmt.common.Status\")\n\x13StrategyListRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\xee\x01\n\x0cStrategyInfo\x12\x15\n\rstrategy_name\x18\x01 \x01(\t\x12\x15\n\rstrategy_type\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x14\n\x0c\x63reated_time\x18\x04 \x01(\t\x12\x18\n\x10last_update_time\x18\x05 \x01(\t\x12=\n\nparameters\x18\x06 \x03(\x0b\x32).qmt.trading.StrategyInfo.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"i\n\x14StrategyListResponse\x12-\n\nstrategies\x18\x01 \x03(\x0b\x32\x19.qmt.trading.StrategyInfo\x12\"\n\x06status\x18\x02 \x01(\x0b\x32\x12.qmt.common.Status*\xb7\x01\n\x0b\x41\x63\x63ountType\x12\x1c\n\x18\x41\x43\x43OUNT_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x41\x43\x43OUNT_TYPE_FUTURE\x10\x01\x12\x19\n\x15\x41\x43\x43OUNT_TYPE_SECURITY\x10\x02\x12\x17\n\x13\x41\x43\x43OUNT_TYPE_CREDIT\x10\x03\x12\x1e\n\x1a\x41\x43\x43OUNT_TYPE_FUTURE_OPTION\x10\x04\x12\x1d\n\x19\x41\x43\x43OUNT_TYPE_STOCK_OPTION\x10\x05*P\n\tOrderSide\x12\x1a\n\x16ORDER_SIDE_UNSPECIFIED\x10\x00\x12\x12\n\x0eORDER_SIDE_BUY\x10\x01\x12\x13\n\x0fORDER_SIDE_SELL\x10\x02*\x84\x01\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11ORDER_TYPE_MARKET\x10\x01\x12\x14\n\x10ORDER_TYPE_LIMIT\x10\x02\x12\x13\n\x0fORDER_TYPE_STOP\x10\x03\x12\x19\n\x15ORDER_TYPE_STOP_LIMIT\x10\x04*\xd2\x01\n\x0bOrderStatus\x12\x1c\n\x18ORDER_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14ORDER_STATUS_PENDING\x10\x01\x12\x1a\n\x16ORDER_STATUS_SUBMITTED\x10\x02\x12\x1f\n\x1bORDER_STATUS_PARTIAL_FILLED\x10\x03\x12\x17\n\x13ORDER_STATUS_FILLED\x10\x04\x12\x1a\n\x16ORDER_STATUS_CANCELLED\x10\x05\x12\x19\n\x15ORDER_STATUS_REJECTED\x10\x06\x32\xae\t\n\x0eTradingService\x12\x44\n\x07\x43onnect\x12\x1b.qmt.trading.ConnectRequest\x1a\x1c.qmt.trading.ConnectResponse\x12M\n\nDisconnect\x12\x1e.qmt.trading.DisconnectRequest\x1a\x1f.qmt.trading.DisconnectResponse\x12N\n\x0eGetAccountInfo\x12\x1e.qmt.trading.DisconnectRequest\x1a\x1c.qmt.trading.ConnectResponse\x12O\n\x0cGetPositions\x12\x1c.qmt.trading.PositionRequest\x1a!.qmt.trading.PositionListResponse\x12\x44\n\x0bSubmitOrder\x12\x19.qmt.trading.OrderRequest\x1a\x1a.qmt.trading.OrderResponse\x12P\n\x0b\x43\x61ncelOrder\x12\x1f.qmt.trading.CancelOrderRequest\x1a .qmt.trading.CancelOrderResponse\x12J\n\tGetOrders\x12\x1d.qmt.trading.OrderListRequest\x1a\x1e.qmt.trading.OrderListResponse\x12J\n\tGetTrades\x12\x1d.qmt.trading.TradeListRequest\x1a\x1e.qmt.trading.TradeListResponse\x12\x41\n\x08GetAsset\x12\x19.qmt.trading.AssetRequest\x1a\x1a.qmt.trading.AssetResponse\x12J\n\x0bGetRiskInfo\x12\x1c.qmt.trading.RiskInfoRequest\x1a\x1d.qmt.trading.RiskInfoResponse\x12T\n\rGetStrategies\x12 .qmt.trading.StrategyListRequest\x1a!.qmt.trading.StrategyListResponse\x12T\n\x0fStreamPositions\x12\x1c.qmt.trading.PositionRequest\x1a!.qmt.trading.PositionListResponse0\x01\x12O\n\x0cStreamOrders\x12\x1d.qmt.trading.OrderListRequest\x1a\x1e.qmt.trading.OrderListResponse0\x01\x12O\n\x0cStreamTrades\x12\x1d.qmt.trading.TradeListRequest\x1a\x1e.qmt.trading.TradeListResponse0\x01\x12Y\n\x10StreamStrategies\x12 .qmt.trading.StrategyListRequest\x1a!.qmt.trading.StrategyListResponse0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -97,5 +97,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_STRATEGYLISTRESPONSE']._serialized_start=3037
   _globals['_STRATEGYLISTRESPONSE']._serialized_end=3142
   _globals['_TRADINGSERVICE']._serialized_start=3761
-  _globals['_TRADINGSERVICE']._serialized_end=4620
+  _globals['_TRADINGSERVICE']._serialized_end=4959
 # @@protoc_insertion_point(module_scope)
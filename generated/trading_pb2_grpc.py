@@ -91,6 +91,26 @@ class TradingServiceStub(object):
                 request_serializer=trading__pb2.StrategyListRequest.SerializeToString,
                 response_deserializer=trading__pb2.StrategyListResponse.FromString,
                 _registered_method=True)
+        self.StreamPositions = channel.unary_stream(
+                '/qmt.trading.TradingService/StreamPositions',
+                request_serializer=trading__pb2.PositionRequest.SerializeToString,
+                response_deserializer=trading__pb2.PositionListResponse.FromString,
+                _registered_method=True)
+        self.StreamOrders = channel.unary_stream(
+                '/qmt.trading.TradingService/StreamOrders',
+                request_serializer=trading__pb2.OrderListRequest.SerializeToString,
+                response_deserializer=trading__pb2.OrderListResponse.FromString,
+                _registered_method=True)
+        self.StreamTrades = channel.unary_stream(
+                '/qmt.trading.TradingService/StreamTrades',
+                request_serializer=trading__pb2.TradeListRequest.SerializeToString,
+                response_deserializer=trading__pb2.TradeListResponse.FromString,
+                _registered_method=True)
+        self.StreamStrategies = channel.unary_stream(
+                '/qmt.trading.TradingService/StreamStrategies',
+                request_serializer=trading__pb2.StrategyListRequest.SerializeToString,
+                response_deserializer=trading__pb2.StrategyListResponse.FromString,
+                _registered_method=True)
 
 
 class TradingServiceServicer(object):
@@ -175,6 +195,35 @@ class TradingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamPositions(self, request, context):
+        """===== 流式列表查询：复用列表响应作为批次，每批最多 256 条 =====
+        获取持仓列表（Server Streaming）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOrders(self, request, context):
+        """获取订单列表（Server Streaming）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamTrades(self, request, context):
+        """获取成交记录（Server Streaming）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamStrategies(self, request, context):
+        """获取策略列表（Server Streaming）
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TradingServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -233,6 +282,26 @@ def add_TradingServiceServicer_to_server(servicer, server):
                     request_deserializer=trading__pb2.StrategyListRequest.FromString,
                     response_serializer=trading__pb2.StrategyListResponse.SerializeToString,
             ),
+            'StreamPositions': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamPositions,
+                    request_deserializer=trading__pb2.PositionRequest.FromString,
+                    response_serializer=trading__pb2.PositionListResponse.SerializeToString,
+            ),
+            'StreamOrders': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamOrders,
+                    request_deserializer=trading__pb2.OrderListRequest.FromString,
+                    response_serializer=trading__pb2.OrderListResponse.SerializeToString,
+            ),
+            'StreamTrades': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamTrades,
+                    request_deserializer=trading__pb2.TradeListRequest.FromString,
+                    response_serializer=trading__pb2.TradeListResponse.SerializeToString,
+            ),
+            'StreamStrategies': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamStrategies,
+                    request_deserializer=trading__pb2.StrategyListRequest.FromString,
+                    response_serializer=trading__pb2.StrategyListResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'qmt.trading.TradingService', rpc_method_handlers)
@@ -542,3 +611,111 @@ class TradingService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamPositions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.trading.TradingService/StreamPositions',
+            trading__pb2.PositionRequest.SerializeToString,
+            trading__pb2.PositionListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.trading.TradingService/StreamOrders',
+            trading__pb2.OrderListRequest.SerializeToString,
+            trading__pb2.OrderListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamTrades(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.trading.TradingService/StreamTrades',
+            trading__pb2.TradeListRequest.SerializeToString,
+            trading__pb2.TradeListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamStrategies(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qmt.trading.TradingService/StreamStrategies',
+            trading__pb2.StrategyListRequest.SerializeToString,
+            trading__pb2.StrategyListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -605,9 +605,8 @@ class TestNewDataGrpcApis:
     def test_get_convertible_bond_info(self, data_stub):
         """测试获取可转债信息"""
         from generated import data_pb2
-        from google.protobuf import empty_pb2
         
-        request = empty_pb2.Empty()
+        request = data_pb2.ConvertibleBondInfoRequest()
         response = data_stub.GetConvertibleBondInfo(request)
         
         print("\n" + "="*80)
@@ -627,9 +626,8 @@ class TestNewDataGrpcApis:
     def test_get_ipo_info_grpc(self, data_stub):
         """测试获取新股申购信息"""
         from generated import data_pb2
-        from google.protobuf import empty_pb2
         
-        request = empty_pb2.Empty()
+        request = data_pb2.IpoInfoRequest()
         response = data_stub.GetIpoInfo(request)
         
         print("\n" + "="*80)
@@ -714,6 +712,39 @@ class TestNewDataGrpcApis:
         
         print("="*80)
     
+    def test_get_local_data_columnar(self, data_stub):
+        """测试以列式格式获取本地行情数据"""
+        from generated import data_pb2
+        from datetime import datetime, timedelta
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=10)
+        
+        request = data_pb2.LocalDataRequest(
+            stock_codes=['000001.SZ'],
+            start_time=start_date.strftime("%Y%m%d"),
+            end_time=end_date.strftime("%Y%m%d"),
+            period='1d',
+            columnar=True
+        )
+        response = data_stub.GetLocalData(request)
+        
+        print("\n" + "="*80)
+        print("📊 [gRPC] 本地行情数据（列式）测试:")
+        print("="*80)
+        print(f"状态码: {response.status.code}")
+        
+        if response.status.code == 0:
+            assert len(response.data) == 0
+            for stock_code, columns in response.columnar_data.items():
+                # 各列长度一致
+                assert len(columns.open) == len(columns.time)
+                assert len(columns.volume) == len(columns.time)
+                print(f"股票代码: {stock_code}")
+                print(f"K线数量: {len(columns.time)}")
+        
+        print("="*80)
+    
     def test_get_full_tick(self, data_stub):
         """测试获取完整tick数据"""
         from generated import data_pb2
@@ -785,6 +816,31 @@ class TestNewDataGrpcApis:
         
         print("="*80)
     
+    def test_stream_market_data(self, data_stub):
+        """测试流式获取市场数据"""
+        from generated import common_pb2, data_pb2
+        
+        stock_codes = ['000001.SZ', '600000.SH']
+        request = data_pb2.MarketDataRequest(
+            stock_codes=stock_codes,
+            start_date='20240101',
+            end_date='20240131',
+            period=common_pb2.PERIOD_TYPE_1D
+        )
+        responses = list(data_stub.StreamMarketData(request))
+        
+        print("\n" + "="*80)
+        print("📈 [gRPC] 流式市场数据测试:")
+        print("="*80)
+        print(f"返回消息数: {len(responses)}")
+        
+        assert [r.stock_code for r in responses] == stock_codes
+        for response in responses:
+            assert response.status.code == 0
+            print(f"股票代码: {response.stock_code}, K线数量: {len(response.bars)}")
+        
+        print("="*80)
+    
     # ===== 阶段3: 数据下载接口测试 =====
     
     def test_download_history_data(self, data_stub):
@@ -836,6 +892,35 @@ class TestNewDataGrpcApis:
         
         print("="*80)
     
+    def test_stream_download_history_data_batch(self, data_stub):
+        """测试流式批量下载历史数据（推送进度）"""
+        from generated import data_pb2
+        
+        request = data_pb2.DownloadHistoryDataBatchRequest(
+            stock_list=['000001.SZ', '000002.SZ'],
+            period='1d',
+            start_time='',
+            end_time=''
+        )
+        responses = list(data_stub.StreamDownloadHistoryDataBatch(request))
+        
+        print("\n" + "="*80)
+        print("⬇️  [gRPC] 流式批量下载历史数据测试:")
+        print("="*80)
+        print(f"返回消息数: {len(responses)}")
+        
+        # 至少包含最终结果
+        assert len(responses) >= 1
+        for response in responses:
+            assert response.rpc_status.code == 0
+            print(f"进度: {response.progress:.1f}% ({response.finished}/{response.total}) {response.current_stock}")
+        
+        final = responses[-1]
+        assert final.status != data_pb2.DOWNLOAD_RUNNING
+        print(f"任务ID: {final.task_id}")
+        
+        print("="*80)
+    
     def test_download_financial_data(self, data_stub):
         """测试下载财务数据"""
         from generated import data_pb2
@@ -981,6 +1066,37 @@ class TestNewDataGrpcApis:
         
         print("="*80)
     
+    def test_sector_stream(self, data_stub):
+        """测试批量板块管理（双向流）"""
+        from generated import data_pb2
+        
+        operations = [
+            data_pb2.SectorOperation(create_sector=data_pb2.CreateSectorRequest(
+                parent_node='', sector_name='测试板块_grpc_stream', overwrite=True
+            )),
+            data_pb2.SectorOperation(add_sector=data_pb2.AddSectorRequest(
+                sector_name='测试板块_grpc_stream', stock_list=['000001.SZ', '600000.SH']
+            )),
+            data_pb2.SectorOperation(remove_sector=data_pb2.RemoveSectorRequest(
+                sector_name='测试板块_grpc_stream'
+            )),
+        ]
+        results = list(data_stub.SectorStream(iter(operations)))
+        
+        print("\n" + "="*80)
+        print("📦 [gRPC] 批量板块管理测试:")
+        print("="*80)
+        print(f"返回结果数: {len(results)}")
+        
+        # 结果与操作一一对应
+        assert len(results) == len(operations)
+        for operation, result in zip(operations, results):
+            kind = result.WhichOneof('result')
+            assert kind == operation.WhichOneof('operation')
+            print(f"操作: {kind}, 状态码: {getattr(result, kind).status.code}")
+        
+        print("="*80)
+    
     # ===== 阶段5: Level2数据接口测试 =====
     
     def test_get_l2_quote(self, data_stub):
@@ -1033,6 +1149,26 @@ class TestNewDataGrpcApis:
         
         print("="*80)
     
+    def test_stream_l2_order(self, data_stub):
+        """测试流式获取Level2逐笔委托"""
+        from generated import data_pb2
+        
+        stock_codes = ['000001.SZ', '600000.SH']
+        request = data_pb2.L2OrderRequest(stock_codes=stock_codes)
+        batches = list(data_stub.StreamL2Order(request))
+        
+        print("\n" + "="*80)
+        print("📝 [gRPC] 流式Level2逐笔委托测试:")
+        print("="*80)
+        print(f"返回批次数: {len(batches)}")
+        
+        # 同一股票的批次连续推送；无 Level2 权限时真实环境可能没有数据
+        assert {b.stock_code for b in batches} <= set(stock_codes)
+        for batch in batches:
+            print(f"股票代码: {batch.stock_code}, 委托数量: {len(batch.orders)}")
+        
+        print("="*80)
+    
     def test_get_l2_transaction(self, data_stub):
         """测试获取Level2逐笔成交"""
         from generated import data_pb2
@@ -3,7 +3,7 @@ gRPC订阅服务测试
 """
 import pytest
 import grpc
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import asyncio
 
 from generated import data_pb2, data_pb2_grpc
@@ -66,7 +66,8 @@ class TestSubscriptionGrpc:
         
         assert count >= 3
     
-    def test_unsubscribe_quote(self, grpc_service, grpc_context):
+    @pytest.mark.asyncio
+    async def test_unsubscribe_quote(self, grpc_service, grpc_context):
         """测试取消订阅"""
         # 先创建订阅
         subscribe_request = data_pb2.SubscriptionRequest(
@@ -97,12 +98,13 @@ class TestSubscriptionGrpc:
                 subscription_id=subscription_id
             )
             
-            response = grpc_service.UnsubscribeQuote(unsubscribe_request, grpc_context)
+            response = await grpc_service.UnsubscribeQuote(unsubscribe_request, grpc_context)
             
             assert response.success is True
             assert "取消" in response.message
     
-    def test_get_subscription_info(self, grpc_service, grpc_context):
+    @pytest.mark.asyncio
+    async def test_get_subscription_info(self, grpc_service, grpc_context):
         """测试获取订阅信息"""
         from app.dependencies import get_subscription_manager
         
@@ -120,7 +122,7 @@ class TestSubscriptionGrpc:
             subscription_id=subscription_id
         )
         
-        response = grpc_service.GetSubscriptionInfo(request, grpc_context)
+        response = await grpc_service.GetSubscriptionInfo(request, grpc_context)
         
         assert response.subscription_id == subscription_id
         assert len(response.symbols) > 0
@@ -130,18 +132,26 @@ class TestSubscriptionGrpc:
         # 清理
         manager.unsubscribe(subscription_id)
     
-    def test_get_nonexistent_subscription_info(self, grpc_service, grpc_context):
+    @pytest.mark.asyncio
+    async def test_get_nonexistent_subscription_info(self, grpc_service, grpc_context):
         """测试获取不存在的订阅信息"""
         request = data_pb2.SubscriptionInfoRequest(
             subscription_id="nonexistent_id"
         )
         
-        response = grpc_service.GetSubscriptionInfo(request, grpc_context)
+        # grpc.aio 的 abort 是协程，并抛出 AbortError 结束调用
+        grpc_context.abort = AsyncMock(side_effect=grpc.aio.AbortError())
         
-        # 应该设置NOT_FOUND状态码
-        grpc_context.set_code.assert_called_with(grpc.StatusCode.NOT_FOUND)
+        with pytest.raises(grpc.aio.AbortError):
+            await grpc_service.GetSubscriptionInfo(request, grpc_context)
+        
+        # 应该以 NOT_FOUND 状态码结束调用
+        grpc_context.abort.assert_awaited_once_with(
+            grpc.StatusCode.NOT_FOUND, "订阅不存在: nonexistent_id"
+        )
     
-    def test_list_subscriptions(self, grpc_service, grpc_context):
+    @pytest.mark.asyncio
+    async def test_list_subscriptions(self, grpc_service, grpc_context):
         """测试列出所有订阅"""
         from app.dependencies import get_subscription_manager
         from google.protobuf import empty_pb2
@@ -160,7 +170,7 @@ class TestSubscriptionGrpc:
         
         # 列出所有订阅
         request = empty_pb2.Empty()
-        response = grpc_service.ListSubscriptions(request, grpc_context)
+        response = await grpc_service.ListSubscriptions(request, grpc_context)
         
         assert len(response.subscriptions) >= 2
         
@@ -333,6 +333,42 @@ class TestTradingGrpcService:
             #         ]
             pass
 
+        @pytest.mark.asyncio
+        async def test_stream_orders(self):
+            """测试流式查询订单（按批推送，拼接结果与 GetOrders 一致）"""
+            from unittest.mock import Mock
+
+            from app.grpc_services.trading_grpc_service import TradingGrpcService
+            from app.models.trading_models import OrderResponse
+            from generated import trading_pb2
+
+            # 600 条订单：两批满批 + 一批不足 256 条
+            orders = [
+                OrderResponse(
+                    order_id=f"order_{i}",
+                    stock_code="000001.SZ",
+                    side="BUY",
+                    order_type="LIMIT",
+                    volume=100,
+                    price=10.0,
+                    status="SUBMITTED",
+                    submitted_time=datetime(2024, 1, 2, 9, 30, 0)
+                )
+                for i in range(600)
+            ]
+            trading_service = Mock()
+            trading_service.get_orders.return_value = orders
+            service = TradingGrpcService(trading_service)
+            context = Mock(spec=grpc.ServicerContext)
+            request = trading_pb2.OrderListRequest(session_id="test_session_id")
+
+            batches = [batch async for batch in service.StreamOrders(request, context)]
+            unary_response = await service.GetOrders(request, context)
+
+            assert [len(batch.orders) for batch in batches] == [256, 256, 88]
+            streamed = [order for batch in batches for order in batch.orders]
+            assert streamed == list(unary_response.orders)
+
     # ==================== 批量操作测试 ====================
 
     class TestBatchOperations:
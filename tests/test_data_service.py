@@ -0,0 +1,44 @@
+"""
+数据服务层测试
+"""
+import pytest
+
+from app.config import get_settings
+from app.services.data_service import DataService
+
+pd = pytest.importorskip("pandas")
+
+
+@pytest.fixture
+def data_service():
+    """创建数据服务实例"""
+    return DataService(get_settings())
+
+
+class TestDataFrameToList:
+    """DataFrame 转换测试"""
+
+    def test_nan_in_int_fields_keeps_rows(self, data_service):
+        """测试整数字段含 NaN 时保留所有行并补 0"""
+        df = pd.DataFrame(
+            {
+                'open': [10.0, float('nan')],
+                'close': [10.5, 10.8],
+                'volume': [1000.0, float('nan')],
+                'openInterest': [float('nan'), float('nan')],
+                'suspendFlag': [0.0, 1.0],
+            },
+            index=pd.Index(['20240101', '20240102'], name='time')
+        )
+
+        records = data_service._dataframe_to_list(df, None)
+
+        assert len(records) == 2
+        assert records[0]['time'] == '20240101'
+        assert records[0]['volume'] == 1000
+        assert records[1]['volume'] == 0
+        assert records[1]['openInterest'] == 0
+        assert records[1]['suspendFlag'] == 1
+        assert all(isinstance(record['volume'], int) for record in records)
+        # 浮点字段的 NaN 原样保留
+        assert records[1]['open'] != records[1]['open']